@@ -10,6 +10,7 @@ def get_v1_router() -> APIRouter:
     from .misc import get_misc_router
     from .products import get_products_router
     from .carts import get_carts_router
+    from .media import get_media_router
     
     
     router = APIRouter(prefix='/v1')
@@ -21,6 +22,7 @@ def get_v1_router() -> APIRouter:
     router.include_router(get_products_router())
     router.include_router(get_organizations_router())
     router.include_router(get_misc_router())
+    router.include_router(get_media_router())
     router.include_router(get_admins_router())
     
     
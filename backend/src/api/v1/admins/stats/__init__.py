@@ -3,9 +3,11 @@ from fastapi import APIRouter
 
 def get_stats_router() -> APIRouter:
     from .users import router as users_router
+    from .hashing import router as hashing_router
     
     router = APIRouter(prefix='/stats')
 
     router.include_router(users_router)
+    router.include_router(hashing_router)
     
     return router
@@ -0,0 +1,20 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends
+
+from domain.auth import Principal
+from domain.statistics import HashingMetrics
+from core.crypto import hashing_metrics
+from core.security import auth_admin
+
+router = APIRouter()
+
+
+@router.get(
+    path='/hashing',
+    response_model=HashingMetrics,
+    summary='Password hashing pool metrics of this worker',
+)
+async def hashing(
+    _: Annotated[Principal, Depends(auth_admin)],
+):
+    return hashing_metrics()
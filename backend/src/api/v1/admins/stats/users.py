@@ -1,7 +1,7 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
-from database.relational_db import User
+from domain.auth import Principal
 from domain.statistics import RegistrationsGraph
 from core.config import Settings
 from core.security import auth_admin
@@ -17,7 +17,7 @@ config = Settings() # pyright: ignore[reportCallIssue]
 #     summary='Get graph data for active users by days',
 # )
 # async def active_users(
-#     _: Annotated[User, Depends(auth_admin)],
+#     _: Annotated[Principal, Depends(auth_admin)],
 #     svc: Annotated[StatService, Depends(get_stats_service)],
 #     days: int = Query(30, description='Number of days back to retrieve data for'),
 # ):
@@ -29,7 +29,7 @@ config = Settings() # pyright: ignore[reportCallIssue]
     summary='Get graph data for new registrations by days',
 )
 async def registrations(
-    _: Annotated[User, Depends(auth_admin)],
+    _: Annotated[Principal, Depends(auth_admin)],
     svc: Annotated[StatService, Depends(get_stats_service)],
     days: int = Query(30, description='Number of days back to retrieve data for'),
 ):
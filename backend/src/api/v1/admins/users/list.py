@@ -2,9 +2,9 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
 from core.security import auth_admin
-from database.relational_db import User
+from domain.auth import Principal
 from domain.users import UserModel
-from service.users import UserService, get_user_service
+from service.users import UserService, get_user_read_service
 from domain.common import CursorPage
 
 router = APIRouter()
@@ -16,8 +16,8 @@ router = APIRouter()
     summary='List users with filters and search (cursor pagination)',
 )
 async def list_users(
-    _: Annotated[User, Depends(auth_admin)],
-    svc: Annotated[UserService, Depends(get_user_service)],
+    _: Annotated[Principal, Depends(auth_admin)],
+    svc: Annotated[UserService, Depends(get_user_read_service)],
     banned: bool | None = Query(None, description='Filter by banned status'),
     search: str | None = Query(None, description='Search by username or email'),
     limit: int = Query(50, ge=1, le=100, description='Page size'),
@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Path
 
 from core.security import auth_admin
-from database.relational_db import User
+from domain.auth import Principal
 from domain.admin import BanRequest
 from domain.users import UserModel
 from service.users import UserService, get_user_service
@@ -19,7 +19,7 @@ router = APIRouter()
 async def set_ban(
     payload: BanRequest,
     user_id: Annotated[UUID, Path(...)],
-    _: Annotated[User, Depends(auth_admin)],
+    _: Annotated[Principal, Depends(auth_admin)],
     svc: Annotated[UserService, Depends(get_user_service)],
 ):
     target = await svc.get_user(user_id)
@@ -1,16 +1,23 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 
-from core.security import auth_user
+from core.responses import adapter_response
+from core.security import auth_principal
 from domain.carts import (
     CartModel,
     CartSummary,
+    CartDelta,
+    CartResponseMode,
 )
-from database.relational_db import User
-from service.carts import CartService, get_cart_service
+from domain.auth import Principal
+from service.carts import CartService, get_cart_service, get_cart_read_service
 
 router = APIRouter()
 
+_summary = TypeAdapter(CartSummary)
+_delta = TypeAdapter(CartDelta)
+
 
 @router.get(
     '/',
@@ -18,11 +25,11 @@ router = APIRouter()
     description="Get the current user's shopping cart with all items and totals"
 )
 async def get_cart(
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     cart_service: Annotated[CartService, Depends(get_cart_service)],
 ):
-    cart = await cart_service.get_user_cart(user)
-    return cart
+    body = await cart_service.get_cart_json(user)
+    return Response(body, media_type='application/json')
 
 
 @router.get(
@@ -31,21 +38,25 @@ async def get_cart(
     description="Get quick cart summary with total items and amount"
 )
 async def get_cart_summary(
-    user: Annotated[User, Depends(auth_user)],
-    cart_service: Annotated[CartService, Depends(get_cart_service)],
+    user: Annotated[Principal, Depends(auth_principal)],
+    cart_service: Annotated[CartService, Depends(get_cart_read_service)],
 ):
     summary = await cart_service.get_cart_summary(user)
-    return summary
+    return adapter_response(_summary, summary)
 
 
 @router.delete(
     '/',
-    response_model=CartModel,
+    response_model=CartModel | CartDelta,
     description="Remove all items from the cart"
 )
 async def clear_cart(
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     cart_service: Annotated[CartService, Depends(get_cart_service)],
+    mode: CartResponseMode = Query(CartResponseMode.FULL, description="`delta` returns the removed item IDs and the cart totals after the clear"),
 ):
-    cart = await cart_service.clear_cart(user)
-    return cart
+    delta = await cart_service.clear_cart(user)
+    if mode is CartResponseMode.DELTA:
+        return adapter_response(_delta, delta)
+    body = await cart_service.get_cart_json(user)
+    return Response(body, media_type='application/json')
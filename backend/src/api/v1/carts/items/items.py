@@ -1,56 +1,75 @@
 from typing import Annotated
 from uuid import UUID
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 
-from core.security import auth_user
+from core.responses import adapter_response
+from core.security import auth_principal
 from domain.carts import (
     CartModel, 
+    CartDelta,
+    CartResponseMode,
     CartItemCreate, 
     CartItemUpdate, 
     CartItemRemove,
 )
-from database.relational_db import User
+from domain.auth import Principal
 from service.carts import CartService, get_cart_service
 
 router = APIRouter()
 
+_delta = TypeAdapter(CartDelta)
+
+
+async def _respond(cart_service: CartService, user: Principal, delta: dict, mode: CartResponseMode, status_code: int = 200):
+    if mode is CartResponseMode.DELTA:
+        return adapter_response(_delta, delta, status_code=status_code)
+    body = await cart_service.get_cart_json(user)
+    return Response(body, status_code=status_code, media_type='application/json')
+
 
 @router.post(
     '/',
-    response_model=CartModel,
+    response_model=CartModel | CartDelta,
     status_code=201,
     description="Add a product to the cart. If product already exists, quantity will be added to existing amount."
 )
 async def add_item_to_cart(
     payload: CartItemCreate,
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     cart_service: Annotated[CartService, Depends(get_cart_service)],
+    mode: CartResponseMode = Query(CartResponseMode.FULL, description="`delta` returns only the changed item and new totals"),
 ):
-    return await cart_service.add_item_to_cart(user, payload)
+    delta = await cart_service.add_item_to_cart(user, payload)
+    return await _respond(cart_service, user, delta, mode, status_code=201)
 
 @router.put(
     '/{item_id}',
-    response_model=CartModel,
+    response_model=CartModel | CartDelta,
     summary="Update cart item quantity",
     description="Update the quantity of a specific cart item"
 )
 async def update_cart_item(
     item_id: UUID,
     payload: CartItemUpdate,
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     cart_service: Annotated[CartService, Depends(get_cart_service)],
+    mode: CartResponseMode = Query(CartResponseMode.FULL, description="`delta` returns only the changed item and new totals"),
 ):
-    return await cart_service.update_cart_item_quantity(user, item_id, payload)
+    delta = await cart_service.update_cart_item_quantity(user, item_id, payload)
+    return await _respond(cart_service, user, delta, mode)
 
 @router.delete(
     '/{item_id}',
-    response_model=CartModel,
+    response_model=CartModel | CartDelta,
     summary="Remove item from cart",
     description="Remove a specific product from the cart"
 )
 async def remove_item_from_cart(
     item_id: UUID,
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     cart_service: Annotated[CartService, Depends(get_cart_service)],
+    mode: CartResponseMode = Query(CartResponseMode.FULL, description="`delta` returns only the changed item and new totals"),
 ):
-    return await cart_service.remove_item_from_cart(user, item_id)
+    delta = await cart_service.remove_item_from_cart(user, item_id)
+    return await _respond(cart_service, user, delta, mode)
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+
+
+def get_media_router() -> APIRouter:
+    from .uploads import router as uploads_router
+
+    router = APIRouter(
+        prefix='/media',
+        tags=['Media'],
+    )
+
+    router.include_router(uploads_router)
+
+    return router
@@ -0,0 +1,50 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from core.storage import (
+    MediaStorage,
+    LocalMediaStorage,
+    StorageError,
+    get_media_storage,
+    key_digest,
+    stage_chunks,
+)
+
+router = APIRouter()
+
+
+@router.put(
+    path='/uploads/{key:path}',
+    status_code=204,
+    summary='Receive a presigned upload (local storage only)',
+    include_in_schema=False,
+)
+async def receive_upload(
+    key: str,
+    request: Request,
+    size: Annotated[int, Query(gt=0)],
+    expires: Annotated[int, Query()],
+    signature: Annotated[str, Query()],
+    storage: Annotated[MediaStorage, Depends(get_media_storage)],
+):
+    """Counterpart of S3 presigned PUTs: the body goes straight to disk"""
+    content_type = request.headers.get('content-type', '')
+    if not isinstance(storage, LocalMediaStorage) or not storage.verify_upload(key, content_type, size, expires, signature):
+        raise HTTPException(status.HTTP_403_FORBIDDEN, 'Invalid or expired upload URL')
+
+    digest = key_digest(key)
+    if digest is None:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, 'Invalid media key')
+
+    blob = await stage_chunks(request.stream(), content_type, size)
+    try:
+        if blob.size != size or blob.digest != digest:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, 'Body does not match the signed size and checksum')
+        if await storage.stat(key) is None:
+            await storage.put_file(key, blob.path, content_type, digest)
+    except StorageError:
+        raise HTTPException(status.HTTP_502_BAD_GATEWAY, 'Media storage unavailable')
+    finally:
+        blob.path.unlink(missing_ok=True)
+
+    return Response(status_code=204)
@@ -2,7 +2,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query, Response, HTTPException
 
 from domain.misc import LanguageModel
-from service.users import UserService, get_user_service
+from service.users import UserService, get_user_read_service
 
 
 router = APIRouter()
@@ -15,7 +15,7 @@ router = APIRouter()
 )
 async def list_languages(
     response: Response,
-    svc: Annotated[UserService, Depends(get_user_service)],
+    svc: Annotated[UserService, Depends(get_user_read_service)],
     query: str = Query("", max_length=50),
     limit: int | None = Query(None, ge=1, le=50),
 ):
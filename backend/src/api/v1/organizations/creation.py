@@ -1,9 +1,7 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends
 
-from database.relational_db import User
 from domain.organizations import OrganizationModel, OrganizationCreate
-from core.security import auth_user
 from service.organizations import OrganizationService, get_organization_service
 
 router = APIRouter()
@@ -16,7 +14,7 @@ router = APIRouter()
 # )
 # async def create_organization(
 #     payload: OrganizationCreate,
-#     user: Annotated[User, Depends(auth_user)],
+#     user: Annotated[Principal, Depends(auth_principal)],
 #     svc: Annotated[OrganizationService, Depends(get_organization_service)],
 # ):
 #     return await svc.create_organization(payload, user)
@@ -1,10 +1,10 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends
 
-from database.relational_db import User
+from domain.auth import Principal
 from domain.organizations import OrganizationModel
-from core.security import auth_user
-from service.organizations import OrganizationService, get_organization_service
+from core.security import auth_principal
+from service.organizations import OrganizationService, get_organization_read_service
 
 router = APIRouter()
 
@@ -14,7 +14,7 @@ router = APIRouter()
     summary='List my organizations'
 )
 async def list_my_organizations(
-    user: Annotated[User, Depends(auth_user)],
-    svc: Annotated[OrganizationService, Depends(get_organization_service)],
+    user: Annotated[Principal, Depends(auth_principal)],
+    svc: Annotated[OrganizationService, Depends(get_organization_read_service)],
 ):
     return await svc.list_my(user)
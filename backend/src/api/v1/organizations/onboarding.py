@@ -2,8 +2,8 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 
 from domain.organizations.schemas import AccountSessionRequest, AccountSessionResponse, AccountResponse
-from database.relational_db import User
-from core.security import auth_user
+from domain.auth import Principal
+from core.security import auth_principal
 from service.payments import StripeService, get_stripe_service
 from service.organizations import OrganizationService, get_organization_service
 
@@ -16,7 +16,7 @@ router = APIRouter()
     summary='Create Organization and Stripe account'
 )
 async def create_account(
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     org_svc: Annotated[OrganizationService, Depends(get_organization_service)],
     stripe_svc: Annotated[StripeService, Depends(get_stripe_service)],
 ):
@@ -37,7 +37,7 @@ async def create_account(
 )
 async def create_account_session(
     payload: AccountSessionRequest,
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     org_svc: Annotated[OrganizationService, Depends(get_organization_service)],
     stripe_svc: Annotated[StripeService, Depends(get_stripe_service)],
 ):
@@ -2,10 +2,8 @@ from typing import Annotated
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 
-from database.relational_db import User
 from domain.organizations import OrganizationModel
-from core.security import auth_user
-from service.organizations import OrganizationService, get_organization_service
+from service.organizations import OrganizationService, get_organization_read_service
 
 router = APIRouter()
 
@@ -17,7 +15,7 @@ router = APIRouter()
 )
 async def get_organization(
     org_id: UUID,
-    svc: Annotated[OrganizationService, Depends(get_organization_service)],
+    svc: Annotated[OrganizationService, Depends(get_organization_read_service)],
 ):
     org = await svc.get_organization(org_id)
     if org is None:
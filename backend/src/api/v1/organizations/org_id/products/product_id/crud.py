@@ -2,13 +2,13 @@ from typing import Annotated
 from uuid import UUID
 from fastapi import APIRouter, Depends, Path, HTTPException
 
-from core.security import auth_user
-from database.relational_db import User
+from core.security import auth_principal
+from domain.auth import Principal
 from domain.products import (
     ProductPatch,
     ProductModel,
 )
-from service.products import ProductService, get_product_service
+from service.products import ProductService, get_product_service, get_product_read_service
 
 router = APIRouter()
 
@@ -20,8 +20,8 @@ router = APIRouter()
 async def get_org_product(
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
     product_id: Annotated[UUID, Path(..., description="Product ID")],
-    _: Annotated[User, Depends(auth_user)],
-    svc: Annotated[ProductService, Depends(get_product_service)],
+    _: Annotated[Principal, Depends(auth_principal)],
+    svc: Annotated[ProductService, Depends(get_product_read_service)],
 ):
     product = await svc.get_product(product_id)
     if product is None or product.org_id != org_id:
@@ -38,7 +38,7 @@ async def patch_org_product(
     payload: ProductPatch,
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
     product_id: Annotated[UUID, Path(..., description="Product ID")],
-    _: Annotated[User, Depends(auth_user)],
+    _: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[ProductService, Depends(get_product_service)],
 ):
     product = await svc.get_product(product_id)
@@ -57,7 +57,7 @@ async def patch_org_product(
 async def delete_org_product(
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
     product_id: Annotated[UUID, Path(..., description="Product ID")],
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[ProductService, Depends(get_product_service)],
 ):
     pass
@@ -1,11 +1,12 @@
 from typing import Annotated
 from uuid import UUID
-from fastapi import APIRouter, Depends, Path, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, Path, HTTPException, Request
 
-from core.security import auth_user
-from database.relational_db import User
-from domain.products import ProductModel, MediaCreate
+from core.security import auth_principal
+from domain.auth import Principal
+from domain.products import ProductModel, MediaCreate, PhotoUploadRequest, PhotoUploadTicket, PhotoUploadConfirm
 from core.config import Settings
+from core.storage import multipart_openapi
 from service.products import ProductService, get_product_service
 
 router = APIRouter()
@@ -15,13 +16,17 @@ config = Settings() # pyright: ignore[reportCallIssue]
 @router.put(
     path='/media',
     response_model=ProductModel,
-    summary='Upload product photo(s)'
+    summary='Upload product photo(s)',
+    openapi_extra=multipart_openapi(
+        'files',
+        f"JPEG or PNG files (max {config.MAX_PHOTO_SIZE} MB each, {config.MAX_PHOTOS_PER_UPLOAD} per request)",
+    ),
 )
 async def upload_product_photos(
-    files: Annotated[list[UploadFile], File(..., description=f"JPEG or PNG files (max {config.MAX_PHOTO_SIZE} MB each). Can upload multiple files.")],
+    request: Request,
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
     product_id: Annotated[UUID, Path(..., description="Product ID")],
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[ProductService, Depends(get_product_service)],
 ):
     """Upload one or more photos for product"""
@@ -31,12 +36,59 @@ async def upload_product_photos(
     if product.organization.owner_user_id != user.id:
         raise HTTPException(403, 'You do not have access to this product')
     
-    # Support both single file and multiple files
-    if len(files) == 1:
-        await svc.add_product_photo(files[0], product)
-    else:
-        await svc.add_product_photos(files, product)
-    
+    # Parsed as it streams in; the body is only read once access is checked
+    await svc.receive_product_photos(request, product)
+
+    return product
+
+
+@router.post(
+    path='/media/uploads',
+    response_model=PhotoUploadTicket,
+    summary='Get a direct upload URL for a photo'
+)
+async def presign_product_photo(
+    payload: PhotoUploadRequest,
+    org_id: Annotated[UUID, Path(..., description="Organization ID")],
+    product_id: Annotated[UUID, Path(..., description="Product ID")],
+    user: Annotated[Principal, Depends(auth_principal)],
+    svc: Annotated[ProductService, Depends(get_product_service)],
+):
+    """
+    Upload the file itself to the returned URL with the returned headers, then
+    confirm the key. When `exists` is true the photo is already stored and can
+    be confirmed right away.
+    """
+    product = await svc.get_product(product_id)
+    if product is None or product.org_id != org_id:
+        raise HTTPException(404, 'Product not found')
+    if product.organization.owner_user_id != user.id:
+        raise HTTPException(403, 'You do not have access to this product')
+
+    return await svc.presign_photo_upload(payload)
+
+
+@router.post(
+    path='/media/uploads/confirm',
+    response_model=ProductModel,
+    summary='Attach directly uploaded photos',
+    description=f'Up to {config.MAX_PHOTOS_PER_UPLOAD} keys per request.',
+)
+async def confirm_product_photos(
+    payload: PhotoUploadConfirm,
+    org_id: Annotated[UUID, Path(..., description="Organization ID")],
+    product_id: Annotated[UUID, Path(..., description="Product ID")],
+    user: Annotated[Principal, Depends(auth_principal)],
+    svc: Annotated[ProductService, Depends(get_product_service)],
+):
+    product = await svc.get_product(product_id)
+    if product is None or product.org_id != org_id:
+        raise HTTPException(404, 'Product not found')
+    if product.organization.owner_user_id != user.id:
+        raise HTTPException(403, 'You do not have access to this product')
+
+    await svc.confirm_photo_uploads(product, payload.keys)
+
     return product
 
 
@@ -49,7 +101,7 @@ async def delete_media(
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
     product_id: Annotated[UUID, Path(..., description="Product ID")],
     media_id: Annotated[UUID, Path(..., description="Media file ID")],
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[ProductService, Depends(get_product_service)],
 ):
     product = await svc.get_product(product_id)
@@ -61,4 +113,4 @@ async def delete_media(
     media = await svc.media_repo.get_by_id(media_id)
     if media is None or media.product_id != product.id:
         raise HTTPException(404, 'Media not found')
-    await svc.delete_media(media)
+    await svc.delete_media(product, media)
@@ -2,8 +2,8 @@ from typing import Annotated
 from uuid import UUID
 from fastapi import APIRouter, Depends, Path, HTTPException
 
-from core.security import auth_user
-from database.relational_db import User
+from core.security import auth_principal
+from domain.auth import Principal
 from domain.products import (
     ProductModel,
 )
@@ -20,7 +20,7 @@ router = APIRouter()
 async def publish_product(
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
     product_id: Annotated[UUID, Path(..., description="Product ID")],
-    _: Annotated[User, Depends(auth_user)],
+    _: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[ProductService, Depends(get_product_service)],
 ):
     """Publish product (make it visible in public catalog)"""
@@ -39,7 +39,7 @@ async def publish_product(
 async def unpublish_product(
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
     product_id: Annotated[UUID, Path(..., description="Product ID")],
-    _: Annotated[User, Depends(auth_user)],
+    _: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[ProductService, Depends(get_product_service)],
 ):
     """Unpublish product (hide from public catalog)"""
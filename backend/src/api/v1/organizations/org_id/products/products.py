@@ -2,16 +2,16 @@ from typing import Annotated
 from uuid import UUID
 from fastapi import APIRouter, Depends, Path, Query, Header, HTTPException
 
-from core.security import auth_user
-from database.relational_db import User
+from core.security import auth_principal
+from domain.auth import Principal
 from domain.products import (
     ProductCreate,
     ProductModel,
     ProductStatus,
 )
-from domain.common import Page
-from service.products import ProductService, get_product_service
-from service.organizations import OrganizationService, get_organization_service
+from domain.common import Page, CountMode
+from service.products import ProductService, get_product_service, get_product_read_service
+from service.organizations import OrganizationService, get_organization_service, get_organization_read_service
 
 router = APIRouter()
 
@@ -24,7 +24,7 @@ router = APIRouter()
 async def create_product(
     payload: ProductCreate,
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[ProductService, Depends(get_product_service)],
     org_svc: Annotated[OrganizationService, Depends(get_organization_service)],
     idempotency_key: str | None = Header(default=None, alias='Idempotency-Key', description="Idempotency key"),
@@ -46,13 +46,14 @@ async def create_product(
 )
 async def list_org_products(
     org_id: Annotated[UUID, Path(..., description="Organization ID")],
-    user: Annotated[User, Depends(auth_user)],
-    svc: Annotated[ProductService, Depends(get_product_service)],
-    org_svc: Annotated[OrganizationService, Depends(get_organization_service)],
+    user: Annotated[Principal, Depends(auth_principal)],
+    svc: Annotated[ProductService, Depends(get_product_read_service)],
+    org_svc: Annotated[OrganizationService, Depends(get_organization_read_service)],
     offset: int = Query(0, ge=0, description="Offset from start"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of items"),
     status: ProductStatus | None = Query(None, description="Filter by status"),
     q: str | None = Query(None, description="Search query"),
+    count: CountMode = Query(CountMode.EXACT, description="How `total` is computed: exact (cached), estimate or none"),
 ):
     org = await org_svc.get_organization(org_id)
     if not org:
@@ -60,10 +61,13 @@ async def list_org_products(
     if org.owner_user_id != user.id:
         raise HTTPException(status_code=403, detail="You do not have access to this organization")
     
-    items, total = await svc.list_org_products(org_id, offset=offset, limit=limit, status=status, search=q)
+    items, total, estimated = await svc.list_org_products(
+        org_id, offset=offset, limit=limit, status=status, search=q, count=count
+    )
     return {
         "items": items,
         "offset": offset,
         "limit": limit,
         "total": total,
+        "total_estimated": estimated,
     }
@@ -1,33 +1,54 @@
 from typing import Annotated
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from pydantic import TypeAdapter
 
-from domain.products import ProductModel, ProductCondition, ProductOriginality
+from core.responses import adapter_json, dumps
+from domain.products import ProductModel, ProductCard, ProductCondition, ProductOriginality, ProductSort
 from domain.common import CursorPage
-from service.products import ProductService, get_product_service
+from service.products import ProductService, CatalogCache, get_public_product_service, get_catalog_cache
 
 router = APIRouter()
 
 
+_product_page = TypeAdapter(CursorPage[ProductModel])
+
+def _page_json(products: list, next_cursor: str | None) -> str:
+    return adapter_json(_product_page, {'items': products, 'next_cursor': next_cursor}).decode()
+
+
+_CARD_FIELDS = tuple(ProductCard.model_fields)
+
+def _cards_json(rows: list, next_cursor: str | None) -> str:
+    """Projection rows straight to JSON: the columns already have the `ProductCard` shape"""
+    items = [{field: row._mapping[field] for field in _CARD_FIELDS} for row in rows]
+    return dumps({'items': items, 'next_cursor': next_cursor}).decode()
+
+
 @router.get(
     path='/catalog',
     response_model=CursorPage[ProductModel],
-    summary='Product catalog search with cursor pagination'
+    summary='Product catalog search with cursor pagination',
+    description='Served from a shared cache. Send `If-None-Match` with the last `ETag` to get 304 for unchanged pages.',
 )
 async def search_products_cursor(
-    svc: Annotated[ProductService, Depends(get_product_service)],
+    request: Request,
+    svc: Annotated[ProductService, Depends(get_public_product_service)],
+    cache: Annotated[CatalogCache, Depends(get_catalog_cache)],
     limit: int = Query(20, ge=1, le=100, description="Maximum number of items"),
-    cursor: str | None = Query(None, description="Simple cursor (timestamp_uuid)"),
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page"),
     q: str | None = Query(None, description="Search query (title, description, make, part number)"),
+    sort: ProductSort | None = Query(None, description="Order, defaults to relevance when searching and newest otherwise"),
     make_id: int | None = Query(None, description="Filter by make"),
     condition: ProductCondition | None = Query(None, description="Filter by condition"),
     originality: ProductOriginality | None = Query(None, description="Filter by originality"),
     price_min: float | None = Query(None, ge=0, description="Minimum price filter"),
     price_max: float | None = Query(None, ge=0, description="Maximum price filter"),
 ):
-    products, next_cursor = await svc.search_published_products_cursor(
+    params = dict(
         limit=limit,
-        search=q,
+        search=q.strip().lower() if q and q.strip() else None,
+        sort=sort,
         make_id=make_id,
         condition=condition,
         originality=originality,
@@ -36,25 +57,104 @@ async def search_products_cursor(
         cursor=cursor,
     )
     
-    return CursorPage(items=products, next_cursor=next_cursor)
+    async def compute() -> str:
+        products, next_cursor = await svc.search_published_products_cursor(**params)
+        return _page_json(products, next_cursor)
+    
+    return await cache.respond(request, 'catalog', params, compute)
 
 
 @router.get(
     path='/feed',
     response_model=CursorPage[ProductModel],
-    summary='Product feed with simple cursor pagination'
+    summary='Product feed with simple cursor pagination',
+    description='Served from a shared cache, supports `If-None-Match`/304.',
 )
 async def get_products_feed_cursor(
-    svc: Annotated[ProductService, Depends(get_product_service)],
+    request: Request,
+    svc: Annotated[ProductService, Depends(get_public_product_service)],
+    cache: Annotated[CatalogCache, Depends(get_catalog_cache)],
     limit: int = Query(20, ge=1, le=100, description="Maximum number of items"),
-    cursor: str | None = Query(None, description="Simple cursor (timestamp_uuid)"),
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page"),
+):
+    async def compute() -> str:
+        products, next_cursor = await svc.get_feed_products_cursor(limit=limit, cursor=cursor)
+        return _page_json(products, next_cursor)
+    
+    return await cache.respond(request, 'feed', {'limit': limit, 'cursor': cursor}, compute)
+
+
+@router.get(
+    path='/catalog/cards',
+    response_model=CursorPage[ProductCard],
+    summary='Catalog search returning flat product cards',
+    description='Same filters, order and cursors as `/catalog`, lighter payload. Cached, supports `If-None-Match`/304.',
+)
+async def search_product_cards(
+    request: Request,
+    svc: Annotated[ProductService, Depends(get_public_product_service)],
+    cache: Annotated[CatalogCache, Depends(get_catalog_cache)],
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of items"),
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page"),
+    q: str | None = Query(None, description="Search query (title, description, make, part number)"),
+    sort: ProductSort | None = Query(None, description="Order, defaults to relevance when searching and newest otherwise"),
+    make_id: int | None = Query(None, description="Filter by make"),
+    condition: ProductCondition | None = Query(None, description="Filter by condition"),
+    originality: ProductOriginality | None = Query(None, description="Filter by originality"),
+    price_min: float | None = Query(None, ge=0, description="Minimum price filter"),
+    price_max: float | None = Query(None, ge=0, description="Maximum price filter"),
 ):
-    products, next_cursor = await svc.get_feed_products_cursor(
+    params = dict(
         limit=limit,
+        search=q.strip().lower() if q and q.strip() else None,
+        sort=sort,
+        make_id=make_id,
+        condition=condition,
+        originality=originality,
+        price_min=price_min,
+        price_max=price_max,
         cursor=cursor,
     )
     
-    return CursorPage(items=products, next_cursor=next_cursor)
+    async def compute() -> str:
+        rows, next_cursor = await svc.search_published_products_cursor(**params, cards=True)
+        return _cards_json(rows, next_cursor)
+    
+    return await cache.respond(request, 'catalog:cards', params, compute)
+
+
+@router.get(
+    path='/feed/cards',
+    response_model=CursorPage[ProductCard],
+    summary='Product feed returning flat product cards',
+    description='Same order and cursors as `/feed`, lighter payload. Cached, supports `If-None-Match`/304.',
+)
+async def get_product_cards_feed(
+    request: Request,
+    svc: Annotated[ProductService, Depends(get_public_product_service)],
+    cache: Annotated[CatalogCache, Depends(get_catalog_cache)],
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of items"),
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page"),
+):
+    async def compute() -> str:
+        rows, next_cursor = await svc.get_feed_products_cursor(limit=limit, cursor=cursor, cards=True)
+        return _cards_json(rows, next_cursor)
+    
+    return await cache.respond(request, 'feed:cards', {'limit': limit, 'cursor': cursor}, compute)
+
+
+@router.get(
+    path='/by-part-number/{part_number}',
+    response_model=list[ProductModel],
+    summary='Published listings for a part number, including interchangeable ones'
+)
+async def get_products_by_part_number(
+    part_number: str,
+    svc: Annotated[ProductService, Depends(get_public_product_service)],
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of items"),
+    equivalents: bool = Query(True, description="Include cross-referenced OEM/aftermarket equivalents"),
+):
+    return await svc.list_by_part_number(part_number, limit=limit, include_equivalents=equivalents)
 
 
 @router.get(
@@ -64,7 +164,7 @@ async def get_products_feed_cursor(
 )
 async def get_product_details(
     product_id: UUID,
-    svc: Annotated[ProductService, Depends(get_product_service)],
+    svc: Annotated[ProductService, Depends(get_public_product_service)],
 ):
     product = await svc.get_published_product(product_id)
     if product is None:
@@ -1,9 +1,9 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
-from database.relational_db import User
+from domain.auth import Principal
 from domain.garage import VehilceModel, VehicleCreate, VehiclePatch
-from core.security import auth_user
+from core.security import auth_principal
 from service.garages import GarageService, get_garage_service
 
 router = APIRouter()
@@ -15,7 +15,7 @@ router = APIRouter()
 )
 async def create_garage(
     payload: VehicleCreate,
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[GarageService, Depends(get_garage_service)],
 ):
     vehicle = await svc.add_vehicle(payload, user)
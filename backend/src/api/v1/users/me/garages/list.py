@@ -1,11 +1,11 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
-from database.relational_db import User
+from domain.auth import Principal
 from domain.garage import VehilceModel
 from domain.common import CursorPage
-from core.security import auth_user
-from service.garages import GarageService, get_garage_service
+from core.security import auth_principal
+from service.garages import GarageService, get_garage_read_service
 
 router = APIRouter()
 
@@ -16,10 +16,10 @@ router = APIRouter()
     summary='List user vehicles with cursor pagination and filters'
 )
 async def list_vehicles_cursor(
-    user: Annotated[User, Depends(auth_user)],
-    svc: Annotated[GarageService, Depends(get_garage_service)],
+    user: Annotated[Principal, Depends(auth_principal)],
+    svc: Annotated[GarageService, Depends(get_garage_read_service)],
     limit: int = Query(20, ge=1, le=100, description="Maximum number of items"),
-    cursor: str | None = Query(None, description="Simple cursor"),
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page"),
     search: str | None = Query(None, description="Search query (by make, model, vehicle type, comment)"),
     make_id: int | None = Query(None, description="Filter by make ID"),
     model_id: int | None = Query(None, description="Filter by model ID"),
@@ -2,10 +2,10 @@ from uuid import UUID
 from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
-from database.relational_db import User
+from domain.auth import Principal
 from domain.garage import VehilceModel, VehiclePatch
-from core.security import auth_user
-from service.garages import GarageService, get_garage_service
+from core.security import auth_principal
+from service.garages import GarageService, get_garage_service, get_garage_read_service
 
 router = APIRouter()
 
@@ -16,8 +16,8 @@ router = APIRouter()
 )
 async def get_vehicle(
     vehicle_id: UUID,
-    user: Annotated[User, Depends(auth_user)],
-    svc: Annotated[GarageService, Depends(get_garage_service)],
+    user: Annotated[Principal, Depends(auth_principal)],
+    svc: Annotated[GarageService, Depends(get_garage_read_service)],
 ):
     vehicle = await svc.get_vehicle(vehicle_id, user)
     return vehicle
@@ -31,7 +31,7 @@ async def get_vehicle(
 async def update_vehicle(
     payload: VehiclePatch,
     vehicle_id: UUID,
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[GarageService, Depends(get_garage_service)],
 ):
     vehicle = await svc.patch_vehicle(payload, vehicle_id, user)
@@ -45,7 +45,7 @@ async def update_vehicle(
 )
 async def delete_vehicle(
     vehicle_id: UUID,
-    user: Annotated[User, Depends(auth_user)],
+    user: Annotated[Principal, Depends(auth_principal)],
     svc: Annotated[GarageService, Depends(get_garage_service)],
 ):
     await svc.delete_vehicle(vehicle_id, user)
@@ -1,10 +1,11 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, UploadFile, File
+from fastapi import APIRouter, Depends, Request
 
 from database.relational_db import User
 from domain.users import UserModel
 from core.config import Settings
 from core.security import auth_user
+from core.storage import multipart_openapi
 from service.users import UserService, get_user_service
 
 router = APIRouter()
@@ -14,12 +15,13 @@ config = Settings() # pyright: ignore[reportCallIssue]
 @router.put(
     path='/picture',
     response_model=UserModel,
-    summary='Update user profile picture'
+    summary='Update user profile picture',
+    openapi_extra=multipart_openapi('file', f"JPEG or PNG file (max {config.MAX_PHOTO_SIZE} MB)", multiple=False),
 )
 async def update_profile(
-    file: Annotated[UploadFile, File(..., description=f"JPEG or PNG files (max {config.MAX_PHOTO_SIZE} MB)")],
+    request: Request,
     user: Annotated[User, Depends(auth_user)],
     svc: Annotated[UserService, Depends(get_user_service)],
 ):
-    await svc.add_picture(file, user)
+    await svc.receive_picture(request, user)
     return user
@@ -5,6 +5,7 @@ def get_vehicles_router() -> APIRouter:
     from .makes import get_makes_router
     from .models import get_models_router
     from .years import get_years_router
+    from .version import get_version_router
     
     router = APIRouter(
         prefix='/vehicles',
@@ -15,5 +16,6 @@ def get_vehicles_router() -> APIRouter:
     router.include_router(get_makes_router())
     router.include_router(get_models_router())
     router.include_router(get_years_router())
+    router.include_router(get_version_router())
     
     return router
@@ -1,19 +1,31 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import TypeAdapter
 
+from core.responses import adapter_json
 from domain.makes import MakeModel
 from service.vehicles import VehicleService, get_vehicle_service
 
 router = APIRouter()
 
+_makes = TypeAdapter(list[MakeModel])
+
 @router.get(
     path='/',
     response_model=list[MakeModel],
-    summary='Get all makes'
+    summary='Get all makes',
+    description='Cacheable: carries an ETag and supports `If-None-Match`/304.',
 )
 async def list_makes(
+    request: Request,
     svc: Annotated[VehicleService, Depends(get_vehicle_service)],
     limit: int = Query(50, ge=1, le=100),
     search: str | None = Query(None),
+    v: int | None = Query(None, description="Reference data version from `/vehicles/version`; pins the URL for long-lived caching"),
 ):
-    return await svc.search_makes(limit, search)
+    search = search.strip().lower() if search and search.strip() else None
+    
+    async def compute() -> bytes:
+        return adapter_json(_makes, await svc.search_makes(limit, search))
+    
+    return await svc.respond(request, 'makes', {'limit': limit, 'search': search}, v, compute)
@@ -1,20 +1,33 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import TypeAdapter
 
+from core.responses import adapter_json
 from domain.models import ModelSchema
 from service.vehicles import VehicleService, get_vehicle_service
 
 router = APIRouter()
 
+_models = TypeAdapter(list[ModelSchema])
+
 @router.get(
     path='/',
     response_model=list[ModelSchema],
-    summary='Get all models'
+    summary='Get all models',
+    description='Cacheable: carries an ETag and supports `If-None-Match`/304.',
 )
 async def list_models(
+    request: Request,
     svc: Annotated[VehicleService, Depends(get_vehicle_service)],
     limit: int = Query(50, ge=1, le=100),
     make_id: int | None = Query(None),
     search: str | None = Query(None),
+    v: int | None = Query(None, description="Reference data version from `/vehicles/version`; pins the URL for long-lived caching"),
 ):
-    return await svc.search_models(limit, make_id, search)
+    search = search.strip().lower() if search and search.strip() else None
+    
+    async def compute() -> bytes:
+        return adapter_json(_models, await svc.search_models(limit, make_id, search))
+    
+    params = {'limit': limit, 'make_id': make_id, 'search': search}
+    return await svc.respond(request, 'models', params, v, compute)
@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+
+def get_version_router() -> APIRouter:
+    from .get import router as get_router
+    
+    router = APIRouter(
+        prefix='/version',
+    )
+
+    router.include_router(get_router)
+    
+    return router
@@ -0,0 +1,20 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, Response
+
+from domain.vehicles import ReferenceVersion
+from service.vehicles import VehicleService, get_vehicle_service
+
+router = APIRouter()
+
+@router.get(
+    path='/',
+    response_model=ReferenceVersion,
+    summary='Current reference data version',
+    description='Pass it as `v` to the makes/models/years lookups to get URLs that can be cached for good.',
+)
+async def get_version(
+    response: Response,
+    svc: Annotated[VehicleService, Depends(get_vehicle_service)],
+):
+    response.headers['Cache-Control'] = 'no-cache'
+    return ReferenceVersion(version=svc.version)
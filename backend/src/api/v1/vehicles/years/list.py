@@ -1,7 +1,7 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 
-from domain.models import ModelSchema
+from core.responses import dumps
 from service.vehicles import VehicleService, get_vehicle_service
 
 router = APIRouter()
@@ -9,10 +9,16 @@ router = APIRouter()
 @router.get(
     path='/',
     response_model=list[int],
-    summary='Get all years for model'
+    summary='Get all years for model',
+    description='Cacheable: carries an ETag and supports `If-None-Match`/304.',
 )
 async def list_years(
+    request: Request,
     svc: Annotated[VehicleService, Depends(get_vehicle_service)],
     model_id: int = Query(...),
+    v: int | None = Query(None, description="Reference data version from `/vehicles/version`; pins the URL for long-lived caching"),
 ):
-    return await svc.list_years(model_id)
+    async def compute() -> bytes:
+        return dumps(await svc.list_years(model_id))
+    
+    return await svc.respond(request, 'years', {'model_id': model_id}, v, compute)
@@ -1,6 +1,7 @@
 import logging
 
 from pathlib import Path
+from typing import Literal
 from pydantic import SecretStr
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,6 +27,34 @@ class Settings(BaseSettings):
     # Media settings
     MEDIA_DIR: str = 'media'
     MAX_PHOTO_SIZE: int = 10 # in MB
+    PHOTO_UPLOAD_CONCURRENCY: int = 4 # files written in parallel per request
+    MAX_PHOTOS_PER_UPLOAD: int = 10
+    MAX_REQUEST_SIZE: int = 1 # in MB, bodies of routes without an upload limit
+    
+    # Media storage: 'local' keeps blobs under MEDIA_DIR, 's3' uses an S3-compatible bucket
+    MEDIA_STORAGE: Literal['local', 's3'] = 'local'
+    MEDIA_PUBLIC_URL: str = '' # defaults to SITE_URL/MEDIA_DIR, or the bucket URL for s3
+    MEDIA_SIGNING_KEY: bytes | None = None # enables direct uploads with the local backend
+    MEDIA_UPLOAD_URL_TTL: int = 60 * 10
+    S3_ENDPOINT_URL: str = ''
+    S3_REGION: str = 'us-east-1'
+    S3_BUCKET: str = ''
+    S3_ACCESS_KEY: str = ''
+    S3_SECRET_KEY: SecretStr = SecretStr('')
+    
+    # Local media serving: mounted in the API, or standalone via `uvicorn media_app:app`
+    MEDIA_SERVE_IN_API: bool = True
+    MEDIA_CACHE_MAX_AGE: int = 60 * 60 # files without a content hash or uuid name
+    MEDIA_ACCEL_REDIRECT: str = '' # internal nginx location, hands transfers to X-Accel-Redirect
+    
+    # Media garbage collection: blobs no row references, older than the grace period.
+    # Pictures are matched by URL, so run `scripts.media_gc --dry-run` before enabling
+    # if SITE_URL / MEDIA_PUBLIC_URL ever changed
+    MEDIA_GC_ENABLED: bool = False
+    MEDIA_GC_INTERVAL: int = 60 * 10
+    MEDIA_GC_GRACE: int = 60 * 60 * 24
+    MEDIA_GC_BATCH: int = 1000
+    MEDIA_GC_BATCHES: int = 10 # per run
     
     # External services
     STRIPE_SECRET_KEY: str
@@ -36,13 +65,62 @@ class Settings(BaseSettings):
     # Auth Settings    
     JWT_PRIVATE_KEY: str
     JWT_PUBLIC_KEY: str
-    JWT_ALGO: str = 'RS256'
+    JWT_ALGO: str = 'RS256' # RS256, ES256 or EdDSA, must match the key type
+    JWT_KID: str = 'main'
+    # Retired public keys still accepted for verification, as {"kid": "PEM"}
+    JWT_PREVIOUS_PUBLIC_KEYS: dict[str, str] = {}
     ACCESS_TTL: int = 60 * 15
     REFRESH_TTL: int = 60 * 60 * 24 * 7
     CSRF_HMAC_KEY: bytes
     
+    # Authenticated principal cache (Redis TTL is capped by ACCESS_TTL)
+    PRINCIPAL_CACHE_TTL: int = 60 * 5
+    PRINCIPAL_LOCAL_TTL: int = 5
+    PRINCIPAL_LOCAL_SIZE: int = 10_000
+    
+    # Anonymous feed/catalog response cache, in seconds
+    CATALOG_CACHE_FRESH: int = 30
+    CATALOG_CACHE_STALE: int = 60 * 5
+    CATALOG_CACHE_LOCK_TTL: int = 10
+    CATALOG_CACHE_WAIT: float = 2.0
+    # After a listing write, pages are recomputed on the primary for this long (replica lag bound)
+    CATALOG_PRIMARY_WINDOW: float = 5.0
+    
+    # Vehicle reference responses: plain URLs, and URLs pinned to the current `v`
+    VEHICLE_CACHE_MAX_AGE: int = 60 * 60
+    VEHICLE_CACHE_PINNED_MAX_AGE: int = 60 * 60 * 24 * 365
+    
+    # Redis copy of active carts (`/carts/`, `/carts/summary`); Postgres stays the store
+    CART_CACHE_ENABLED: bool = False
+    CART_CACHE_TTL: int = 60 * 10
+    
+    # Cart stock holds: lifetime, and how often/how many expired ones are released
+    CART_RESERVATION_TTL: int = 60 * 15
+    RESERVATION_SWEEP_INTERVAL: int = 30
+    RESERVATION_SWEEP_BATCH: int = 500
+    
+    # Cached exact product counts per (org, status), dropped on product writes
+    PRODUCT_COUNT_TTL: int = 60 * 10
+    
+    # Argon2 hashing pool: each job holds ~64 MiB, overflow beyond the queue gets 503
+    HASH_WORKERS: int = 2
+    HASH_MAX_QUEUE: int = 32
+    HASH_RETRY_AFTER: int = 1
+    
+    # Token blocklist local caches (revocations are synced via Redis pub/sub)
+    BLOCKLIST_NEGATIVE_TTL: int = 10
+    BLOCKLIST_LOCAL_SIZE: int = 100_000
+    
     # Database settings
     DATABASE_URL: str
+    DATABASE_REPLICA_URL: str | None = None # read-only routes fall back to the primary
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 60 * 30
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT: int = 30_000 # in ms, 0 disables
+    DB_STATEMENT_CACHE_SIZE: int = 100 # set 0 behind pgbouncer in transaction mode
     REDIS_URL: str
 
 
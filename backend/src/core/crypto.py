@@ -1,6 +1,19 @@
 import asyncio
+import logging
+import time
+
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from .config import Settings
+
+config = Settings() # pyright: ignore[reportCallIssue]
+logger = logging.getLogger(__name__)
+T = TypeVar('T')
+
 pwd_context = CryptContext(
     schemes=["argon2"],
     deprecated="auto",
@@ -10,11 +23,97 @@ pwd_context = CryptContext(
     argon2__parallelism=2,
 )
 
+# Every Argon2 call holds 64 MiB for its whole duration, so hashing gets its own
+# small pool instead of competing with other `to_thread` users for the default one.
+_executor = ThreadPoolExecutor(max_workers=config.HASH_WORKERS, thread_name_prefix='argon2')
+
+
+class HashingOverloaded(HTTPException):
+    def __init__(self, *args, **kwargs):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Too many authentication requests, try again later',
+            headers={'Retry-After': str(config.HASH_RETRY_AFTER)},
+        )
+
+
+@dataclass
+class HashingMetrics:
+    completed: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    
+    def observe(self, wait: float, latency: float) -> None:
+        self.completed += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+_metrics = HashingMetrics()
+
+
+def hashing_metrics() -> dict:
+    """Snapshot of the hashing pool counters, times are in seconds"""
+    snapshot = asdict(_metrics)
+    completed = _metrics.completed or 1
+    snapshot['wait_avg'] = _metrics.wait_total / completed
+    snapshot['latency_avg'] = _metrics.latency_total / completed
+    return snapshot
+
+
+def _release_slot() -> None:
+    _metrics.in_flight -= 1
+
+
+async def _run(fn: Callable[..., T], *args) -> T:
+    """
+    Run `fn` on the hashing pool. Requests beyond the workers plus
+    `HASH_MAX_QUEUE` waiting ones are rejected right away.
+    """
+    if _metrics.in_flight >= config.HASH_WORKERS + config.HASH_MAX_QUEUE:
+        _metrics.rejected += 1
+        logger.warning('Hashing queue is full, rejecting request')
+        raise HashingOverloaded()
+    
+    submitted = time.perf_counter()
+    started = submitted
+    
+    def job() -> T:
+        nonlocal started
+        started = time.perf_counter()
+        return fn(*args)
+    
+    loop = asyncio.get_running_loop()
+    
+    def release(_) -> None:
+        # The slot belongs to the pool job, not to the caller: a cancelled caller
+        # (client gone) leaves a running job behind that still holds its memory
+        try:
+            loop.call_soon_threadsafe(_release_slot)
+        except RuntimeError:
+            pass # loop already closed at shutdown
+    
+    _metrics.in_flight += 1
+    future = _executor.submit(job)
+    future.add_done_callback(release)
+    result = await asyncio.wrap_future(future)
+    
+    finished = time.perf_counter()
+    _metrics.observe(started - submitted, finished - started)
+    return result
+
+
 async def hash_password(password: str) -> str:
-    return await asyncio.to_thread(pwd_context.hash, password)
+    return await _run(pwd_context.hash, password)
 
 async def verify_password(password: str, hashed_password: str) -> bool:
-    return await asyncio.to_thread(pwd_context.verify, password, hashed_password)
+    return await _run(pwd_context.verify, password, hashed_password)
 
-async def needs_rehash(hashed_password: str) -> bool:
-    return await asyncio.to_thread(pwd_context.needs_update, hashed_password)
+async def verify_and_update(password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify and, if the hash uses outdated parameters, rehash within the same pool job"""
+    return await _run(pwd_context.verify_and_update, password, hashed_password)
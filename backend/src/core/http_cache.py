@@ -0,0 +1,32 @@
+from hashlib import blake2b
+from fastapi import Request, Response, status
+
+
+def strong_etag(body: str | bytes) -> str:
+    if isinstance(body, str):
+        body = body.encode()
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """`If-None-Match` contains `etag` (or `*`)"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix('W/') for tag in header.split(',')}
+    return '*' in candidates or etag in candidates
+
+
+def cached_response(
+    request: Request,
+    body: str | bytes,
+    etag: str,
+    cache_control: str,
+    media_type: str = 'application/json',
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Full response, or an empty 304 when the client already has this `etag`"""
+    headers = {**(headers or {}), 'ETag': etag, 'Cache-Control': cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -0,0 +1,68 @@
+import re
+
+from typing import Sequence
+from fastapi import HTTPException, status
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from core.responses import ORJSONResponse
+
+
+def _too_large(limit: int) -> str:
+    return f"Request body too large. Max {limit // 1024} KiB"
+
+
+class UploadLimitMiddleware:
+    """
+    Caps request bodies per route before anything buffers them.
+
+    `limits` are `(method, path regex, max bytes)` rules, first match wins;
+    other requests get `default` (`None` for no cap). A declared
+    `Content-Length` over the cap is refused with 413 before the app runs.
+    Otherwise the body is counted as it is received and the first chunk past
+    the cap raises a 413 from `receive`, so chunked or lying clients are cut
+    off too, long before a multipart parser could spool the rest.
+    """
+    def __init__(self, app: ASGIApp, limits: Sequence[tuple[str, str, int]] = (), default: int | None = None):
+        self.app = app
+        self.limits = [(method, re.compile(pattern), max_bytes) for method, pattern, max_bytes in limits]
+        self.default = default
+
+    def _limit(self, scope: Scope) -> int | None:
+        for method, pattern, max_bytes in self.limits:
+            if scope["method"] == method and pattern.match(scope["path"]):
+                return max_bytes
+        return self.default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        limit = self._limit(scope)
+        if limit is None:
+            return await self.app(scope, receive, send)
+
+        declared = next((value for name, value in scope["headers"] if name == b"content-length"), None)
+        if declared is not None and (not declared.isdigit() or int(declared) > limit):
+            response = ORJSONResponse(
+                {"detail": _too_large(limit)},
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                headers={"Connection": "close"},
+            )
+            return await response(scope, receive, send)
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(
+                        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=_too_large(limit),
+                        headers={"Connection": "close"},
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,41 @@
+import orjson
+
+from decimal import Decimal
+from typing import Any
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """orjson with the types it doesn't cover natively (Decimal)"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """Default response class of the app"""
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def adapter_json(adapter: TypeAdapter, value: Any) -> bytes:
+    """Validate ORM objects against the adapter's schema once and dump straight to JSON bytes"""
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True), by_alias=True)
+
+
+def adapter_response(adapter: TypeAdapter, value: Any, status_code: int = 200) -> Response:
+    """
+    Serialized response for hot routes. Returning a `Response` skips FastAPI's
+    `response_model` pass (validate, `jsonable_encoder`, render), which would
+    otherwise walk the whole object graph a second time. Keep `response_model`
+    on the route for the OpenAPI schema.
+    """
+    return Response(adapter_json(adapter, value), status_code=status_code, media_type='application/json')
@@ -5,6 +5,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from database.relational_db import User
+from domain.auth import Principal
 from service.auth import TokenService, get_token_service
 from service.users import UserService, get_user_service
 
@@ -29,28 +30,39 @@ async def extract_jti(request: Request) -> str:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Bad refresh token passed")
     return jti
 
-async def auth_user(
+async def auth_principal(
     creds: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     token_svc: Annotated[TokenService, Depends(get_token_service)],
     user_svc: Annotated[UserService, Depends(get_user_service)],
-) -> User:
+) -> Principal:
+    """Identity only: served from the principal cache, Postgres is hit on a miss."""
     payload = await token_svc.verify_access(creds.credentials)
     if payload is None:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Bad access token passed")
     
-    user_id = payload['sub']
-    user = await user_svc.get_user(user_id)
-    if user is None:
+    principal = await user_svc.get_principal(payload['sub'])
+    if principal is None:
         raise HTTPException(401, detail="Not Authorized")
-    if user.banned:
+    if principal.banned:
         raise HTTPException(403, detail="Your account is banned, contact support: laughinmee@gmail.com")
     
+    return principal
+
+async def auth_user(
+    principal: Annotated[Principal, Depends(auth_principal)],
+    user_svc: Annotated[UserService, Depends(get_user_service)],
+) -> User:
+    """Full user row, for routes rendering or mutating the account itself."""
+    user = await user_svc.get_user(principal.id, profile='auth')
+    if user is None:
+        raise HTTPException(401, detail="Not Authorized")
+    
     return user
 
 async def auth_admin(
-    user: Annotated[User, Depends(auth_user)],
-) -> User:
-    if not user.is_admin:
+    principal: Annotated[Principal, Depends(auth_principal)],
+) -> Principal:
+    if not principal.is_admin:
         raise HTTPException(403, detail="You don't have permission to do this")
     
-    return user
+    return principal
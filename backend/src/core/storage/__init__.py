@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from core.config import Settings
+from .base import (
+    MediaStorage,
+    BlobInfo,
+    PresignedUpload,
+    StorageError,
+    CONTENT_TYPES,
+    content_key,
+    is_content_key,
+    key_digest,
+)
+from .local import LocalMediaStorage
+from .s3 import S3MediaStorage
+from .staging import StagedBlob, stage_chunks
+from .multipart import ReceivedFile, receive_files, multipart_openapi
+from .serving import MediaFiles, ETagIndex, is_immutable
+
+config = Settings() # pyright: ignore[reportCallIssue]
+
+
+def _build_storage() -> MediaStorage:
+    if config.MEDIA_STORAGE == 's3':
+        return S3MediaStorage(
+            endpoint_url=config.S3_ENDPOINT_URL,
+            bucket=config.S3_BUCKET,
+            region=config.S3_REGION,
+            access_key=config.S3_ACCESS_KEY,
+            secret_key=config.S3_SECRET_KEY.get_secret_value(),
+            public_url=config.MEDIA_PUBLIC_URL,
+        )
+    return LocalMediaStorage(
+        root=Path(config.MEDIA_DIR),
+        public_url=config.MEDIA_PUBLIC_URL or f"{config.SITE_URL}/{config.MEDIA_DIR}",
+        upload_url=f"{config.SITE_URL}/api/v1/media/uploads",
+        signing_key=config.MEDIA_SIGNING_KEY,
+    )
+
+
+media_storage = _build_storage()
+
+def get_media_storage() -> MediaStorage:
+    """Returns the configured media storage backend"""
+    return media_storage
+
+
+def build_media_files() -> MediaFiles:
+    """ASGI app serving the local backend's blobs"""
+    return MediaFiles(
+        root=Path(config.MEDIA_DIR),
+        max_age=config.MEDIA_CACHE_MAX_AGE,
+        accel_redirect=config.MEDIA_ACCEL_REDIRECT,
+    )
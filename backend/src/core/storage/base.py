@@ -0,0 +1,111 @@
+import re
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+# Accepted image types and the extension their blobs are stored under
+CONTENT_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+}
+
+_CONTENT_KEY = re.compile(r"^blobs/([0-9a-f]{2})/([0-9a-f]{2})/([0-9a-f]{64})\.(jpg|png)$")
+
+
+class StorageError(Exception):
+    """The storage backend failed or answered unexpectedly"""
+
+
+@dataclass(frozen=True, slots=True)
+class BlobInfo:
+    key: str
+    size: int
+    content_type: str | None = None
+    modified: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PresignedUpload:
+    """Where and how a client uploads a blob itself"""
+    key: str
+    url: str
+    expires_at: datetime
+    method: str = "PUT"
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def content_key(digest: str, content_type: str) -> str:
+    """Content-addressed key of a blob with SHA-256 `digest`"""
+    return f"blobs/{digest[:2]}/{digest[2:4]}/{digest}{CONTENT_TYPES[content_type]}"
+
+
+def is_content_key(key: str) -> bool:
+    match = _CONTENT_KEY.match(key)
+    return match is not None and match[3].startswith(match[1] + match[2])
+
+
+def key_digest(key: str) -> str | None:
+    """SHA-256 a content key is named after"""
+    return key.rsplit("/", 1)[1].split(".")[0] if is_content_key(key) else None
+
+
+class MediaStorage(ABC):
+    """
+    Blob store for uploaded media.
+
+    Keys are slash-separated paths. New uploads use content keys
+    (`blobs/ab/cd/<sha256>.jpg`): identical files share one blob, so a blob
+    may be referenced by several rows and is never deleted on behalf of one.
+    Older per-product paths (`products/<id>/<uuid>.jpg`) are still readable.
+    """
+    def __init__(self, public_url: str):
+        self.public_url = public_url.rstrip("/")
+
+    def url(self, key: str) -> str:
+        """Public URL the blob is served from"""
+        return f"{self.public_url}/{key}"
+
+    def key_from_url(self, url: str) -> str | None:
+        """Reverse of `url`, `None` for URLs this storage does not serve"""
+        prefix = f"{self.public_url}/"
+        return url.removeprefix(prefix) if url.startswith(prefix) else None
+
+    @abstractmethod
+    async def stat(self, key: str) -> BlobInfo | None:
+        """Size and type of a stored blob, `None` if it does not exist"""
+
+    @abstractmethod
+    async def touch(self, key: str) -> bool:
+        """Refresh a blob's modification time; False if it does not exist"""
+
+    @abstractmethod
+    async def list_blobs(self, after: str | None, limit: int) -> list[BlobInfo]:
+        """Up to `limit` blobs in key order, starting after key `after`"""
+
+    @abstractmethod
+    async def put_file(self, key: str, path: Path, content_type: str, digest: str) -> None:
+        """Store a local file under `key`. The file is consumed"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a blob, no-op when it is already gone"""
+
+    @abstractmethod
+    async def presign_put(self, key: str, content_type: str, size: int, digest: str, expires_in: int) -> PresignedUpload:
+        """URL a client can upload exactly this blob to without going through the API"""
+
+    async def store(self, path: Path, content_type: str, digest: str) -> str:
+        """Store a staged file content-addressed, skipping the upload if the blob exists"""
+        key = content_key(digest, content_type)
+        # Reusing a blob refreshes it, so garbage collection (which only takes
+        # blobs past a grace period) cannot remove it before the new row lands
+        if await self.touch(key):
+            path.unlink(missing_ok=True)
+        else:
+            await self.put_file(key, path, content_type, digest)
+        return key
+
+    async def aclose(self) -> None:
+        pass
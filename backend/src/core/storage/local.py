@@ -0,0 +1,127 @@
+import os
+import hmac
+import time
+import asyncio
+import hashlib
+
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import urlencode
+
+from .base import MediaStorage, BlobInfo, PresignedUpload, StorageError, CONTENT_TYPES
+
+_TYPE_BY_SUFFIX = {suffix: content_type for content_type, suffix in CONTENT_TYPES.items()}
+
+
+class LocalMediaStorage(MediaStorage):
+    """
+    Blobs as files under `root`, served by the app's `/media` mount.
+
+    Direct uploads go to a signed API route that streams the body straight
+    to disk; they are only available when a signing key is configured.
+    """
+    def __init__(self, root: Path, public_url: str, upload_url: str, signing_key: bytes | None = None):
+        super().__init__(public_url)
+        self.root = root.resolve()
+        self.upload_url = upload_url.rstrip("/")
+        self._signing_key = signing_key
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root) or path == self.root:
+            raise StorageError(f"Invalid media key: {key}")
+        return path
+
+    def _info(self, key: str, info: os.stat_result) -> BlobInfo:
+        modified = datetime.fromtimestamp(info.st_mtime, timezone.utc)
+        return BlobInfo(key, info.st_size, _TYPE_BY_SUFFIX.get(Path(key).suffix), modified)
+
+    async def stat(self, key: str) -> BlobInfo | None:
+        path = self._path(key)
+        try:
+            info = await asyncio.to_thread(path.stat)
+        except FileNotFoundError:
+            return None
+        return self._info(key, info)
+
+    async def touch(self, key: str) -> bool:
+        try:
+            await asyncio.to_thread(os.utime, self._path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _walk(self, folder: str, prefix: str, after: str | None) -> Iterator[BlobInfo]:
+        # Directories sort as "name/" so the walk yields keys in plain string
+        # order, and whole subtrees before `after` are skipped unread
+        with os.scandir(folder) as it:
+            entries = sorted(
+                (entry for entry in it if not entry.name.startswith(".")),
+                key=lambda entry: entry.name + ("/" if entry.is_dir(follow_symlinks=False) else ""),
+            )
+        for entry in entries:
+            key = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                subtree = key + "/"
+                if after is not None and after > subtree and not after.startswith(subtree):
+                    continue
+                yield from self._walk(entry.path, subtree, after)
+            elif entry.is_file(follow_symlinks=False) and (after is None or key > after):
+                try:
+                    yield self._info(key, entry.stat(follow_symlinks=False))
+                except FileNotFoundError:
+                    continue
+
+    async def list_blobs(self, after: str | None, limit: int) -> list[BlobInfo]:
+        if not self.root.is_dir():
+            return []
+        return await asyncio.to_thread(lambda: list(islice(self._walk(str(self.root), "", after), limit)))
+
+    async def put_file(self, key: str, path: Path, content_type: str, digest: str) -> None:
+        target = self._path(key)
+
+        def move():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Same filesystem as the staging dir: readers never see a partial blob
+            os.replace(path, target)
+
+        try:
+            await asyncio.to_thread(move)
+        except OSError as e:
+            raise StorageError(f"Could not store {key}: {e!s}") from e
+
+    async def delete(self, key: str) -> None:
+        try:
+            await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+        except OSError as e:
+            raise StorageError(f"Could not delete {key}: {e!s}") from e
+
+    def _signature(self, key: str, content_type: str, size: int, expires: int) -> str:
+        assert self._signing_key is not None
+        message = f"{key}\n{content_type}\n{size}\n{expires}".encode()
+        return hmac.new(self._signing_key, message, hashlib.sha256).hexdigest()
+
+    async def presign_put(self, key: str, content_type: str, size: int, digest: str, expires_in: int) -> PresignedUpload:
+        if self._signing_key is None:
+            raise StorageError("Direct uploads need MEDIA_SIGNING_KEY")
+
+        expires = int(time.time()) + expires_in
+        query = urlencode({
+            "size": size,
+            "expires": expires,
+            "signature": self._signature(key, content_type, size, expires),
+        })
+        return PresignedUpload(
+            key=key,
+            url=f"{self.upload_url}/{key}?{query}",
+            expires_at=datetime.fromtimestamp(expires, timezone.utc),
+            headers={"Content-Type": content_type},
+        )
+
+    def verify_upload(self, key: str, content_type: str, size: int, expires: int, signature: str) -> bool:
+        """Check the query of a URL issued by `presign_put`"""
+        if self._signing_key is None or expires < time.time():
+            return False
+        return hmac.compare_digest(self._signature(key, content_type, size, expires), signature)
@@ -0,0 +1,198 @@
+import hashlib
+import aiofiles
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+from fastapi import Request, HTTPException, status
+from python_multipart.multipart import MultipartParser, parse_options_header
+from python_multipart.exceptions import MultipartParseError
+
+from core.config import Settings
+from .base import CONTENT_TYPES
+from .staging import StagedBlob, staging_dir
+
+settings = Settings() # pyright: ignore[reportCallIssue]
+
+
+@dataclass(slots=True)
+class ReceivedFile:
+    """One file part: staged on disk, or the reason it was rejected"""
+    filename: str | None
+    outcome: StagedBlob | HTTPException
+
+
+@dataclass(slots=True)
+class _Part:
+    filename: str | None
+    content_type: str
+    path: Path | None = None
+    out: Any = None
+    hasher: Any = field(default_factory=hashlib.sha256)
+    size: int = 0
+    error: HTTPException | None = None
+
+    async def discard(self) -> None:
+        if self.out is not None:
+            await self.out.close()
+            self.out = None
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+async def receive_files(request: Request, field_name: str, limit_bytes: int, max_files: int) -> list[ReceivedFile]:
+    """
+    Parse a multipart body as it arrives, writing each `field_name` file part
+    straight to the staging dir.
+
+    Unlike `UploadFile`, nothing is spooled first: a part over `limit_bytes`
+    or of an unsupported type is cut off as soon as that is known (its bytes
+    are dropped, the rest of the body still parses) and reported in its
+    `ReceivedFile`. Other form fields are ignored. On any exception every
+    staged file is removed.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="Expected multipart/form-data")
+
+    # The parser is synchronous: callbacks queue events that are then handled
+    # between chunks, where file writes can be awaited
+    events: list[tuple[str, Any]] = []
+    headers: dict[bytes, bytes] = {}
+    header_field = bytearray()
+    header_value = bytearray()
+
+    def on_part_begin():
+        headers.clear()
+
+    def on_header_field(data: bytes, start: int, end: int):
+        header_field.extend(data[start:end])
+
+    def on_header_value(data: bytes, start: int, end: int):
+        header_value.extend(data[start:end])
+
+    def on_header_end():
+        headers[bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+
+    def on_headers_finished():
+        events.append(("headers", dict(headers)))
+
+    def on_part_data(data: bytes, start: int, end: int):
+        events.append(("data", data[start:end]))
+
+    def on_part_end():
+        events.append(("end", None))
+
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+
+    received: list[ReceivedFile] = []
+    part: _Part | None = None
+    in_part = False
+
+    async def handle(kind: str, value: Any) -> None:
+        nonlocal part, in_part
+        if kind == "headers":
+            in_part = True
+            _, disposition = parse_options_header(value.get(b"content-disposition", b""))
+            if disposition.get(b"name", b"").decode() != field_name or b"filename" not in disposition:
+                part = None
+                return
+            if len(received) == max_files:
+                raise HTTPException(
+                    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Too many files. Max {max_files} per request"
+                )
+
+            filename = disposition[b"filename"].decode(errors="replace")
+            part = _Part(filename, value.get(b"content-type", b"").decode().strip())
+            if part.content_type not in CONTENT_TYPES:
+                part.error = HTTPException(
+                    status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail=f"File {filename}: Only JPEG and PNG files are allowed"
+                )
+                return
+            part.path = staging_dir() / uuid4().hex
+            part.out = await aiofiles.open(part.path, "wb")
+
+        elif kind == "data" and part is not None and part.error is None:
+            if part.size + len(value) > limit_bytes:
+                await part.discard()
+                part.error = HTTPException(
+                    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File too large. Max {settings.MAX_PHOTO_SIZE} MB"
+                )
+                return
+            part.hasher.update(value)
+            await part.out.write(value)
+            part.size += len(value)
+
+        elif kind == "end":
+            in_part = False
+            if part is None:
+                return
+            if part.error is not None:
+                received.append(ReceivedFile(part.filename, part.error))
+            else:
+                await part.out.close()
+                part.out = None
+                assert part.path is not None
+                blob = StagedBlob(part.path, part.size, part.hasher.hexdigest(), part.content_type)
+                received.append(ReceivedFile(part.filename, blob))
+            part = None
+
+    try:
+        try:
+            async for chunk in request.stream():
+                parser.write(chunk)
+                for kind, value in events:
+                    await handle(kind, value)
+                events.clear()
+            parser.finalize()
+        except MultipartParseError:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Malformed multipart body")
+        if in_part:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Incomplete multipart body")
+    except BaseException:
+        if part is not None:
+            await part.discard()
+        for item in received:
+            if isinstance(item.outcome, StagedBlob):
+                item.outcome.path.unlink(missing_ok=True)
+        raise
+
+    return received
+
+
+def multipart_openapi(field_name: str, description: str, multiple: bool = True) -> dict[str, Any]:
+    """`openapi_extra` documenting a body that a route reads with `receive_files`"""
+    file_schema = {"type": "string", "format": "binary"}
+    property_schema = (
+        {"type": "array", "items": file_schema, "description": description}
+        if multiple else {**file_schema, "description": description}
+    )
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": [field_name],
+                        "properties": {field_name: property_schema},
+                    },
+                },
+            },
+        },
+    }
@@ -0,0 +1,231 @@
+import hmac
+import base64
+import hashlib
+import aiofiles
+import httpx
+
+from xml.etree import ElementTree
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator
+from urllib.parse import quote
+
+from .base import MediaStorage, BlobInfo, PresignedUpload, StorageError
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+S3_NS = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+MAX_PRESIGN_EXPIRES = 60 * 60 * 24 * 7
+
+
+def _amz_date(now: datetime) -> str:
+    return now.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _encode(value: str, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+def _canonical_headers(headers: dict[str, str]) -> tuple[str, str]:
+    """(canonical header block, signed header list)"""
+    lowered = sorted((name.lower(), " ".join(value.split())) for name, value in headers.items())
+    return "".join(f"{name}:{value}\n" for name, value in lowered), ";".join(name for name, _ in lowered)
+
+
+async def _read_file(path: Path, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as src:
+        while chunk := await src.read(chunk_size):
+            yield chunk
+
+
+class S3MediaStorage(MediaStorage):
+    """
+    Blobs in an S3-compatible bucket (AWS S3, MinIO, R2, ...).
+
+    Requests are signed with SigV4 over plain httpx and use path-style
+    addressing (`<endpoint>/<bucket>/<key>`), which every implementation
+    accepts without per-bucket DNS. Presigned uploads pin the size and the
+    SHA-256 checksum, so the store itself rejects a body that does not match
+    the content key it was issued for.
+    """
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        region: str,
+        access_key: str,
+        secret_key: str,
+        public_url: str = "",
+        client: httpx.AsyncClient | None = None,
+    ):
+        endpoint = httpx.URL(endpoint_url)
+        self._host = endpoint.netloc.decode()
+        self._origin = f"{endpoint.scheme}://{self._host}"
+        super().__init__(public_url or f"{self._origin}/{bucket}")
+        self.bucket = bucket
+        self.region = region
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._client = client or httpx.AsyncClient(timeout=httpx.Timeout(30, connect=5))
+
+    def _path(self, key: str) -> str:
+        return f"/{_encode(self.bucket)}/{_encode(key, safe='/-_.~')}"
+
+    def _scope(self, now: datetime) -> str:
+        return f"{now:%Y%m%d}/{self.region}/s3/aws4_request"
+
+    def _signature(
+        self,
+        method: str,
+        path: str,
+        query: list[tuple[str, str]],
+        headers: dict[str, str],
+        payload_hash: str,
+        now: datetime,
+    ) -> str:
+        canonical_query = "&".join(f"{_encode(k)}={_encode(v)}" for k, v in sorted(query))
+        canonical_headers, signed_headers = _canonical_headers(headers)
+        canonical_request = "\n".join(
+            [method, path, canonical_query, canonical_headers, signed_headers, payload_hash]
+        )
+        string_to_sign = "\n".join([
+            ALGORITHM,
+            _amz_date(now),
+            self._scope(now),
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ])
+
+        key = f"AWS4{self._secret_key}".encode()
+        for part in (f"{now:%Y%m%d}", self.region, "s3", "aws4_request"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+        return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    async def _request(
+        self,
+        method: str,
+        key: str | None,
+        headers: dict[str, str] | None = None,
+        payload_hash: str = EMPTY_SHA256,
+        content: AsyncIterator[bytes] | None = None,
+        query: list[tuple[str, str]] | None = None,
+    ) -> httpx.Response:
+        """Signed request on an object, or on the bucket itself when `key` is None"""
+        now = datetime.now(timezone.utc)
+        path = self._path(key) if key is not None else f"/{_encode(self.bucket)}"
+        query = query or []
+        headers = {
+            **(headers or {}),
+            "host": self._host,
+            "x-amz-date": _amz_date(now),
+            "x-amz-content-sha256": payload_hash,
+        }
+        _, signed_headers = _canonical_headers(headers)
+        signature = self._signature(method, path, query, headers, payload_hash, now)
+        headers["authorization"] = (
+            f"{ALGORITHM} Credential={self._access_key}/{self._scope(now)}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        url = f"{self._origin}{path}"
+        if query:
+            url += "?" + "&".join(f"{_encode(k)}={_encode(v)}" for k, v in query)
+        try:
+            return await self._client.request(method, url, headers=headers, content=content)
+        except httpx.HTTPError as e:
+            raise StorageError(f"{method} {key or self.bucket} failed: {e!s}") from e
+
+    async def stat(self, key: str) -> BlobInfo | None:
+        response = await self._request("HEAD", key)
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise StorageError(f"HEAD {key} returned {response.status_code}")
+        return BlobInfo(key, int(response.headers.get("content-length", 0)), response.headers.get("content-type"))
+
+    async def touch(self, key: str) -> bool:
+        # S3 has no utime: copying the object onto itself resets LastModified
+        info = await self.stat(key)
+        if info is None:
+            return False
+        response = await self._request("PUT", key, headers={
+            "x-amz-copy-source": self._path(key),
+            "x-amz-metadata-directive": "REPLACE",
+            "content-type": info.content_type or "application/octet-stream",
+        })
+        if response.status_code == 404:
+            return False
+        if response.status_code != 200 or b"<Error>" in response.content:
+            raise StorageError(f"Copy of {key} returned {response.status_code}")
+        return True
+
+    async def list_blobs(self, after: str | None, limit: int) -> list[BlobInfo]:
+        blobs: list[BlobInfo] = []
+        while len(blobs) < limit:
+            query = [("list-type", "2"), ("max-keys", str(min(limit - len(blobs), 1000)))]
+            if after is not None:
+                query.append(("start-after", after))
+            response = await self._request("GET", None, query=query)
+            if response.status_code != 200:
+                raise StorageError(f"Listing {self.bucket} returned {response.status_code}")
+
+            page = ElementTree.fromstring(response.content)
+            for item in page.iter(f"{S3_NS}Contents"):
+                blobs.append(BlobInfo(
+                    key=item.findtext(f"{S3_NS}Key", ""),
+                    size=int(item.findtext(f"{S3_NS}Size", "0")),
+                    modified=datetime.fromisoformat(item.findtext(f"{S3_NS}LastModified", "")),
+                ))
+            if page.findtext(f"{S3_NS}IsTruncated") != "true" or not blobs:
+                break
+            after = blobs[-1].key
+        return blobs
+
+    async def put_file(self, key: str, path: Path, content_type: str, digest: str) -> None:
+        # The payload hash is the blob's own digest, so the body is streamed
+        # and still fully signed
+        response = await self._request(
+            "PUT",
+            key,
+            headers={"content-type": content_type, "content-length": str(path.stat().st_size)},
+            payload_hash=digest,
+            content=_read_file(path),
+        )
+        if response.status_code != 200:
+            raise StorageError(f"PUT {key} returned {response.status_code}: {response.text[:200]}")
+        path.unlink(missing_ok=True)
+
+    async def delete(self, key: str) -> None:
+        response = await self._request("DELETE", key)
+        if response.status_code not in (200, 204, 404):
+            raise StorageError(f"DELETE {key} returned {response.status_code}")
+
+    async def presign_put(self, key: str, content_type: str, size: int, digest: str, expires_in: int) -> PresignedUpload:
+        now = datetime.now(timezone.utc)
+        expires_in = min(expires_in, MAX_PRESIGN_EXPIRES)
+        path = self._path(key)
+        checksum = base64.b64encode(bytes.fromhex(digest)).decode()
+        headers = {
+            "host": self._host,
+            "content-type": content_type,
+            "content-length": str(size),
+            "x-amz-checksum-sha256": checksum,
+        }
+        _, signed_headers = _canonical_headers(headers)
+        query = [
+            ("X-Amz-Algorithm", ALGORITHM),
+            ("X-Amz-Credential", f"{self._access_key}/{self._scope(now)}"),
+            ("X-Amz-Date", _amz_date(now)),
+            ("X-Amz-Expires", str(expires_in)),
+            ("X-Amz-SignedHeaders", signed_headers),
+        ]
+        signature = self._signature("PUT", path, query, headers, "UNSIGNED-PAYLOAD", now)
+        query.append(("X-Amz-Signature", signature))
+
+        return PresignedUpload(
+            key=key,
+            url=f"{self._origin}{path}?" + "&".join(f"{_encode(k)}={_encode(v)}" for k, v in query),
+            expires_at=now + timedelta(seconds=expires_in),
+            headers={"Content-Type": content_type, "x-amz-checksum-sha256": checksum},
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
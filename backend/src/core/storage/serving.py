@@ -0,0 +1,210 @@
+import os
+import re
+import stat
+import asyncio
+import logging
+import mimetypes
+
+from email.utils import formatdate
+from pathlib import Path
+from starlette.requests import Request
+from starlette.types import Scope, Receive, Send
+
+from core.http_cache import etag_matches
+from .base import CONTENT_TYPES, key_digest
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+CHUNK_SIZE = 256 * 1024
+
+# Pre-storage uploads: random uuid4 names, never rewritten in place
+_LEGACY_KEY = re.compile(r"^(products|users)/[^/]+/[0-9a-f]{32}\.(jpg|png)$")
+_TYPE_BY_SUFFIX = {suffix: content_type for content_type, suffix in CONTENT_TYPES.items()}
+
+
+def is_immutable(key: str) -> bool:
+    return key_digest(key) is not None or _LEGACY_KEY.match(key) is not None
+
+
+def _stat_etag(info: os.stat_result) -> str:
+    return f'"{info.st_size:x}-{info.st_mtime_ns:x}"'
+
+
+class ETagIndex:
+    """
+    ETags by key, so revalidations are answered without touching the disk.
+
+    Content keys carry their ETag in the name (the SHA-256). Other files are
+    indexed once by `build` and then as they are served.
+    """
+    def __init__(self, root: Path):
+        self.root = root
+        self._tags: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def get(self, key: str) -> str | None:
+        digest = key_digest(key)
+        return f'"{digest}"' if digest is not None else self._tags.get(key)
+
+    def remember(self, key: str, info: os.stat_result) -> str:
+        etag = self._tags[key] = _stat_etag(info)
+        return etag
+
+    def build(self) -> None:
+        """Index every non content-addressed file; blocking, run it in a thread"""
+        for folder, dirs, files in os.walk(self.root):
+            relative = Path(folder).relative_to(self.root)
+            if relative == Path("."):
+                dirs[:] = [d for d in dirs if d != "blobs" and not d.startswith(".")]
+            for name in files:
+                key = (relative / name).as_posix()
+                try:
+                    self.remember(key, os.stat(os.path.join(folder, name)))
+                except OSError:
+                    continue
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Single `bytes=` range as inclusive (start, end); None to send the whole file"""
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        # Multipart ranges are not worth it for images; a full 200 is allowed
+        return None
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        if not last.isdigit() or int(last) == 0:
+            raise ValueError
+        return max(size - int(last), 0), size - 1
+    if not first.isdigit() or (last and not last.isdigit()):
+        return None
+    start, end = int(first), int(last) if last else size - 1
+    if end < start:
+        return None
+    if start >= size:
+        raise ValueError
+    return start, min(end, size - 1)
+
+
+class MediaFiles:
+    """
+    ASGI app serving the local media storage.
+
+    Compared to `StaticFiles`: content-hashed and uuid-named files get an
+    immutable `Cache-Control`, `If-None-Match` is checked against the ETag
+    index before any file is opened, single byte ranges are supported, and
+    bodies go out with the server's zero-copy extensions when available
+    (`http.response.zerocopysend`, `http.response.pathsend`). Behind nginx,
+    `accel_redirect` hands the transfer itself to nginx's sendfile.
+    """
+    def __init__(self, root: Path, index: ETagIndex | None = None, max_age: int = 3600, accel_redirect: str = ""):
+        self.root = root.resolve()
+        self.index = index or ETagIndex(self.root)
+        self.max_age = max_age
+        self.accel_redirect = accel_redirect.rstrip("/")
+
+    async def build_index(self) -> None:
+        await asyncio.to_thread(self.index.build)
+        logger.info(f"Media ETag index built: {len(self.index)} files")
+
+    def _key(self, scope: Scope) -> str | None:
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        parts = path.strip("/").split("/")
+        if not parts[0] or any(part.startswith(".") or not part for part in parts):
+            return None
+        return "/".join(parts)
+
+    async def _plain(self, send: Send, status_code: int, headers: list[tuple[bytes, bytes]] | None = None) -> None:
+        await send({"type": "http.response.start", "status": status_code, "headers": headers or []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+        if scope["method"] not in ("GET", "HEAD"):
+            return await self._plain(send, 405, [(b"allow", b"GET, HEAD")])
+
+        key = self._key(scope)
+        if key is None:
+            return await self._plain(send, 404)
+
+        request = Request(scope)
+        cache_control = IMMUTABLE if is_immutable(key) else f"public, max-age={self.max_age}"
+        etag = self.index.get(key)
+        if etag is not None and etag_matches(request, etag):
+            return await self._plain(send, 304, [(b"etag", etag.encode()), (b"cache-control", cache_control.encode())])
+
+        path = self.root / key
+        try:
+            file = await asyncio.to_thread(open, path, "rb")
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError, PermissionError):
+            return await self._plain(send, 404)
+
+        try:
+            info = os.fstat(file.fileno())
+            if not stat.S_ISREG(info.st_mode):
+                return await self._plain(send, 404)
+            if etag is None:
+                etag = self.index.remember(key, info)
+                if etag_matches(request, etag):
+                    return await self._plain(send, 304, [(b"etag", etag.encode()), (b"cache-control", cache_control.encode())])
+
+            content_type = _TYPE_BY_SUFFIX.get(path.suffix) or mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            headers = [
+                (b"content-type", content_type.encode()),
+                (b"etag", etag.encode()),
+                (b"cache-control", cache_control.encode()),
+                (b"last-modified", formatdate(info.st_mtime, usegmt=True).encode()),
+                (b"accept-ranges", b"bytes"),
+            ]
+
+            if self.accel_redirect:
+                # nginx serves the body (and ranges) from its internal location
+                headers.append((b"x-accel-redirect", f"{self.accel_redirect}/{key}".encode()))
+                return await self._plain(send, 200, headers)
+
+            size = info.st_size
+            start, end, status_code = 0, size - 1, 200
+            range_header = request.headers.get("range")
+            if_range = request.headers.get("if-range")
+            if range_header and size and (if_range is None or if_range == etag):
+                try:
+                    byte_range = _parse_range(range_header, size)
+                except ValueError:
+                    return await self._plain(send, 416, [(b"content-range", f"bytes */{size}".encode()), *headers[1:]])
+                if byte_range is not None:
+                    start, end = byte_range
+                    status_code = 206
+                    headers.append((b"content-range", f"bytes {start}-{end}/{size}".encode()))
+
+            length = end - start + 1 if size else 0
+            headers.append((b"content-length", str(length).encode()))
+            await send({"type": "http.response.start", "status": status_code, "headers": headers})
+            if scope["method"] == "HEAD" or not length:
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            extensions = scope.get("extensions") or {}
+            if "http.response.zerocopysend" in extensions:
+                await send({"type": "http.response.zerocopysend", "file": file, "offset": start, "count": length})
+            elif "http.response.pathsend" in extensions and status_code == 200:
+                await send({"type": "http.response.pathsend", "path": str(path)})
+            else:
+                fd = file.fileno()
+                offset, remaining = start, length
+                while remaining:
+                    chunk = await asyncio.to_thread(os.pread, fd, min(CHUNK_SIZE, remaining), offset)
+                    if not chunk:
+                        break
+                    offset += len(chunk)
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": bool(remaining)})
+                if remaining:
+                    # File shrank underneath us; end the response cleanly
+                    await send({"type": "http.response.body", "body": b""})
+        finally:
+            file.close()
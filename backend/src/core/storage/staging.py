@@ -0,0 +1,59 @@
+import hashlib
+import aiofiles
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator
+from uuid import uuid4
+from fastapi import HTTPException, status
+
+from core.config import Settings
+
+settings = Settings() # pyright: ignore[reportCallIssue]
+
+
+@dataclass(frozen=True, slots=True)
+class StagedBlob:
+    """Upload written to a local temp file, hashed and size-checked"""
+    path: Path
+    size: int
+    digest: str
+    content_type: str
+
+
+def staging_dir() -> Path:
+    # Inside MEDIA_DIR so the local backend can move files into place atomically
+    folder = Path(settings.MEDIA_DIR, ".staging")
+    folder.mkdir(parents=True, exist_ok=True)
+    return folder
+
+
+async def stage_chunks(chunks: AsyncIterator[bytes], content_type: str, limit_bytes: int) -> StagedBlob:
+    """Write `chunks` to a temp file, computing SHA-256 on the way"""
+    path = staging_dir() / uuid4().hex
+    hasher = hashlib.sha256()
+    written = 0
+
+    try:
+        async with aiofiles.open(path, "wb") as out:
+            async for chunk in chunks:
+                if written + len(chunk) > limit_bytes:
+                    raise HTTPException(
+                        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large. Max {settings.MAX_PHOTO_SIZE} MB"
+                    )
+                hasher.update(chunk)
+                await out.write(chunk)
+                written += len(chunk)
+    except HTTPException:
+        path.unlink(missing_ok=True)
+        raise
+    except Exception as e:
+        path.unlink(missing_ok=True)
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Could not save file: {str(e)}"
+        )
+
+    return StagedBlob(path, written, hasher.hexdigest(), content_type)
+
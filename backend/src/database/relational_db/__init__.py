@@ -1,3 +1,3 @@
 from .tables import *
-from .session import get_uow
-from .unit_of_work import UoW
\ No newline at end of file
+from .session import get_uow, get_read_uow, get_replica_uow, read_uow
+from .unit_of_work import UoW, ReadUoW
\ No newline at end of file
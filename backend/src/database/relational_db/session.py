@@ -1,4 +1,4 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import(
     create_async_engine,
@@ -8,12 +8,43 @@ from sqlalchemy.ext.asyncio import(
 )
 
 from core.config import Settings
-from .unit_of_work import UoW
+from .unit_of_work import UoW, ReadUoW
 
 config = Settings() # pyright: ignore[reportCallIssue]
 
-engine: AsyncEngine = create_async_engine(config.DATABASE_URL, echo=True)
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=config.DB_ECHO,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        connect_args={
+            'statement_cache_size': config.DB_STATEMENT_CACHE_SIZE,
+            'server_settings': {'statement_timeout': str(config.DB_STATEMENT_TIMEOUT)},
+        },
+    )
+
+
+def _read_only(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Sessions whose transactions start as READ ONLY DEFERRABLE on the shared pool"""
+    return async_sessionmaker(
+        engine.execution_options(postgresql_readonly=True, postgresql_deferrable=True),
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+
+engine: AsyncEngine = _create_engine(config.DATABASE_URL)
 async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(engine, expire_on_commit=False)
+read_session = _read_only(engine)
+
+replica_engine: AsyncEngine = (
+    _create_engine(config.DATABASE_REPLICA_URL) if config.DATABASE_REPLICA_URL else engine
+)
+replica_session = _read_only(replica_engine)
 
 
 async def get_uow() -> AsyncGenerator[UoW, None]:
@@ -21,3 +52,26 @@ async def get_uow() -> AsyncGenerator[UoW, None]:
     async with async_session() as session:
         async with UoW(session) as uow:
             yield uow
+
+
+async def get_read_uow() -> AsyncGenerator[UoW, None]:
+    """Read-only Unit of Work on the primary, for GET routes that must see the caller's own writes."""
+    async with read_session() as session:
+        async with ReadUoW(session) as uow:
+            yield uow
+
+
+async def get_replica_uow() -> AsyncGenerator[UoW, None]:
+    """Read-only Unit of Work on the replica (the primary when none is configured)."""
+    async with replica_session() as session:
+        async with ReadUoW(session) as uow:
+            yield uow
+
+
+@asynccontextmanager
+async def read_uow(replica: bool = True) -> AsyncIterator[UoW]:
+    """Read-only Unit of Work on the replica, or on the primary when `replica` is False."""
+    factory = replica_session if replica else read_session
+    async with factory() as session:
+        async with ReadUoW(session) as uow:
+            yield uow
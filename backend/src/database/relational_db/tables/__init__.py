@@ -9,3 +9,4 @@ from .makes import *
 from .manufacturers import *
 from .models import *
 from .garage import *
+from .keyset import Keyset, InvalidCursor
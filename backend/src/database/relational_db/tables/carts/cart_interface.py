@@ -1,12 +1,12 @@
-from genericpath import exists
 from uuid import UUID
-from sqlalchemy import select, delete, update, exists
+from datetime import datetime
+from sqlalchemy import select, delete, update, exists, func, case, true, literal, literal_column, Row, CTE, ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from sqlalchemy.dialects.postgresql import insert
 
 from .cart_table import Cart, CartItem
-from ..products import Product
+from ..products import ProductsInterface
 
 
 class CartInterface:
@@ -19,7 +19,8 @@ class CartInterface:
             .where(Cart.user_id == user_id)
         )
         
-    async def get_cart(self, user_id: UUID | str) -> Cart:
+    async def get_cart_id(self, user_id: UUID | str) -> UUID:
+        """Id of the user's cart, created on first use"""
         result = await self.session.execute(
             insert(Cart)
             .values(user_id=user_id)
@@ -29,27 +30,76 @@ class CartInterface:
             )
             .returning(Cart.id)
         )
-        cart_id = result.scalar_one()
+        return result.scalar_one()
+    
+    async def get_totals(self, user_id: UUID | str) -> Row | None:
+        """`(unique_items, total_items, total_amount)` of the user's cart: one row off the `user_id` unique index"""
+        result = await self.session.execute(
+            select(Cart.unique_items, Cart.total_items, Cart.total_amount)
+            .where(Cart.user_id == user_id)
+        )
+        return result.one_or_none()
+        
+    async def get_cart(self, user_id: UUID | str) -> Cart:
+        cart_id = await self.get_cart_id(user_id)
 
         result = await self.session.execute(
             select(Cart)
             .where(Cart.id == cart_id)
             .options(
-                selectinload(Cart.items)
-                .selectinload(CartItem.product)
-                .selectinload(Product.media)
+                selectinload(Cart.items).options(
+                    selectinload(CartItem.product).options(
+                        *ProductsInterface.profiles('card')
+                    ),
+                    raiseload('*'),
+                ),
+                raiseload('*'),
             )
+            # Mutations write through Core statements; don't serve stale identities
+            .execution_options(populate_existing=True)
         )
         await self.session.flush()
         return result.scalar_one()
 
-    async def clear_cart(self, user_id: UUID | str) -> None:
-        await self.session.execute(
+    async def clear_cart(self, user_id: UUID | str) -> list[Row]:
+        """
+        Empty the user's cart, returning `(id, product_id, quantity, reserved_until)`
+        of the removed items, each with the cart's totals after the delete
+        """
+        removed = (
             delete(CartItem)
-            .options(selectinload(CartItem.cart))
-            .where(Cart.user_id == user_id)
+            .where(CartItem.cart_id == select(Cart.id).where(Cart.user_id == user_id).scalar_subquery())
+            .returning(CartItem.id, CartItem.cart_id, CartItem.product_id, CartItem.quantity, CartItem.unit_price, CartItem.reserved_until)
+            .cte('removed')
         )
-        await self.session.flush()
+        sums = (
+            select(
+                removed.c.cart_id,
+                func.count().label('lines'),
+                func.sum(removed.c.quantity).label('quantity'),
+                func.sum(removed.c.quantity * removed.c.unit_price).label('amount'),
+            )
+            .group_by(removed.c.cart_id)
+            .cte('sums')
+        )
+        # Subtract what was deleted: a line added concurrently keeps its share
+        totals = (
+            update(Cart)
+            .where(Cart.id == sums.c.cart_id)
+            .values(
+                unique_items=Cart.unique_items - sums.c.lines,
+                total_items=Cart.total_items - sums.c.quantity,
+                total_amount=Cart.total_amount - sums.c.amount,
+            )
+            .returning(Cart.unique_items, Cart.total_items, Cart.total_amount)
+            .cte('totals')
+        )
+        result = await self.session.execute(
+            select(removed.c.id, removed.c.product_id, removed.c.quantity, removed.c.reserved_until, *totals.c)
+            .select_from(removed)
+            .join(totals, true())
+        )
+        return list(result.all())
 
 
 class CartItemInterface:
@@ -61,36 +111,168 @@ class CartItemInterface:
             select(CartItem).where(CartItem.id == item_id)
         )
 
-    async def get_cart_item(self, cart_id: UUID | str, product_id: UUID | str) -> CartItem | None:
-        return await self.session.scalar(
-            select(CartItem).where(
-                CartItem.cart_id == cart_id,
-                CartItem.product_id == product_id
+    async def lock(self, item_id: UUID | str) -> Row | None:
+        """`(cart_id, product_id, quantity, reserved_until, owner_id)` of an item, its row locked `FOR UPDATE`"""
+        result = await self.session.execute(
+            select(
+                CartItem.cart_id,
+                CartItem.product_id,
+                CartItem.quantity,
+                CartItem.reserved_until,
+                Cart.user_id.label('owner_id'),
             )
+            .join(Cart, Cart.id == CartItem.cart_id)
+            .where(CartItem.id == item_id)
+            .with_for_update(of=CartItem)
+        )
+        return result.one_or_none()
+
+    async def get_cart_item(
+        self,
+        cart_id: UUID | str,
+        product_id: UUID | str,
+        for_update: bool = False,
+    ) -> CartItem | None:
+        stmt = select(CartItem).where(
+            CartItem.cart_id == cart_id,
+            CartItem.product_id == product_id
         )
+        if for_update:
+            stmt = stmt.with_for_update(of=CartItem).execution_options(populate_existing=True)
+        return await self.session.scalar(stmt)
 
-    async def update_quantity(self, item_id: UUID | str, quantity: int) -> CartItem | None:
+    async def _apply(self, changed: CTE, unique: ColumnElement, items: ColumnElement, amount: ColumnElement) -> Row | None:
+        """
+        Run a data-modifying CTE over one line and, in the same statement, move
+        its cart's totals by the given deltas (expressions over the CTE's
+        columns). Returns the line with the cart's new totals.
+        
+        Increments rather than recomputing, so concurrent changes to different
+        lines of one cart serialize on the cart row and none is lost.
+        """
+        totals = (
+            update(Cart)
+            .where(Cart.id == changed.c.cart_id)
+            .values(
+                unique_items=Cart.unique_items + unique,
+                total_items=Cart.total_items + items,
+                total_amount=Cart.total_amount + amount,
+            )
+            .returning(Cart.unique_items, Cart.total_items, Cart.total_amount)
+            .cte('totals')
+        )
         result = await self.session.execute(
+            select(*changed.c, *totals.c).select_from(changed).join(totals, true())
+        )
+        return result.one_or_none()
+
+    @staticmethod
+    def _returning():
+        return (
+            CartItem.id,
+            CartItem.cart_id,
+            CartItem.product_id,
+            CartItem.quantity,
+            CartItem.unit_price,
+            CartItem.reserved_until,
+        )
+    
+    @staticmethod
+    def _line_amount(changed: CTE, quantity) -> ColumnElement:
+        return quantity * changed.c.unit_price
+
+    async def add(
+        self,
+        cart_id: UUID | str,
+        quantity: int,
+        reserved_until: datetime,
+        max_quantity: int,
+        **snapshot,
+    ) -> Row | None:
+        """
+        Insert a line or add `quantity` to the existing one, returning it with
+        cart totals. None when that would take the line past `max_quantity`
+        """
+        stmt = (
+            insert(CartItem)
+            .values(cart_id=cart_id, quantity=quantity, reserved_until=reserved_until, **snapshot)
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint='uix_cart_item_unique',
+            set_={
+                'quantity': CartItem.quantity + stmt.excluded.quantity,
+                'reserved_until': stmt.excluded.reserved_until,
+                'updated_at': func.now(),
+            },
+            # Checked against the row as it is when the conflict is found, not a value read earlier
+            where=CartItem.quantity + stmt.excluded.quantity <= max_quantity,
+        )
+        # xmax is 0 on a freshly inserted row, set when the conflict branch updated it
+        changed = stmt.returning(*self._returning(), (literal_column('xmax') == 0).label('inserted')).cte('changed')
+        return await self._apply(
+            changed,
+            unique=case((changed.c.inserted, 1), else_=0),
+            items=literal(quantity),
+            amount=self._line_amount(changed, quantity),
+        )
+
+    async def set_quantity(self, item_id: UUID | str, previous: int, quantity: int, reserved_until: datetime) -> Row | None:
+        """Set a locked line's quantity (was `previous`), returning it with cart totals"""
+        changed = (
             update(CartItem)
-            .options(
-                selectinload(CartItem.cart),
-                selectinload(CartItem.product)
-            )
             .where(CartItem.id == item_id)
-            .values(quantity=quantity)
-            .returning(CartItem)
+            .values(quantity=quantity, reserved_until=reserved_until, updated_at=func.now())
+            .returning(*self._returning())
+            .cte('changed')
+        )
+        diff = quantity - previous
+        return await self._apply(
+            changed,
+            unique=literal(0),
+            items=literal(diff),
+            amount=self._line_amount(changed, diff),
         )
-        return result.scalar()
 
-    async def remove_item(self, item_id: UUID | str) -> CartItem | None:
-        result = await self.session.execute(
+    async def remove_item(self, item_id: UUID | str) -> Row | None:
+        """Delete a line, returning it with the totals of what is left in the cart"""
+        changed = (
             delete(CartItem)
-            .options(selectinload(CartItem.cart))
             .where(CartItem.id == item_id)
-            .returning(CartItem)
+            .returning(*self._returning())
+            .cte('changed')
+        )
+        return await self._apply(
+            changed,
+            unique=literal(-1),
+            items=-changed.c.quantity,
+            amount=-self._line_amount(changed, changed.c.quantity),
         )
-        return result.scalar()
     
+    async def expire_holds(self, now: datetime, batch: int) -> dict[UUID, int]:
+        """
+        Mark up to `batch` lapsed holds as released, returning the stock they
+        held as `{product_id: quantity}`. Rows locked by a cart mutation are
+        skipped; that mutation renews or releases the hold itself.
+        """
+        lapsed = (
+            select(CartItem.id)
+            .where(CartItem.reserved_until < now)
+            .order_by(CartItem.reserved_until)
+            .limit(batch)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(CartItem)
+            .where(CartItem.id.in_(lapsed.scalar_subquery()))
+            .values(reserved_until=None)
+            .returning(CartItem.product_id, CartItem.quantity)
+            .execution_options(synchronize_session=False)
+        )
+        holds: dict[UUID, int] = {}
+        for product_id, quantity in result:
+            holds[product_id] = holds.get(product_id, 0) + quantity
+        return holds
+
     async def by_product_id(self, product_id: UUID | str) -> list[CartItem]:
         result = await self.session.scalars(
             select(CartItem)
@@ -1,7 +1,8 @@
 from uuid import UUID, uuid4
+from datetime import datetime
 from decimal import Decimal
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import ForeignKey, Uuid, Integer, Numeric, select, func, UniqueConstraint, String
+from sqlalchemy import ForeignKey, Uuid, Integer, Numeric, DateTime, Index, UniqueConstraint, String, text
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.ext.hybrid import hybrid_property
 
@@ -15,48 +16,16 @@ class Cart(TimestampMixin, Base):
     id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), default=uuid4, primary_key=True)
     user_id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True, comment="Owner user ID")
     
-    @hybrid_property
-    def unique_items(self) -> int:
-        return len(self.items)
-
-    @unique_items.expression
-    @classmethod
-    def unique_items_expr(cls):
-        return (
-            select(func.coalesce(func.count(CartItem.product_id), 0))
-            .where(CartItem.cart_id == cls.id)
-            .label("unique_items")
-        )
-    
-    @hybrid_property
-    def total_items(self) -> int:
-        return sum(i.quantity for i in self.items)
-
-    @total_items.expression
-    @classmethod
-    def total_items_expr(cls):
-        return (
-            select(func.coalesce(func.sum(CartItem.quantity), 0))
-            .where(CartItem.cart_id == cls.id)
-            .label("total_items")
-        )
-        
-    @hybrid_property
-    def total_amount(self) -> float:
-        return sum(i.total_price for i in self.items)
-
-    @total_amount.expression
-    @classmethod
-    def total_amount_expr(cls):
-        return (
-            select(func.coalesce(func.sum(CartItem.total_price), 0))
-            .where(CartItem.cart_id == cls.id)
-            .label("total_amount")
-        )
+    # Maintained by the cart item statements in `CartItemInterface`, in the same statement as the item change
+    unique_items: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0', comment="Number of distinct lines")
+    total_items: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0', comment="Sum of line quantities")
+    total_amount: Mapped[float] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0, server_default='0', comment="Sum of line totals (USD)"
+    )
 
     # Relationships
     items: Mapped[list["CartItem"]] = relationship(back_populates="cart", cascade="all, delete-orphan", lazy="selectin")
-    user: Mapped["User"] = relationship(lazy="selectin")  # type: ignore
+    user: Mapped["User"] = relationship(lazy="raise")  # type: ignore
 
 
 class CartItem(TimestampMixin, Base):
@@ -74,6 +43,9 @@ class CartItem(TimestampMixin, Base):
 
     quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=1, comment="Quantity of this product")
     unit_price: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False, comment="Price per unit when added to cart (USD)")
+    reserved_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, comment="Stock for `quantity` is held until then; NULL once released"
+    )
 
     @hybrid_property
     def total_price(self) -> float:
@@ -88,10 +60,16 @@ class CartItem(TimestampMixin, Base):
     cart: Mapped[Cart] = relationship(back_populates="items", lazy="selectin")
     product: Mapped["Product"] = relationship(lazy="selectin")  # type: ignore
     
-    table_args = (
+    __table_args__ = (
         UniqueConstraint(
             "cart_id",
             "product_id",
             name="uix_cart_item_unique"
         ),
+        # Reservation sweeper: only live holds are indexed
+        Index(
+            "ix_cart_items_reserved_until",
+            "reserved_until",
+            postgresql_where=text("reserved_until IS NOT NULL"),
+        ),
     )
@@ -0,0 +1,18 @@
+import json
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def estimate_count(session: AsyncSession, stmt: Select) -> int:
+    """
+    Row count the planner expects for `stmt`, from `EXPLAIN` only: nothing is
+    scanned, accuracy is that of the table statistics.
+    """
+    conn = await session.connection()
+    sql = stmt.compile(dialect=conn.dialect, compile_kwargs={'literal_binds': True})
+    # Sent as-is: a `text()` wrapper would parse `:word` inside search literals as bind params
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    raw = result.scalar()
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return int(plan[0]['Plan']['Plan Rows'])
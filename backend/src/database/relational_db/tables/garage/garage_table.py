@@ -1,6 +1,6 @@
 from uuid import UUID, uuid4
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import ForeignKey, Uuid, String, Integer, ForeignKeyConstraint
+from sqlalchemy import ForeignKey, Uuid, String, Integer, ForeignKeyConstraint, Index
 from sqlalchemy.dialects.postgresql import JSONB
 
 from ..table_base import Base
@@ -30,10 +30,10 @@ class GarageVehicle(TimestampMixin, Base):
     vin_decoded: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     comment: Mapped[str | None] = mapped_column(String, nullable=True)
     
-    user: Mapped["User"] = relationship(back_populates="garage", lazy="selectin") # type: ignore
+    user: Mapped["User"] = relationship(back_populates="garage", lazy="raise") # type: ignore
     make: Mapped["Make"] = relationship(lazy="selectin") # type: ignore
     model: Mapped["Model"] = relationship(lazy="selectin") # type: ignore
-    model_year: Mapped["ModelYear"] = relationship(lazy="selectin") # type: ignore
+    model_year: Mapped["ModelYear"] = relationship(lazy="raise") # type: ignore
     vehicle_type: Mapped["VehicleType"] = relationship(lazy="selectin") # type: ignore
 
     __table_args__ = (
@@ -43,4 +43,6 @@ class GarageVehicle(TimestampMixin, Base):
             name='fk_garage_model_year',
             ondelete='CASCADE'
         ),
+        # Keyset pagination of a user's garage
+        Index('ix_garage_vehicles_user_created', 'user_id', 'created_at', 'id'),
     )
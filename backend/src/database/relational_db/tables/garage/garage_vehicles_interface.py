@@ -1,15 +1,27 @@
 from uuid import UUID
-from datetime import datetime
-from sqlalchemy import select, or_, func, and_, delete, update
+from sqlalchemy import select, or_, delete, update
+from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .garage_table import GarageVehicle
 from ..makes.makes_table import Make
 from ..models.models_table import Model
 from ..vehicles.vehicle_types_table import VehicleType
+from ..loader_profiles import LoaderProfiles
+from ..keyset import Keyset
 
 
 class GarageVehiclesInterface:
+    profiles = LoaderProfiles(
+        # `VehilceModel` shape
+        detail=lambda: (
+            joinedload(GarageVehicle.make),
+            joinedload(GarageVehicle.model),
+            joinedload(GarageVehicle.vehicle_type),
+        ),
+    )
+    newest = Keyset('garage:new', GarageVehicle.created_at, GarageVehicle.id)
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -21,9 +33,8 @@ class GarageVehiclesInterface:
         search: str | None = None,
         make_id: int | None = None,
         model_id: int | None = None,
-        cursor_created_at: datetime | None = None,
-        cursor_id: UUID | None = None,
-    ) -> list[GarageVehicle]:
+        cursor: str | None = None,
+    ) -> tuple[list[GarageVehicle], str | None]:
         stmt = (
             select(GarageVehicle)
             .where(GarageVehicle.user_id == user_id)
@@ -50,28 +61,16 @@ class GarageVehiclesInterface:
                 )
             )
         
-        if cursor_created_at is not None and cursor_id is not None:
-            stmt = stmt.where(
-                or_(
-                    GarageVehicle.created_at < cursor_created_at,
-                    and_(GarageVehicle.created_at == cursor_created_at, GarageVehicle.id < cursor_id),
-                )
-            )
-        
-        stmt = stmt.order_by(
-            func.char_length(Make.make_name),
-            GarageVehicle.created_at.desc(), 
-            GarageVehicle.id.desc()
-        ).limit(limit)
+        stmt = self.newest.paginate(stmt, cursor, limit).options(*self.profiles('detail'))
         
-        rows = await self.session.scalars(stmt)
-        return list(rows.all())
+        rows = list((await self.session.scalars(stmt)).all())
+        return rows, self.newest.next_cursor(rows, limit)
 
     async def add(self, vehicle: GarageVehicle) -> None:
         self.session.add(vehicle)
     
     async def get_by_id(self, id: UUID | str) -> GarageVehicle | None:
-        return await self.session.get(GarageVehicle, id)
+        return await self.session.get(GarageVehicle, id, options=self.profiles('detail'))
 
     async def delete(self, vehicle_id: UUID | str) -> GarageVehicle | None:
         result = await self.session.execute(
@@ -0,0 +1,104 @@
+import hmac
+import json
+
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Sequence
+from uuid import UUID
+from sqlalchemy import Select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.config import Settings
+
+config = Settings() # pyright: ignore[reportCallIssue]
+_KEY = hmac.new(config.CSRF_HMAC_KEY, b'keyset-cursor', 'sha256').digest()
+
+_DECODERS: dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.fromisoformat,
+    UUID: UUID,
+    Decimal: Decimal,
+    float: float,
+    int: int,
+    str: str,
+}
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _b64(data: bytes) -> str:
+    return urlsafe_b64encode(data).rstrip(b'=').decode()
+
+def _unb64(data: str) -> bytes:
+    return urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+class Keyset:
+    """
+    Keyset (seek) pagination over an ordered tuple of columns, last one unique.
+
+    The page predicate is a single row-value comparison, `(a, b) < (:a, :b)`,
+    which Postgres turns into one range scan on a composite index of the same
+    columns in the same order, so all keys share one direction.
+    Cursors are opaque: the last row's key values as compact JSON, signed with
+    the keyset name so a cursor is only accepted by the listing that issued it.
+    """
+    def __init__(self, name: str, *columns: ColumnElement, descending: bool = True):
+        self.name = name
+        self.columns = columns
+        self.descending = descending
+        self._decoders = tuple(_DECODERS[column.type.python_type] for column in columns)
+
+    def _sign(self, body: bytes) -> bytes:
+        return hmac.new(_KEY, self.name.encode() + b'|' + body, 'sha256').digest()[:12]
+
+    def encode(self, *values: Any) -> str:
+        body = json.dumps(
+            [v.isoformat() if isinstance(v, datetime) else v for v in values],
+            separators=(',', ':'),
+            default=str,
+        ).encode()
+        return f"{_b64(body)}.{_b64(self._sign(body))}"
+
+    def decode(self, cursor: str) -> tuple:
+        try:
+            body_part, sig_part = cursor.split('.', 1)
+            body = _unb64(body_part)
+            if not hmac.compare_digest(_unb64(sig_part), self._sign(body)):
+                raise InvalidCursor('Bad cursor signature')
+            values = json.loads(body)
+            if len(values) != len(self._decoders):
+                raise InvalidCursor('Cursor does not match this listing')
+            return tuple(decode(value) for decode, value in zip(self._decoders, values))
+        except InvalidCursor:
+            raise
+        except Exception as e:
+            raise InvalidCursor('Malformed cursor') from e
+
+    def paginate(self, stmt: Select, cursor: str | None, limit: int) -> Select:
+        """Apply order, seek predicate and limit. Raises `InvalidCursor`."""
+        if cursor:
+            after = tuple_(*self.decode(cursor))
+            keys = tuple_(*self.columns)
+            stmt = stmt.where(keys < after if self.descending else keys > after)
+        
+        return stmt.order_by(
+            *(column.desc() if self.descending else column.asc() for column in self.columns)
+        ).limit(limit)
+
+    def next_cursor(
+        self,
+        rows: Sequence,
+        limit: int,
+        values: Callable[[Any], tuple] | None = None,
+    ) -> str | None:
+        """Cursor after the last row, None when the page wasn't full.
+        By default key values are read from same-named attributes of the row."""
+        if len(rows) < limit:
+            return None
+        last = rows[-1]
+        if values is not None:
+            return self.encode(*values(last))
+        return self.encode(*(getattr(last, column.key) for column in self.columns))
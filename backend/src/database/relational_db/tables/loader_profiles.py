@@ -0,0 +1,23 @@
+from typing import Callable
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import ORMOption
+
+
+class LoaderProfiles:
+    """
+    Named relationship loading strategies for repository queries.
+
+    Each profile is a factory returning the loader options a call site opts into
+    (``selectinload``/``joinedload``). Everything else is covered by ``raiseload('*')``,
+    so an attribute nobody asked for raises instead of silently fanning out.
+    """
+    def __init__(self, **profiles: Callable[[], tuple[ORMOption, ...]]):
+        self._profiles = profiles
+
+    def __call__(self, profile: str) -> tuple[ORMOption, ...]:
+        try:
+            factory = self._profiles[profile]
+        except KeyError:
+            raise ValueError(f"Unknown loader profile: {profile}")
+
+        return (*factory(), raiseload('*'))
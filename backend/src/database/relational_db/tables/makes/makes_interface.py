@@ -1,3 +1,5 @@
+import builtins
+
 from sqlalchemy import select, func, case, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -45,3 +47,8 @@ class MakesInterface:
         stmt = stmt.limit(limit)
         rows = await self.session.scalars(stmt)
         return list(rows.all())
+    
+    async def all_names(self) -> builtins.list[tuple[int, str]]:
+        """Every `(make_id, make_name)` pair, for the in-memory reference store"""
+        rows = await self.session.execute(select(Make.make_id, Make.make_name))
+        return [tuple(row) for row in rows]
@@ -1,8 +1,9 @@
 from sqlalchemy.orm import mapped_column, Mapped
-from sqlalchemy import String, Integer, Index
+from sqlalchemy import String, Integer, Index, text
 
 from ..table_base import Base
 from ..mixins import TimestampMixin
+from ..search import SEARCH_CONFIG
 
 
 class Make(TimestampMixin, Base):
@@ -19,4 +20,9 @@ class Make(TimestampMixin, Base):
             postgresql_using='gin',
             postgresql_ops={'make_name': 'gin_trgm_ops'}
         ),
+        Index(
+            'ix_makes_name_tsv',
+            text(f"to_tsvector('{SEARCH_CONFIG}', make_name)"),
+            postgresql_using='gin',
+        ),
     )
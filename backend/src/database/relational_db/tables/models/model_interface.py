@@ -1,3 +1,5 @@
+import builtins
+
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,3 +41,8 @@ class ModelsInterface:
         stmt = stmt.limit(limit)
         rows = await self.session.scalars(stmt)
         return list(rows.all())
+    
+    async def all_names(self) -> builtins.list[tuple[int, int, str]]:
+        """Every `(model_id, make_id, model_name)` row, for the in-memory reference store"""
+        rows = await self.session.execute(select(Model.model_id, Model.make_id, Model.model_name))
+        return [tuple(row) for row in rows]
@@ -26,6 +26,17 @@ class YearsInterface:
         rows = await self.session.scalars(stmt)
         return list(rows.all())
     
+    async def all_years(self) -> dict[int, tuple[int, ...]]:
+        """Years of every model, newest first, for the in-memory reference store"""
+        rows = await self.session.execute(
+            select(ModelYear.model_id, ModelYear.year)
+            .order_by(ModelYear.model_id, ModelYear.year.desc())
+        )
+        years: dict[int, list[int]] = {}
+        for model_id, year in rows:
+            years.setdefault(model_id, []).append(year)
+        return {model_id: tuple(values) for model_id, values in years.items()}
+    
     # async def list(
     #     self,
     #     model_id: int,
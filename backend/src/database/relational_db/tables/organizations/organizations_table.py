@@ -24,8 +24,8 @@ class Organization(CreatedAtMixin, Base):
     
     # Minimal Stripe linkage kept for UI flows only
     
-    owner: Mapped["User"] = relationship(back_populates="organization", lazy="selectin") # type: ignore
-    products: Mapped[list["Product"]] = relationship(back_populates="organization", lazy="selectin") # type: ignore
+    owner: Mapped["User"] = relationship(back_populates="organization", lazy="raise") # type: ignore
+    products: Mapped[list["Product"]] = relationship(back_populates="organization", lazy="raise") # type: ignore
 
     __table_args__ = (
         Index(
@@ -1,5 +1,6 @@
-from .products_table import Product, ProductMedia
-from .products_interface import ProductsInterface
+from .products_table import Product, ProductMedia, normalize_part_number
+from .cross_references_table import PartCrossReference
+from .products_interface import ProductsInterface, ProductProfile
 from .media_interface import ProductMediaInterface
 
 
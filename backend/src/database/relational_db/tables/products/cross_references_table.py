@@ -0,0 +1,26 @@
+from uuid import UUID, uuid4
+from sqlalchemy.orm import mapped_column, Mapped
+from sqlalchemy import String, Uuid, CheckConstraint, UniqueConstraint, Index
+
+from ..table_base import Base
+from ..mixins import CreatedAtMixin
+
+
+class PartCrossReference(CreatedAtMixin, Base):
+    """
+    Interchangeable part numbers (OEM <-> aftermarket), stored as normalized keys.
+    A pair is stored once and is looked up in both directions.
+    """
+    __tablename__ = "part_cross_references"
+
+    id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), default=uuid4, primary_key=True)
+    part_number_key: Mapped[str] = mapped_column(String(collation='C'), nullable=False, comment="Normalized part number")
+    equivalent_key: Mapped[str] = mapped_column(String(collation='C'), nullable=False, comment="Normalized interchangeable part number")
+    source: Mapped[str | None] = mapped_column(String, nullable=True, comment="Where the equivalence comes from (catalog, supplier)")
+
+    __table_args__ = (
+        CheckConstraint(part_number_key != equivalent_key, name="ck_part_xref_distinct"),
+        UniqueConstraint(part_number_key, equivalent_key, name="uq_part_xref_pair"),
+        # The unique constraint covers lookups by `part_number_key`
+        Index("ix_part_xref_equivalent_key", equivalent_key),
+    )
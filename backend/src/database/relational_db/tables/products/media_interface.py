@@ -1,5 +1,5 @@
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, insert, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .products_table import ProductMedia
@@ -16,6 +16,35 @@ class ProductMediaInterface:
         self.session.add(media)
         return media
 
+    async def add_many(
+        self,
+        product_id: UUID | str,
+        items: list[tuple[str, str | None, str | None]],
+    ) -> list[ProductMedia]:
+        """Insert several `(url, storage_key, alt)` media rows in one statement"""
+        rows = await self.session.scalars(
+            insert(ProductMedia).returning(ProductMedia, sort_by_parameter_order=True),
+            [{"product_id": product_id, "url": url, "storage_key": key, "alt": alt} for url, key, alt in items],
+        )
+        return list(rows.all())
+
+    async def referenced_keys(self, keys: list[str]) -> set[str]:
+        """Which of `keys` some media row points at"""
+        if not keys:
+            return set()
+        rows = await self.session.scalars(
+            select(ProductMedia.storage_key).where(ProductMedia.storage_key.in_(keys)).distinct()
+        )
+        return set(rows.all())
+
+    async def count_unkeyed(self, url_prefix: str) -> int:
+        """Rows served under `url_prefix` whose `storage_key` was never filled in"""
+        return await self.session.scalar(
+            select(func.count())
+            .select_from(ProductMedia)
+            .where(ProductMedia.storage_key.is_(None), ProductMedia.url.startswith(url_prefix, autoescape=True))
+        ) or 0
+
     async def list_by_product(self, product_id: UUID | str) -> list[ProductMedia]:
         """Get all media files for product"""
         rows = await self.session.scalars(select(ProductMedia).where(ProductMedia.product_id == product_id))
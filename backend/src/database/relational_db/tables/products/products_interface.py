@@ -1,47 +1,102 @@
 from uuid import UUID
-from datetime import datetime
-from sqlalchemy import select, func, or_, and_
-from sqlalchemy.orm import selectinload
+from typing import Literal
+from sqlalchemy import select, update, func, or_, and_, case, literal, type_coerce, Float, union
+from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domain.products import ProductStatus, ProductCondition, ProductOriginality
-from .products_table import Product
+from domain.products import ProductStatus, ProductCondition, ProductOriginality, ProductSort
+from .products_table import Product, ProductMedia, normalize_part_number
+from .cross_references_table import PartCrossReference
 from ..makes import Make
+from ..organizations.organizations_table import Organization
+from ..loader_profiles import LoaderProfiles
+from ..search import prefix_tsquery, tsvector
+from ..keyset import Keyset
+from ..counting import estimate_count
+
+ProductProfile = Literal['bare', 'card', 'detail']
 
 
 class ProductsInterface:
     """Interface for working with products in database"""
     
+    # Backed by ix_products_status_created / ix_products_status_price
+    keysets = {
+        ProductSort.NEW: Keyset('products:new', Product.created_at, Product.id),
+        ProductSort.PRICE_ASC: Keyset('products:price-asc', Product.price, Product.id, descending=False),
+        ProductSort.PRICE_DESC: Keyset('products:price-desc', Product.price, Product.id),
+    }
+    
+    profiles = LoaderProfiles(
+        # Columns only: stock checks, status changes
+        bare=lambda: (),
+        # `ProductBrief` shape: brand and photos
+        card=lambda: (
+            joinedload(Product.make),
+            selectinload(Product.media),
+        ),
+        # `ProductModel` shape: brand, photos and seller
+        detail=lambda: (
+            joinedload(Product.make),
+            joinedload(Product.organization),
+            selectinload(Product.media),
+        ),
+    )
+    
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @staticmethod
+    def _card_select():
+        """
+        `ProductCard` projection: plain columns plus the first photo through an
+        index-backed scalar subquery. Rows, not entities: nothing to hydrate or load.
+        """
+        photo_url = (
+            select(ProductMedia.url)
+            .where(ProductMedia.product_id == Product.id)
+            .order_by(ProductMedia.created_at, ProductMedia.id)
+            .limit(1)
+            .correlate(Product)
+            .scalar_subquery()
+        )
+        return (
+            select(
+                Product.id,
+                Product.title,
+                Product.price,
+                Product.condition,
+                Product.created_at,
+                Make.make_name,
+                Organization.name.label('seller_name'),
+                photo_url.label('photo_url'),
+            )
+            .join(Make, Make.make_id == Product.make_id)
+            .join(Organization, Organization.id == Product.org_id)
+        )
+
     async def add(self, product: Product) -> Product:
         """Add new product to session"""
         self.session.add(product)
         return product
 
-    async def get_by_id(self, id: UUID | str) -> Product | None:
+    async def get_by_id(self, id: UUID | str, profile: ProductProfile = 'detail') -> Product | None:
         """Get product by ID"""
         return await self.session.scalar(
             select(Product)
             .where(Product.id == id)
+            .options(*self.profiles(profile))
         )
 
-    async def list_by_org(
-        self,
+    @staticmethod
+    def _org_filters(
+        stmt,
         org_id: UUID | str,
         *,
-        offset: int = 0,
-        limit: int = 20,
         status: ProductStatus | None = None,
         search: str | None = None,
-    ) -> tuple[list[Product], int]:
-        """Get organization products list with filters and pagination"""
-        stmt = (
-            select(Product)
-            .join(Product.make)
-            .where(Product.org_id == org_id)
-        )
+    ):
+        stmt = stmt.where(Product.org_id == org_id)
         
         # Filter by status
         if status is not None:
@@ -50,7 +105,7 @@ class ProductsInterface:
         # Text search (make, part number, description)
         if search:
             pattern = f"%{search}%"
-            stmt = stmt.where(
+            stmt = stmt.join(Product.make).where(
                 or_(
                     Make.make_name.ilike(pattern),
                     Product.part_number.ilike(pattern),
@@ -58,72 +113,75 @@ class ProductsInterface:
                 )
             )
         
-        # Count total items
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = await self.session.scalar(count_stmt)
-        
-        # Pagination and sorting
-        stmt = stmt.order_by(Product.created_at.desc()).offset(offset).limit(limit)
-        rows = await self.session.scalars(stmt)
-        
-        return list(rows.all()), int(total or 0)
+        return stmt
 
-    async def get_feed_products_cursor(
+    async def list_by_org(
         self,
+        org_id: UUID | str,
         *,
+        offset: int = 0,
         limit: int = 20,
-        cursor_created_at: datetime | None = None,
-        cursor_id: UUID | None = None,
+        status: ProductStatus | None = None,
+        search: str | None = None,
     ) -> list[Product]:
-        """Get products for feed using cursor pagination (same pattern as admin users)"""
+        """Get organization products page with filters, counting is up to `count_by_org`"""
         stmt = (
-            select(Product)
-            .where(Product.status == ProductStatus.PUBLISHED)
+            self._org_filters(select(Product), org_id, status=status, search=search)
+            .order_by(Product.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+            .options(*self.profiles('detail'))
         )
-        
-        # Cursor pagination (created_at desc, id desc) - same as admin users
-        if cursor_created_at is not None and cursor_id is not None:
-            stmt = stmt.where(
-                or_(
-                    Product.created_at < cursor_created_at,
-                    and_(Product.created_at == cursor_created_at, Product.id < cursor_id),
-                )
-            )
-        
-        stmt = stmt.order_by(Product.created_at.desc(), Product.id.desc()).limit(limit)
         rows = await self.session.scalars(stmt)
         return list(rows.all())
 
-    async def search_published_products_cursor(
+    async def count_by_org(
         self,
+        org_id: UUID | str,
         *,
-        limit: int = 20,
+        status: ProductStatus | None = None,
         search: str | None = None,
+        estimate: bool = False,
+    ) -> int:
+        """Exact count (index-only on ix_products_org_status without search) or planner estimate"""
+        stmt = self._org_filters(select(Product.id), org_id, status=status, search=search)
+        if estimate:
+            return await estimate_count(self.session, stmt)
+        return int(await self.session.scalar(select(func.count()).select_from(stmt.subquery())) or 0)
+
+    async def get_feed_products_cursor(
+        self,
+        *,
+        limit: int = 20,
+        cursor: str | None = None,
+        cards: bool = False,
+    ) -> tuple[list, str | None]:
+        """Newest published products (entities, or `ProductCard` rows with `cards`), keyset paginated"""
+        keyset = self.keysets[ProductSort.NEW]
+        stmt = keyset.paginate(
+            (self._card_select() if cards else select(Product).options(*self.profiles('detail')))
+            .where(Product.status == ProductStatus.PUBLISHED),
+            cursor,
+            limit,
+        )
+        
+        if cards:
+            rows = list((await self.session.execute(stmt)).all())
+        else:
+            rows = list((await self.session.scalars(stmt)).all())
+        return rows, keyset.next_cursor(rows, limit)
+
+    @staticmethod
+    def _published_filters(
+        stmt,
+        *,
         make_id: int | None = None,
         condition: ProductCondition | None = None,
         originality: ProductOriginality | None = None,
         price_min: float | None = None,
         price_max: float | None = None,
-        cursor_created_at: datetime | None = None,
-        cursor_id: UUID | None = None,
-    ) -> list[Product]:
-        """Search published products with cursor pagination"""
-        stmt = (
-            select(Product)
-            .join(Product.make)
-            .where(Product.status == ProductStatus.PUBLISHED)
-        )
-        
-        if search:
-            pattern = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    Make.make_name.ilike(pattern),
-                    Product.part_number.ilike(pattern),
-                    Product.description.ilike(pattern),
-                    Product.title.ilike(pattern),
-                )
-            )
+    ):
+        stmt = stmt.where(Product.status == ProductStatus.PUBLISHED)
         
         if make_id:
             stmt = stmt.where(Product.make_id == make_id)
@@ -139,15 +197,128 @@ class ProductsInterface:
         if price_max is not None:
             stmt = stmt.where(Product.price <= price_max)
         
-        if cursor_created_at is not None and cursor_id is not None:
-            stmt = stmt.where(
-                or_(
-                    Product.created_at < cursor_created_at,
-                    and_(Product.created_at == cursor_created_at, Product.id < cursor_id),
-                )
+        return stmt
+
+    def _match(self, search: str):
+        """
+        Search predicate and relevance score for `search`, None if nothing is searchable.
+        
+        A product matches if its weighted document matches every word as a prefix,
+        its make name does, or its normalized part number starts with the query.
+        Each branch is index-backed, so Postgres can BitmapOr them instead of
+        scanning. Rank: `ts_rank` + 0.2 for a make hit + 1.0 / 0.5 for an
+        exact / prefix part-number hit.
+        """
+        query = prefix_tsquery(search)
+        key = normalize_part_number(search)
+        if query is None and not key:
+            return None
+        
+        matches = []
+        rank = literal(0.0, Float)
+        if query is not None:
+            matching_makes = select(Make.make_id).where(tsvector(Make.make_name).op('@@')(query))
+            make_hit = Product.make_id.in_(matching_makes)
+            matches += [Product.search_vector.op('@@')(query), make_hit]
+            rank = rank + func.ts_rank(Product.search_vector, query) + case((make_hit, 0.2), else_=0.0)
+        if key:
+            # `C` collation makes the prefix an index range: key <= pn < key with last char bumped
+            prefix_hit = and_(
+                Product.part_number_key >= key,
+                Product.part_number_key < key[:-1] + chr(ord(key[-1]) + 1),
+            )
+            matches.append(prefix_hit)
+            rank = rank + case(
+                (Product.part_number_key == key, 1.0),
+                (prefix_hit, 0.5),
+                else_=0.0,
+            )
+        
+        return or_(*matches), type_coerce(rank, Float).label('rank')
+
+    async def search_published_products_cursor(
+        self,
+        *,
+        limit: int = 20,
+        search: str | None = None,
+        sort: ProductSort | None = None,
+        cursor: str | None = None,
+        make_id: int | None = None,
+        condition: ProductCondition | None = None,
+        originality: ProductOriginality | None = None,
+        price_min: float | None = None,
+        price_max: float | None = None,
+        cards: bool = False,
+    ) -> tuple[list, str | None]:
+        """
+        Search published products with keyset pagination. With a query the
+        default order is relevance, otherwise newest first. Returns entities,
+        or `ProductCard` rows with `cards`.
+        """
+        match = self._match(search) if search else None
+        if search and match is None:
+            return [], None
+        
+        stmt = self._published_filters(
+            self._card_select() if cards else select(Product).options(*self.profiles('detail')),
+            make_id=make_id,
+            condition=condition,
+            originality=originality,
+            price_min=price_min,
+            price_max=price_max,
+        )
+        
+        if match is not None:
+            predicate, rank = match
+            stmt = stmt.where(predicate)
+            
+            if sort in (None, ProductSort.RELEVANCE):
+                keyset = Keyset('products:relevance', rank, Product.id)
+                stmt = keyset.paginate(stmt.add_columns(rank), cursor, limit)
+                rows = (await self.session.execute(stmt)).all()
+                if cards:
+                    return list(rows), keyset.next_cursor(rows, limit)
+                next_cursor = keyset.next_cursor(rows, limit, lambda row: (row[1], row[0].id))
+                return [product for product, _ in rows], next_cursor
+        
+        keyset = self.keysets.get(sort or ProductSort.NEW, self.keysets[ProductSort.NEW])
+        stmt = keyset.paginate(stmt, cursor, limit)
+        if cards:
+            rows = list((await self.session.execute(stmt)).all())
+        else:
+            rows = list((await self.session.scalars(stmt)).all())
+        return rows, keyset.next_cursor(rows, limit)
+
+    async def list_by_part_number(
+        self,
+        key: str,
+        *,
+        limit: int = 50,
+        include_equivalents: bool = True,
+    ) -> list[Product]:
+        """
+        Published products whose normalized part number equals `key`, plus
+        listings of cross-referenced equivalents. Every branch is an index probe.
+        """
+        keys = select(literal(key).label('key'))
+        if include_equivalents:
+            keys = union(
+                keys,
+                select(PartCrossReference.equivalent_key).where(PartCrossReference.part_number_key == key),
+                select(PartCrossReference.part_number_key).where(PartCrossReference.equivalent_key == key),
             )
         
-        stmt = stmt.order_by(Product.created_at.desc(), Product.id.desc()).limit(limit)
+        stmt = (
+            select(Product)
+            .where(
+                Product.part_number_key.in_(select(keys.subquery().c[0])),
+                Product.status == ProductStatus.PUBLISHED,
+            )
+            # Exact matches first, then equivalents
+            .order_by((Product.part_number_key == key).desc(), Product.price, Product.id)
+            .limit(limit)
+            .options(*self.profiles('detail'))
+        )
         rows = await self.session.scalars(stmt)
         return list(rows.all())
 
@@ -157,7 +328,7 @@ class ProductsInterface:
         offset: int = 0,
         limit: int = 20,
     ) -> tuple[list[Product], int]:
-        """Get products for feed (trending/popular products)"""
+        """Get products for feed (trending/popular products), total is a planner estimate"""
         # Simple implementation: latest published products
         # Later: add popularity scoring, user preferences, etc.
         stmt = (
@@ -166,25 +337,54 @@ class ProductsInterface:
             .order_by(Product.created_at.desc())
             .offset(offset)
             .limit(limit)
+            .options(*self.profiles('detail'))
         )
         
         rows = await self.session.scalars(stmt)
+        total = await estimate_count(self.session, select(Product.id).where(Product.status == ProductStatus.PUBLISHED))
         
-        # Count total published products
-        count_stmt = select(func.count()).where(Product.status == ProductStatus.PUBLISHED)
-        total = await self.session.scalar(count_stmt)
-        
-        return list(rows.all()), int(total or 0)
+        return list(rows.all()), total
 
     async def update_fields(self, id: UUID | str, **updates) -> None:
         """Update product fields"""
-        product = await self.get_by_id(id)
+        product = await self.get_by_id(id, profile='bare')
         if product is None:
             return
         for key, value in updates.items():
             setattr(product, key, value)
         await self.session.flush()
 
+    async def reserve_stock(self, id: UUID | str, quantity: int) -> bool:
+        """
+        Hold `quantity` units of a published product if that many are still free.
+        
+        The availability check and the increment are one conditional UPDATE, so
+        concurrent holds serialize on the row lock and can never oversell.
+        """
+        held = await self.session.scalar(
+            update(Product)
+            .where(
+                Product.id == id,
+                Product.status == ProductStatus.PUBLISHED,
+                Product.quantity_on_hand - Product.quantity_reserved >= quantity,
+            )
+            .values(quantity_reserved=Product.quantity_reserved + quantity)
+            .returning(Product.id)
+            .execution_options(synchronize_session=False)
+        )
+        return held is not None
+
+    async def release_stock(self, holds: dict[UUID, int]) -> None:
+        """Give held units back, `{product_id: quantity}`"""
+        # Fixed lock order across concurrent releases
+        for product_id in sorted(holds):
+            await self.session.execute(
+                update(Product)
+                .where(Product.id == product_id)
+                .values(quantity_reserved=func.greatest(Product.quantity_reserved - holds[product_id], 0))
+                .execution_options(synchronize_session=False)
+            )
+
     async def delete(self, id: UUID | str) -> None:
         """Delete product"""
         product = await self.get_by_id(id)
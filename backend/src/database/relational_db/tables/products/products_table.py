@@ -1,11 +1,17 @@
 from uuid import UUID, uuid4
-from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import String, ForeignKey, Uuid, Text, Numeric, Integer, Boolean, CheckConstraint, Index, or_, false, and_
-from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy.orm import mapped_column, Mapped, relationship, validates
+from sqlalchemy import String, ForeignKey, Uuid, Text, Numeric, Integer, Boolean, CheckConstraint, Index, Computed, or_, false, and_
+from sqlalchemy.dialects.postgresql import ENUM, TSVECTOR
 
 from domain.products import ProductStatus, ProductCondition, ProductOriginality, StockType
 from ..table_base import Base
 from ..mixins import TimestampMixin, CreatedAtMixin
+from ..search import SEARCH_CONFIG
+
+
+def normalize_part_number(part_number: str) -> str:
+    """`04465-33450`, `0446533450` and `04465 33450` all map to `0446533450`"""
+    return ''.join(ch for ch in part_number if ch.isalnum()).upper()
 
 
 class Product(TimestampMixin, Base):
@@ -20,11 +26,17 @@ class Product(TimestampMixin, Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True, comment="Product listing description")
     
     part_number: Mapped[str] = mapped_column(String, nullable=False, index=True, comment="Part number (OEM or aftermarket)")
+    part_number_key: Mapped[str] = mapped_column(
+        String(collation='C'), nullable=False, index=True, comment="Normalized part number for exact/prefix lookups"
+    )
     price: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False, comment="Price in USD")
     
     stock_type: Mapped[StockType] = mapped_column(ENUM(StockType, name="product_stock_type"), nullable=False, comment="Part stock type")
     quantity_original: Mapped[int] = mapped_column(Integer, nullable=False, comment="Original part stock quantity")
     quantity_on_hand: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="Part stock quantity on hand")
+    quantity_reserved: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default='0', comment="Units held by live cart reservations"
+    )
     
     condition: Mapped[ProductCondition] = mapped_column(ENUM(ProductCondition, name="product_condition"), nullable=False, comment="Part condition")
     originality: Mapped[ProductOriginality] = mapped_column(ENUM(ProductOriginality, name="product_originality"), nullable=False, comment="Part originality")
@@ -35,12 +47,29 @@ class Product(TimestampMixin, Base):
     )
     allow_cart: Mapped[bool] = mapped_column(Boolean, nullable=False, comment="Allow adding to cart")
     allow_chat: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, comment="Allow chat with seller")
+    
+    # Weighted search document: title > part number > description (make is matched via `makes`)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(part_number, '')), 'B') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'D')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Relationships
     media: Mapped[list["ProductMedia"]] = relationship(back_populates="product", cascade="all, delete-orphan", lazy="selectin")
     organization: Mapped["Organization"] = relationship(lazy="selectin") # type: ignore
     make: Mapped["Make"] = relationship(lazy="selectin") # type: ignore
 
+    @validates('part_number')
+    def _sync_part_number_key(self, _, value: str) -> str:
+        self.part_number_key = normalize_part_number(value)
+        return value
+
     __table_args__ = (
         CheckConstraint(price >= 0, name="ck_products_price_nonnegative"),
         CheckConstraint(
@@ -51,6 +80,7 @@ class Product(TimestampMixin, Base):
             and_(quantity_original >= 0, quantity_on_hand >= 0),
             name="ck_products_qty_nonnegative",
         ),
+        CheckConstraint(quantity_reserved >= 0, name="ck_products_reserved_nonnegative"),
         CheckConstraint(
             or_(
                 stock_type != StockType.UNIQUE,
@@ -68,6 +98,11 @@ class Product(TimestampMixin, Base):
         ),
 
         Index("ix_products_org_status", org_id, status),
+        Index("ix_products_make_id", make_id),
+        # Keyset pagination: equality on status, then a range over the sort keys
+        Index("ix_products_status_created", "status", "created_at", "id"),
+        Index("ix_products_status_price", "status", "price", "id"),
+        Index("ix_products_search_vector", search_vector, postgresql_using='gin'),
         Index(
             'ix_products_title_trgm',
             'title',
@@ -97,6 +132,14 @@ class ProductMedia(CreatedAtMixin, Base):
     product_id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("products.id"), nullable=False, comment="Product ID")
 
     url: Mapped[str] = mapped_column(String, nullable=False, comment="Media file URL")
+    storage_key: Mapped[str | None] = mapped_column(String, nullable=True, comment="Blob key in media storage")
     alt: Mapped[str | None] = mapped_column(String, nullable=True, comment="Alternative text")
 
     product: Mapped[Product] = relationship(back_populates="media")
+
+    __table_args__ = (
+        # Media per product in upload order: first photo for cards, selectin loads
+        Index("ix_product_media_product_created", product_id, "created_at"),
+        # Reference lookups for shared content-addressed blobs
+        Index("ix_product_media_storage_key", storage_key),
+    )
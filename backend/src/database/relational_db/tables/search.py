@@ -0,0 +1,24 @@
+import re
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+# Text search configuration: part numbers and brand names must not be stemmed
+SEARCH_CONFIG = 'simple'
+
+_WORD = re.compile(r'\w+')
+
+
+def prefix_tsquery(search: str) -> ColumnElement | None:
+    """
+    `to_tsquery` where every word of `search` is a prefix term, AND-ed together:
+    "toyota brak" -> 'toyota:* & brak:*'. None when nothing searchable is left.
+    """
+    words = _WORD.findall(search.lower())
+    if not words:
+        return None
+    return func.to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), ' & '.join(f'{w}:*' for w in words))
+
+
+def tsvector(column) -> ColumnElement:
+    return func.to_tsvector(literal_column(f"'{SEARCH_CONFIG}'"), column)
@@ -6,7 +6,8 @@ class Base(DeclarativeBase):
         cls_name = self.__class__.__name__
         column_names = self.__mapper__.columns.keys()
         
-        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in column_names)
+        # Only loaded columns: touching a deferred/expired one would emit IO
+        values = ', '.join(f"{name}={self.__dict__[name]!r}" for name in column_names if name in self.__dict__)
         return f"<{cls_name}({values})>"
     
     
@@ -1,2 +1,2 @@
-from .users_table_interface import UserInterface
+from .users_table_interface import UserInterface, UserProfile
 from .users_table import User
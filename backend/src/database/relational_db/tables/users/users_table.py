@@ -33,6 +33,10 @@ class User(TimestampMixin, Base):
     banned: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     __table_args__ = (
+        # Keyset pagination for the admin list
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+        # Media garbage collection checks blobs against pictures in batches
+        Index('ix_users_profile_pic_url', 'profile_pic_url'),
         # GIN trigram indexes for fast text search
         Index(
             'users_username_trgm',
@@ -49,4 +53,4 @@ class User(TimestampMixin, Base):
     )
     
     organization: Mapped["Organization"] = relationship(back_populates="owner", lazy="selectin") # type: ignore
-    garage: Mapped[list["GarageVehicle"]] = relationship(back_populates="user", lazy="selectin") # type: ignore
+    garage: Mapped[list["GarageVehicle"]] = relationship(back_populates="user", lazy="raise") # type: ignore
@@ -1,13 +1,27 @@
 from uuid import UUID
+from typing import Literal
 from datetime import date, datetime, timedelta
 from pydantic import EmailStr
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, or_, func
+from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .users_table import User
+from ..organizations.organizations_table import Organization
+from ..loader_profiles import LoaderProfiles
+from ..keyset import Keyset
+
+UserProfile = Literal['bare', 'auth']
 
 
 class UserInterface:
+    profiles = LoaderProfiles(
+        bare=lambda: (),
+        # Everything `UserModel` renders, in a single statement
+        auth=lambda: (joinedload(User.organization),),
+    )
+    newest = Keyset('users:new', User.created_at, User.id)
+
     def __init__(self, session: AsyncSession):
         self.session = session
     
@@ -15,16 +29,47 @@ class UserInterface:
         self.session.add(user)
         return user
     
-    async def get_by_id(self, id: UUID | str) -> User | None:
+    async def get_by_id(self, id: UUID | str, profile: UserProfile = 'auth') -> User | None:
         user = await self.session.scalar(
-            select(User).where(User.id == id)
+            select(User)
+            .where(User.id == id)
+            .options(*self.profiles(profile))
         )
         
         return user
     
-    async def get_by_email(self, email: EmailStr) -> User | None:
+    async def get_principal(self, id: UUID | str):
+        """Identity columns plus owned organization ids in one statement"""
+        result = await self.session.execute(
+            select(
+                User.id,
+                User.is_admin,
+                User.banned,
+                func.array_agg(Organization.id)
+                .filter(Organization.id.is_not(None))
+                .label('org_ids'),
+            )
+            .outerjoin(Organization, Organization.owner_user_id == User.id)
+            .where(User.id == id)
+            .group_by(User.id)
+        )
+        
+        return result.mappings().one_or_none()
+    
+    async def referenced_pictures(self, urls: list[str]) -> set[str]:
+        """Which of `urls` are some user's profile picture"""
+        if not urls:
+            return set()
+        rows = await self.session.scalars(
+            select(User.profile_pic_url).where(User.profile_pic_url.in_(urls)).distinct()
+        )
+        return set(rows.all())
+
+    async def get_by_email(self, email: EmailStr, profile: UserProfile = 'bare') -> User | None:
         user = await self.session.scalar(
-            select(User).where(User.email == email)
+            select(User)
+            .where(User.email == email)
+            .options(*self.profiles(profile))
         )
         
         return user
@@ -35,10 +80,9 @@ class UserInterface:
         banned: bool | None = None,
         search: str | None = None,
         limit: int = 50,
-        cursor_created_at: datetime | None = None,
-        cursor_id: UUID | None = None,
-    ) -> list[User]:
-        stmt = select(User)
+        cursor: str | None = None,
+    ) -> tuple[list[User], str | None]:
+        stmt = select(User).options(*self.profiles('auth'))
 
         if banned is not None:
             stmt = stmt.where(User.banned == banned)
@@ -46,19 +90,8 @@ class UserInterface:
             pattern = f"%{search}%"
             stmt = stmt.where(or_(User.username.ilike(pattern), User.email.ilike(pattern)))
 
-        # Cursor pagination (created_at desc, id desc)
-        if cursor_created_at is not None and cursor_id is not None:
-            stmt = stmt.where(
-                or_(
-                    User.created_at < cursor_created_at,
-                    and_(User.created_at == cursor_created_at, User.id < cursor_id),
-                )
-            )
-
-        stmt = stmt.order_by(User.created_at.desc(), User.id.desc()).limit(limit)
-
-        rows = await self.session.scalars(stmt)
-        return list(rows.all())
+        rows = list((await self.session.scalars(self.newest.paginate(stmt, cursor, limit))).all())
+        return rows, self.newest.next_cursor(rows, limit)
 
     async def registrations_by_days(self, days: int):
         day = func.date_trunc('day', User.created_at)
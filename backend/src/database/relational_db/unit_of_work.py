@@ -27,3 +27,15 @@ class UoW:
     async def savepoint(self):
         """Create a savepoint for partial rollbacks."""
         return self.session.begin_nested()
+
+
+class ReadUoW(UoW):
+    """
+    Read-only Unit-of-Work for GET routes: the session is bound to a READ ONLY
+    engine and the transaction is always rolled back, never committed.
+    """
+    async def __aexit__(self, *_):
+        await self.session.rollback()
+
+    async def commit(self):
+        raise RuntimeError('Read-only unit of work cannot commit')
@@ -5,6 +5,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from database.relational_db import get_uow
+from database.redis import get_redis
+from service.vehicles import bump_reference_version
 from .manufacturers_seeder import ManufacturersSeeder
 from .makes_seeder import MakesSeeder
 from .manufacturer_makes_seeder import ManufacturerMakesSeeder
@@ -16,6 +18,14 @@ from .model_years_seeder import ModelYearsSeeder
 class SeedRunner:
     """Class for managing database seeder execution"""
     
+    async def announce_reseed(self):
+        """Tell running API workers to reload their vehicle reference snapshot"""
+        try:
+            version = await bump_reference_version(get_redis())
+            print(f"🔄 Vehicle reference data is now version {version}")
+        except Exception as e:
+            print(f"⚠️  Could not bump vehicle reference version: {e}")
+    
     async def run_all_seeders(self, force: bool = False):
         """Run all seeders in the correct order"""
         print("🌱 Starting database seeding...")
@@ -48,6 +58,8 @@ class SeedRunner:
             except Exception as e:
                 print(f"\n❌ Error during seeding: {e}")
                 raise
+        
+        await self.announce_reseed()
     
     async def run_specific_seeder(self, seeder_name: str, force: bool = False):
         """Run a specific seeder"""
@@ -79,6 +91,8 @@ class SeedRunner:
             except Exception as e:
                 print(f"❌ Error during seeding: {e}")
                 raise
+        
+        await self.announce_reseed()
 
 async def main():
     """Main function"""
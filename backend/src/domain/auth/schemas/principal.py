@@ -0,0 +1,11 @@
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class Principal(BaseModel):
+    """Compact identity of an authenticated user, cheap enough to cache."""
+
+    id: UUID = Field(...)
+    is_admin: bool = Field(False)
+    banned: bool = Field(False)
+    org_ids: list[UUID] = Field(default_factory=list, description="Organizations owned by the user")
@@ -0,0 +1 @@
+from .response import CartResponseMode
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class CartResponseMode(str, Enum):
+    FULL = "full"
+    DELTA = "delta"
@@ -45,3 +45,21 @@ class CartItemRemove(BaseModel):
     """Schema for removing item from cart"""
     
     cart_item_id: UUID = Field(..., description="ID of the cart item to remove")
+
+class CartItemBrief(BaseModel):
+    """Cart line without product details, for delta responses"""
+    
+    id: UUID = Field(..., description="Cart item ID")
+    product_id: UUID = Field(..., description="Product ID")
+    quantity: int = Field(..., ge=1, description="Quantity of this product in cart")
+    unit_price: float = Field(..., ge=0, description="Price per unit when added to cart (USD)")
+    total_price: float = Field(..., ge=0, description="Total price for this item (quantity * unit_price)")
+
+class CartDelta(BaseModel):
+    """What a cart mutation changed, plus the new totals, so clients can patch their local cart"""
+    
+    item: CartItemBrief | None = Field(None, description="Added or updated item")
+    removed: list[UUID] = Field(default_factory=list, description="IDs of removed items")
+    unique_items: int = Field(..., ge=0, description="Total number of unique items in cart")
+    total_items: int = Field(..., ge=0, description="Total number of items in cart")
+    total_amount: float = Field(..., ge=0, description="Total cart value in USD")
@@ -1,2 +1,3 @@
 from .pagination import CursorPage, Page
 from .timestamps import CreatedAtModel, TimestampModel
+from .counting import CountMode
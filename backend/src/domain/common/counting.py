@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CountMode(str, Enum):
+    EXACT = "exact"         # cached per (org, status) when not searching
+    ESTIMATE = "estimate"   # planner estimate, no scan
+    NONE = "none"           # `total` is null
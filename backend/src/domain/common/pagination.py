@@ -22,4 +22,5 @@ class Page(BaseModel, Generic[T]):
     items: list[T] = Field(..., description="List of items")
     offset: int = Field(..., description="Offset from start", ge=0)
     limit: int = Field(..., description="Maximum number of items returned", ge=1)
-    total: int = Field(..., description="Total number of items", ge=0)
+    total: int | None = Field(None, description="Total number of items, null when not counted", ge=0)
+    total_estimated: bool = Field(False, description="Whether `total` is a planner estimate")
@@ -2,3 +2,4 @@ from .condition import ProductCondition
 from .status import ProductStatus
 from .originality import ProductOriginality
 from .stock import StockType
+from .sort import ProductSort
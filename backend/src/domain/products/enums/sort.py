@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ProductSort(str, Enum):
+    RELEVANCE = "relevance"
+    NEW = "new"
+    PRICE_ASC = "price_asc"
+    PRICE_DESC = "price_desc"
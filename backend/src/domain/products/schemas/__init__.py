@@ -4,7 +4,12 @@ from .products import (
     ProductPatch,
     MediaModel,
     MediaCreate,
+    PhotoUploadResult,
+    PhotoUploadRequest,
+    PhotoUploadTicket,
+    PhotoUploadConfirm,
     ProductBrief,
+    ProductCard,
 )
 
 __all__ = [
@@ -13,5 +18,10 @@ __all__ = [
     "ProductPatch",
     "MediaModel",
     "MediaCreate",
+    "PhotoUploadResult",
+    "PhotoUploadRequest",
+    "PhotoUploadTicket",
+    "PhotoUploadConfirm",
     "ProductBrief",
+    "ProductCard",
 ]
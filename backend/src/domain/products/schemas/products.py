@@ -1,4 +1,6 @@
 from uuid import UUID
+from datetime import datetime
+from typing import Literal
 from decimal import Decimal
 from pydantic import BaseModel, Field, model_validator, field_validator
 
@@ -21,6 +23,36 @@ class MediaCreate(BaseModel):
     alt: str | None = Field(None, description="Alternative text")
 
 
+class PhotoUploadResult(BaseModel):
+    """Outcome of a single file in a batch photo upload"""
+    filename: str | None = Field(None, description="Uploaded file name")
+    ok: bool = Field(..., description="Whether the file was stored")
+    status_code: int = Field(..., description="HTTP status for this file")
+    detail: str | None = Field(None, description="Error message if the file was rejected")
+
+
+class PhotoUploadRequest(BaseModel):
+    """Photo a client wants to upload straight to media storage"""
+    content_type: Literal["image/jpeg", "image/png"] = Field(..., description="File MIME type")
+    size: int = Field(..., gt=0, description="File size in bytes")
+    sha256: str = Field(..., pattern=r"^[0-9a-f]{64}$", description="Hex SHA-256 of the file")
+
+
+class PhotoUploadTicket(BaseModel):
+    """Where to upload a photo; nothing to upload when the blob is already stored"""
+    key: str = Field(..., description="Storage key to confirm once uploaded")
+    exists: bool = Field(..., description="Identical file already stored, skip the upload")
+    url: str | None = Field(None, description="Presigned upload URL")
+    method: str | None = Field(None, description="HTTP method for the upload")
+    headers: dict[str, str] = Field(default_factory=dict, description="Headers the upload must carry")
+    expires_at: datetime | None = Field(None, description="When the upload URL expires")
+
+
+class PhotoUploadConfirm(BaseModel):
+    """Uploaded photos to attach to a product"""
+    keys: list[str] = Field(..., min_length=1, description="Keys from upload tickets, at most `MAX_PHOTOS_PER_UPLOAD`")
+
+
 class ProductModel(TimestampModel):
     """Product model for API responses"""
     
@@ -63,6 +95,19 @@ class ProductBrief(BaseModel):
     # )
     media: list[MediaModel] = Field(default_factory=list, description="Product photos")
     
+class ProductCard(BaseModel):
+    """
+    Flat product projection for list views, read in a single query without
+    nested relationship loading.
+    """
+    id: UUID = Field(..., description="Unique product ID")
+    title: str = Field(..., description="Product title")
+    price: float = Field(..., ge=0, description="Price in USD")
+    condition: ProductCondition = Field(..., description="Part condition")
+    make_name: str = Field(..., description="Part brand/manufacturer name")
+    seller_name: str = Field(..., description="Seller organization name")
+    photo_url: str | None = Field(None, description="URL of the first product photo")
+    
 class ProductCreate(BaseModel):
     title: str = Field(..., description="Product title")
     description: str | None = Field(None, description="Product listing description")
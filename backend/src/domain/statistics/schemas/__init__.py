@@ -1 +1,2 @@
 from .user_graphs import ActiveUsersGraph, RegistrationsGraph
+from .hashing import HashingMetrics
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+class HashingMetrics(BaseModel):
+    completed: int = Field(..., description='Finished hashing jobs')
+    rejected: int = Field(..., description='Jobs refused because the queue was full')
+    in_flight: int = Field(..., description='Running and queued jobs right now')
+    wait_avg: float = Field(..., description='Mean queue wait, seconds')
+    wait_max: float = Field(...)
+    latency_avg: float = Field(..., description='Mean hash/verify time, seconds')
+    latency_max: float = Field(...)
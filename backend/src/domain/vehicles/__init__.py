@@ -1 +1,2 @@
 from .schemas.vehicle_type import VehicleTypeModel
+from .schemas.reference import ReferenceVersion
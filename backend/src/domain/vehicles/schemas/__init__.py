@@ -1 +1,2 @@
 from .vehicle_type import VehicleTypeModel
+from .reference import ReferenceVersion
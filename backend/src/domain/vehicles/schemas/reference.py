@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class ReferenceVersion(BaseModel):
+    """Current version of the vPIC reference data."""
+    
+    version: int = Field(..., description="Derived from the reference data, changes when a reseed changes it. Pass it as `v` on vehicle lookups to get long-lived cacheable URLs")
@@ -1,5 +1,6 @@
+import asyncio
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi_limiter import FastAPILimiter
 from contextlib import asynccontextmanager
 from starlette.middleware.cors import CORSMiddleware
@@ -7,33 +8,59 @@ from starlette.middleware.cors import CORSMiddleware
 from api import get_api_routers
 from webhooks import get_webhooks
 from core.config import Settings, configure_logging
+from core.responses import ORJSONResponse
+from core.middlewares.upload_limit import UploadLimitMiddleware
 from core.payments import init_stripe
+from core.storage import get_media_storage, build_media_files
 from database.redis import get_redis
+from service.auth import run_blocklist_listener
+from service.vehicles import load_reference, run_reference_listener
+from service.carts import run_reservation_sweeper
+from service.media import run_media_gc
 # from scheduler import init_scheduler
 
 
 config = Settings() # pyright: ignore[reportCallIssue]
+media_files = build_media_files() if config.MEDIA_SERVE_IN_API else None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     redis = get_redis()
+    blocklist_listener = asyncio.create_task(run_blocklist_listener(redis))
+    reservation_sweeper = asyncio.create_task(run_reservation_sweeper())
+    reference_listener = None
+    media_index = asyncio.create_task(media_files.build_index()) if media_files else None
+    media_gc = asyncio.create_task(run_media_gc(redis)) if config.MEDIA_GC_ENABLED else None
     try:
         await FastAPILimiter.init(redis)
         configure_logging()
         init_stripe()
+        await load_reference()
+        reference_listener = asyncio.create_task(run_reference_listener(redis))
         yield   
     finally:
+        blocklist_listener.cancel()
+        reservation_sweeper.cancel()
+        if reference_listener:
+            reference_listener.cancel()
+        if media_index:
+            media_index.cancel()
+        if media_gc:
+            media_gc.cancel()
         await redis.aclose()
+        await get_media_storage().aclose()
 
 
 app = FastAPI(
     lifespan=lifespan,
     title='Hackathon',
+    default_response_class=ORJSONResponse,
     debug=True
 )
 
-# Mount static
-app.mount('/media', StaticFiles(directory=config.MEDIA_DIR, check_dir=False), 'media')
+# Local media storage, unless served by the standalone media app
+if media_files:
+    app.mount('/media', media_files, 'media')
 
 # Including routers
 app.include_router(get_api_routers())
@@ -46,6 +73,17 @@ async def ping():
 
 
 # Adding middlewares
+photo_bytes = config.MAX_PHOTO_SIZE * 1024 * 1024
+multipart_overhead = 64 * 1024
+app.add_middleware(
+    UploadLimitMiddleware,
+    limits=[
+        ('PUT', r'^/api/v1/organizations/[^/]+/products/[^/]+/media$', photo_bytes * config.MAX_PHOTOS_PER_UPLOAD + multipart_overhead),
+        ('PUT', r'^/api/v1/users/me/picture$', photo_bytes + multipart_overhead),
+        ('PUT', r'^/api/v1/media/uploads/', photo_bytes),
+    ],
+    default=config.MAX_REQUEST_SIZE * 1024 * 1024,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -0,0 +1,30 @@
+"""
+Standalone server for the local media storage.
+
+Keeps image downloads off the API workers: set MEDIA_SERVE_IN_API=false,
+run `uvicorn media_app:app --port 8081` next to the API and route `/media`
+to it at the proxy.
+"""
+import asyncio
+
+from contextlib import asynccontextmanager
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from core.config import configure_logging
+from core.storage import build_media_files
+
+media_files = build_media_files()
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    configure_logging()
+    media_index = asyncio.create_task(media_files.build_index())
+    try:
+        yield
+    finally:
+        media_index.cancel()
+
+
+app = Starlette(lifespan=lifespan, routes=[Mount('/media', app=media_files, name='media')])
@@ -0,0 +1,80 @@
+"""add product search columns
+
+Revision ID: ca566d6b58bf
+Revises: a45fac235379
+Create Date: 2025-09-02 12:14:37.512093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ca566d6b58bf'
+down_revision: Union[str, Sequence[str], None] = 'a45fac235379'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _normalize(part_number: str) -> str:
+    # Frozen copy of `normalize_part_number`
+    return ''.join(ch for ch in part_number if ch.isalnum()).upper()
+
+
+def _backfill_part_number_keys() -> None:
+    """
+    Fill `part_number_key` exactly as `normalize_part_number` would. Python's
+    `isalnum`/`upper` are Unicode-aware while Postgres' `[:alnum:]`/`upper`
+    follow the database locale, so SQL only handles pure-ASCII part numbers
+    (byte length == char length in UTF-8) and the rest are computed here.
+    """
+    op.execute("""
+        UPDATE products
+        SET part_number_key = upper(regexp_replace(part_number COLLATE "C", '[^0-9A-Za-z]', '', 'g'))
+        WHERE octet_length(part_number) = char_length(part_number)
+    """)
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, part_number FROM products WHERE octet_length(part_number) <> char_length(part_number)"
+    )).all()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE products SET part_number_key = :key WHERE id = :id"),
+            [{"id": row.id, "key": _normalize(row.part_number)} for row in rows],
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('products', sa.Column('part_number_key', sa.String(collation='C'), nullable=True, comment='Normalized part number for exact/prefix lookups'))
+    _backfill_part_number_keys()
+    op.alter_column('products', 'part_number_key', existing_type=sa.String(collation='C'), nullable=False)
+    op.create_index(op.f('ix_products_part_number_key'), 'products', ['part_number_key'], unique=False)
+    
+    op.add_column('products', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(part_number, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'D')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index('ix_products_search_vector', 'products', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_products_make_id', 'products', ['make_id'], unique=False)
+    op.create_index('ix_makes_name_tsv', 'makes', [sa.text("to_tsvector('simple', make_name)")], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_makes_name_tsv', table_name='makes', postgresql_using='gin')
+    op.drop_index('ix_products_make_id', table_name='products')
+    op.drop_index('ix_products_search_vector', table_name='products', postgresql_using='gin')
+    op.drop_column('products', 'search_vector')
+    op.drop_index(op.f('ix_products_part_number_key'), table_name='products')
+    op.drop_column('products', 'part_number_key')
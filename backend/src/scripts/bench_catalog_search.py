@@ -0,0 +1,158 @@
+"""
+Catalog search benchmark: legacy ILIKE path vs full-text + part-number key.
+
+Builds an UNLOGGED copy of `products` (same columns, generated search vector
+and indexes, no foreign keys) filled with synthetic listings, then times both
+query shapes for a few typical searches. Requires seeded `makes`.
+
+    python -m scripts.bench_catalog_search --rows 1000000 [--runs 20] [--keep] [--explain]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncConnection
+
+from core.config import Settings
+
+config = Settings() # pyright: ignore[reportCallIssue]
+TABLE = 'bench_products'
+
+WORDS = [
+    'brake', 'pad', 'disc', 'rotor', 'filter', 'oil', 'air', 'cabin', 'pump', 'water',
+    'fuel', 'sensor', 'oxygen', 'spark', 'plug', 'ignition', 'coil', 'belt', 'timing',
+    'alternator', 'starter', 'radiator', 'thermostat', 'hose', 'gasket', 'bearing',
+    'hub', 'shock', 'absorber', 'strut', 'mount', 'clutch', 'kit', 'headlight', 'mirror',
+]
+
+# (label, user input)
+QUERIES = [
+    ('word', 'brake'),
+    ('two words', 'water pump'),
+    ('make', 'toyota'),
+    ('part no.', '04465-33450'),
+    ('pn prefix', '04465'),
+]
+
+ILIKE_SQL = f"""
+SELECT p.id FROM {TABLE} p JOIN makes m ON m.make_id = p.make_id
+WHERE p.status = 'PUBLISHED' AND (
+    m.make_name ILIKE :pattern OR p.part_number ILIKE :pattern
+    OR p.description ILIKE :pattern OR p.title ILIKE :pattern
+)
+ORDER BY p.created_at DESC, p.id DESC LIMIT 20
+"""
+
+RANKED_SQL = f"""
+WITH q AS (SELECT to_tsquery('simple', :tsquery) AS q),
+     mk AS (SELECT make_id FROM makes, q WHERE to_tsvector('simple', make_name) @@ q.q)
+SELECT p.id,
+    ts_rank(p.search_vector, q.q)
+    + CASE WHEN p.make_id IN (SELECT make_id FROM mk) THEN 0.2 ELSE 0 END
+    + CASE WHEN p.part_number_key = :key THEN 1.0
+           WHEN p.part_number_key >= :key AND p.part_number_key < :key_hi THEN 0.5 ELSE 0 END AS rank
+FROM {TABLE} p, q
+WHERE p.status = 'PUBLISHED' AND (
+    p.search_vector @@ q.q
+    OR p.make_id IN (SELECT make_id FROM mk)
+    OR (p.part_number_key >= :key AND p.part_number_key < :key_hi)
+)
+ORDER BY rank DESC, p.id DESC LIMIT 20
+"""
+
+
+def _normalize(part_number: str) -> str:
+    return ''.join(ch for ch in part_number if ch.isalnum()).upper()
+
+
+def _ranked_params(search: str) -> dict:
+    words = ''.join(ch if ch.isalnum() else ' ' for ch in search.lower()).split()
+    key = _normalize(search)
+    return {
+        'tsquery': ' & '.join(f'{w}:*' for w in words),
+        'key': key,
+        'key_hi': key[:-1] + chr(ord(key[-1]) + 1),
+    }
+
+
+async def build(conn: AsyncConnection, rows: int) -> None:
+    await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    await conn.execute(text(f"CREATE UNLOGGED TABLE {TABLE} (LIKE products INCLUDING ALL)"))
+    await conn.execute(text(f"""
+        INSERT INTO {TABLE} (
+            id, org_id, make_id, title, description, part_number, part_number_key, price,
+            stock_type, quantity_original, quantity_on_hand, condition, originality,
+            status, allow_cart, allow_chat, created_at
+        )
+        SELECT
+            gen_random_uuid(), gen_random_uuid(), mk[1 + i % cardinality(mk)],
+            initcap(w[1 + i % cardinality(w)] || ' ' || w[1 + (i / 7) % cardinality(w)]),
+            'Fits many models. ' || w[1 + (i / 13) % cardinality(w)] || ' ' || w[1 + (i / 31) % cardinality(w)],
+            pn, upper(regexp_replace(pn, '[^[:alnum:]]', '', 'g')),
+            (i % 500) + 9.99,
+            'STOCK', 10, 10, 'NEW', 'OEM',
+            CASE WHEN i % 10 = 0 THEN 'DRAFT' ELSE 'PUBLISHED' END::product_status,
+            true, true,
+            now() - make_interval(secs => i)
+        FROM generate_series(1, :rows) AS i
+        CROSS JOIN LATERAL (SELECT lpad((i::bigint * 7919 % 99999)::text, 5, '0') || '-' || lpad((i % 99999)::text, 5, '0') AS pn) AS p
+        CROSS JOIN (
+            SELECT array_agg(make_id) AS mk FROM (
+                SELECT make_id FROM makes
+                ORDER BY make_name ILIKE ANY(ARRAY['toyota', 'honda', 'ford', 'bmw', 'nissan']) DESC, make_id
+                LIMIT 50
+            ) AS popular
+        ) AS makes_pool
+        CROSS JOIN (SELECT CAST(:words AS text[]) AS w) AS words
+    """), {'rows': rows, 'words': WORDS})
+    await conn.execute(text(f"ANALYZE {TABLE}"))
+
+
+async def timed(conn: AsyncConnection, sql: str, params: dict, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await conn.execute(text(sql), params)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def main(rows: int, runs: int, keep: bool, explain: bool) -> None:
+    engine = create_async_engine(config.DATABASE_URL)
+    async with engine.connect() as conn:
+        print(f"Building {TABLE} with {rows} rows...")
+        await build(conn, rows)
+        await conn.commit()
+        
+        print(f"{'query':<12}{'ILIKE p50':>12}{'ILIKE p95':>12}{'FTS p50':>12}{'FTS p95':>12}  (ms)")
+        for label, search in QUERIES:
+            legacy = await timed(conn, ILIKE_SQL, {'pattern': f'%{search}%'}, runs)
+            ranked = await timed(conn, RANKED_SQL, _ranked_params(search), runs)
+            p = lambda xs, q: statistics.quantiles(xs, n=100)[q - 1] if len(xs) > 1 else xs[0]
+            print(f"{label:<12}{p(legacy, 50):>12.1f}{p(legacy, 95):>12.1f}{p(ranked, 50):>12.1f}{p(ranked, 95):>12.1f}")
+            
+            if explain:
+                for name, sql, params in (
+                    ('ILIKE', ILIKE_SQL, {'pattern': f'%{search}%'}),
+                    ('FTS', RANKED_SQL, _ranked_params(search)),
+                ):
+                    plan = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params)
+                    print(f"--- {name}: {search}")
+                    print('\n'.join(row[0] for row in plan))
+        
+        if not keep:
+            await conn.execute(text(f"DROP TABLE {TABLE}"))
+            await conn.commit()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--keep', action='store_true', help='Keep the table for manual EXPLAINs')
+    parser.add_argument('--explain', action='store_true', help='Print EXPLAIN ANALYZE for every query')
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.runs, args.keep, args.explain))
@@ -0,0 +1,61 @@
+"""
+Micro-benchmark for JWT issue/verify cost per algorithm.
+
+Compares RS256, ES256 and EdDSA with pre-parsed key objects, plus RS256
+with raw PEM bytes (what PyJWT re-parses on every call).
+
+    python -m scripts.bench_jwt [iterations]
+"""
+import sys
+import time
+import jwt
+
+from typing import Any, Callable
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa, ec, ed25519
+
+
+def _pem(private_key) -> tuple[bytes, bytes]:
+    private = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private, public
+
+
+def _timeit(fn: Callable[[], Any], iterations: int) -> float:
+    """Mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int = 2000):
+    payload = {'sub': '00000000-0000-0000-0000-000000000000', 'typ': 'access', 'jti': 'x' * 32}
+    
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    cases: list[tuple[str, str, Any, Any]] = [
+        ('RS256 (PEM)', 'RS256', *_pem(rsa_key)),
+        ('RS256', 'RS256', rsa_key, rsa_key.public_key()),
+    ]
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+    cases.append(('ES256', 'ES256', ec_key, ec_key.public_key()))
+    ed_key = ed25519.Ed25519PrivateKey.generate()
+    cases.append(('EdDSA', 'EdDSA', ed_key, ed_key.public_key()))
+    
+    print(f"{'case':<14}{'issue, us':>12}{'verify, us':>12}{'size, B':>10}")
+    for name, algo, private, public in cases:
+        token = jwt.encode(payload, private, algorithm=algo)
+        issue = _timeit(lambda: jwt.encode(payload, private, algorithm=algo), iterations)
+        verify = _timeit(lambda: jwt.decode(token, public, algorithms=[algo]), iterations)
+        print(f"{name:<14}{issue:>12.1f}{verify:>12.1f}{len(token):>10}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
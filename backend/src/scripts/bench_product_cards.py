@@ -0,0 +1,79 @@
+"""
+Micro-benchmark for serializing a 100-item catalog page.
+
+Compares the full `ProductModel` page (attribute validation of nested make,
+organization and media, then `model_dump_json`) with the flat `ProductCard`
+projection rows dumped straight through orjson, as `/products/catalog/cards`
+does. No database needed: ORM rows are stood in by plain objects.
+
+    python -m scripts.bench_product_cards [iterations]
+"""
+import sys
+import time
+
+from datetime import datetime, UTC
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Callable
+from uuid import uuid4
+
+from core.responses import dumps
+from domain.common import CursorPage
+from domain.products import ProductModel, ProductCard, ProductCondition, ProductOriginality, ProductStatus, StockType
+
+PAGE = 100
+
+
+def _product(i: int) -> SimpleNamespace:
+    now = datetime.now(UTC)
+    return SimpleNamespace(
+        id=uuid4(), created_at=now, updated_at=now,
+        title=f'Brake pad set #{i}', description='Front axle, ceramic compound. ' * 8,
+        make=SimpleNamespace(make_id=448, make_name='TOYOTA'),
+        part_number=f'04465-{i:05d}', price=Decimal('49.90'),
+        stock_type=StockType.STOCK, quantity_on_hand=12,
+        condition=ProductCondition.NEW, originality=ProductOriginality.OEM,
+        allow_cart=True, allow_chat=True, status=ProductStatus.PUBLISHED,
+        media=[SimpleNamespace(id=uuid4(), url=f'/media/products/{i}/{n}.jpg', alt=None) for n in range(3)],
+        organization=SimpleNamespace(id=uuid4(), name='Parts & Co', country='US', address='1 Main St'),
+    )
+
+
+def _card(product: SimpleNamespace) -> dict:
+    return {
+        'id': product.id, 'title': product.title, 'price': product.price,
+        'condition': product.condition, 'make_name': product.make.make_name,
+        'seller_name': product.organization.name, 'photo_url': product.media[0].url,
+    }
+
+
+def _timeit(fn: Callable[[], Any], iterations: int) -> float:
+    """Mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int = 500):
+    products = [_product(i) for i in range(PAGE)]
+    cards = [_card(p) for p in products]
+    fields = tuple(ProductCard.model_fields)
+    
+    def full() -> bytes:
+        page = CursorPage[ProductModel].model_validate(
+            {'items': products, 'next_cursor': None}, from_attributes=True
+        )
+        return page.model_dump_json(by_alias=True).encode()
+    
+    def flat() -> bytes:
+        items = [{field: card[field] for field in fields} for card in cards]
+        return dumps({'items': items, 'next_cursor': None})
+    
+    print(f"{'case':<16}{'page, us':>12}{'size, B':>10}")
+    for name, fn in (('ProductModel', full), ('ProductCard', flat)):
+        print(f"{name:<16}{_timeit(fn, iterations):>12.1f}{len(fn()):>10}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,162 @@
+"""
+Serialization cost per response schema.
+
+For each hot route schema, times the three ways a response can be produced:
+
+* ``default``: FastAPI's stock path: validate against ``response_model``,
+  ``serialize`` to JSON-able Python, ``json.dumps``
+* ``orjson``: the same, rendered by the app's `ORJSONResponse`
+* ``adapter``: `core.responses.adapter_json`, one validation and a direct
+  ``dump_json``, as the hot routes return it
+
+ORM rows are stood in by plain objects, so no database is needed. Pass
+``--save`` to write the results as a baseline and ``--compare`` to fail (exit 1)
+when any case got slower than the baseline by more than ``--tolerance``.
+
+    python -m scripts.bench_serialization [--iterations N] [--save FILE | --compare FILE]
+"""
+import argparse
+import json
+import sys
+import time
+
+from datetime import datetime, UTC
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Callable
+from uuid import uuid4
+from pydantic import TypeAdapter
+
+from core.responses import adapter_json, dumps
+from domain.common import CursorPage
+from domain.carts import CartModel
+from domain.garage import VehilceModel
+from domain.makes import MakeModel
+from domain.models import ModelSchema
+from domain.products import ProductModel, ProductCondition, ProductOriginality, ProductStatus, StockType
+
+
+def _make(i: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(make_id=440 + i, make_name=f'MAKE {i}')
+
+
+def _model(i: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(model_id=1000 + i, make_id=440, model_name=f'Model {i}')
+
+
+def _product(i: int) -> SimpleNamespace:
+    now = datetime.now(UTC)
+    return SimpleNamespace(
+        id=uuid4(), created_at=now, updated_at=now,
+        title=f'Brake pad set #{i}', description='Front axle, ceramic compound. ' * 8,
+        make=_make(), part_number=f'04465-{i:05d}', price=Decimal('49.90'),
+        stock_type=StockType.STOCK, quantity_on_hand=12,
+        condition=ProductCondition.NEW, originality=ProductOriginality.OEM,
+        allow_cart=True, allow_chat=True, status=ProductStatus.PUBLISHED,
+        media=[SimpleNamespace(id=uuid4(), url=f'/media/products/{i}/{n}.jpg', alt=None) for n in range(3)],
+        organization=SimpleNamespace(id=uuid4(), name='Parts & Co', country='US', address='1 Main St'),
+    )
+
+
+def _cart(size: int) -> SimpleNamespace:
+    items = [
+        SimpleNamespace(
+            id=uuid4(), created_at=datetime.now(UTC), product=_product(i),
+            quantity=2, unit_price=Decimal('49.90'), total_price=Decimal('99.80'),
+        )
+        for i in range(size)
+    ]
+    return SimpleNamespace(
+        id=uuid4(), user_id=uuid4(), items=items,
+        unique_items=size, total_items=2 * size, total_amount=Decimal('99.80') * size,
+    )
+
+
+def _vehicle(i: int) -> SimpleNamespace:
+    now = datetime.now(UTC)
+    return SimpleNamespace(
+        id=uuid4(), created_at=now, updated_at=now, user_id=uuid4(),
+        make=_make(), model=_model(i), year=2015,
+        vehicle_type=SimpleNamespace(vehicle_type_id=2, name='Passenger Car'),
+        vin='JTDKB20U793456789', comment=None,
+    )
+
+
+CASES: list[tuple[str, Any, Callable[[], Any]]] = [
+    ('catalog page x20', CursorPage[ProductModel], lambda: {'items': [_product(i) for i in range(20)], 'next_cursor': 'x' * 40}),
+    ('catalog page x100', CursorPage[ProductModel], lambda: {'items': [_product(i) for i in range(100)], 'next_cursor': 'x' * 40}),
+    ('cart x10', CartModel, lambda: _cart(10)),
+    ('garage x10', CursorPage[VehilceModel], lambda: {'items': [_vehicle(i) for i in range(10)], 'next_cursor': None}),
+    ('makes x100', list[MakeModel], lambda: [_make(i) for i in range(100)]),
+    ('models x100', list[ModelSchema], lambda: [_model(i) for i in range(100)]),
+]
+
+
+def _timeit(fn: Callable[[], Any], iterations: int) -> float:
+    """Mean microseconds per call"""
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    print(f"{'schema':<20}{'default, us':>14}{'orjson, us':>14}{'adapter, us':>14}{'size, B':>10}")
+    for name, schema, build in CASES:
+        adapter = TypeAdapter(schema)
+        value = build()
+        
+        def stock(render: Callable[[Any], bytes]) -> Callable[[], bytes]:
+            def fn() -> bytes:
+                validated = adapter.validate_python(value, from_attributes=True)
+                return render(adapter.dump_python(validated, mode='json', by_alias=True))
+            return fn
+        
+        default = stock(lambda content: json.dumps(content, ensure_ascii=False, separators=(',', ':')).encode())
+        fast = stock(dumps)
+        direct = lambda: adapter_json(adapter, value)
+        
+        row = {
+            'default': _timeit(default, iterations),
+            'orjson': _timeit(fast, iterations),
+            'adapter': _timeit(direct, iterations),
+        }
+        results[name] = row
+        print(f"{name:<20}{row['default']:>14.1f}{row['orjson']:>14.1f}{row['adapter']:>14.1f}{len(direct()):>10}")
+    return results
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float) -> bool:
+    ok = True
+    for name, row in results.items():
+        for path, current in row.items():
+            previous = baseline.get(name, {}).get(path)
+            if previous and current > previous * (1 + tolerance):
+                print(f"REGRESSION {name} [{path}]: {previous:.1f}us -> {current:.1f}us")
+                ok = False
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--save', help='Write results to this JSON file')
+    parser.add_argument('--compare', help='Baseline JSON file to check against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed slowdown, fraction of baseline')
+    args = parser.parse_args()
+    
+    results = run(args.iterations)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
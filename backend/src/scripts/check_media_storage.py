@@ -0,0 +1,75 @@
+"""
+Round trip against the configured media storage backend.
+
+Stores a random blob twice (the second store must be deduplicated), checks
+`stat`, then uploads another blob through a presigned URL the way a client
+would, including one upload with a wrong body that the store must reject.
+Everything written is deleted at the end. Run it against a local MinIO to
+exercise the S3 backend:
+
+    docker run -p 9000:9000 minio/minio server /data
+    MEDIA_STORAGE=s3 S3_ENDPOINT_URL=http://localhost:9000 S3_BUCKET=media \\
+    S3_ACCESS_KEY=minioadmin S3_SECRET_KEY=minioadmin python -m scripts.check_media_storage
+
+With the local backend the presigned part needs MEDIA_SIGNING_KEY and the API
+running at SITE_URL.
+"""
+import asyncio
+import hashlib
+import os
+import sys
+
+import httpx
+
+from core.storage import get_media_storage, content_key, stage_chunks
+
+
+async def _chunks(data: bytes):
+    yield data
+
+
+async def _stage(data: bytes):
+    return await stage_chunks(_chunks(data), "image/png", len(data))
+
+
+async def main() -> bool:
+    storage = get_media_storage()
+    data = os.urandom(256 * 1024)
+    digest = hashlib.sha256(data).hexdigest()
+    keys = [content_key(digest, "image/png")]
+    ok = True
+    try:
+        first = await _stage(data)
+        key = await storage.store(first.path, first.content_type, first.digest)
+        again = await _stage(data)
+        same = await storage.store(again.path, again.content_type, again.digest)
+        info = await storage.stat(key)
+        stored_ok = key == same == keys[0] and info is not None and info.size == len(data)
+        deduped = not first.path.exists() and not again.path.exists()
+        print(f"store: {key} size={info and info.size} dedup={'OK' if deduped else 'FAIL'} -> {'OK' if stored_ok else 'FAIL'}")
+        ok &= stored_ok and deduped
+
+        other = os.urandom(64 * 1024)
+        other_digest = hashlib.sha256(other).hexdigest()
+        keys.append(content_key(other_digest, "image/png"))
+        ticket = await storage.presign_put(keys[1], "image/png", len(other), other_digest, 60)
+        async with httpx.AsyncClient(timeout=30) as client:
+            tampered = await client.put(ticket.url, content=bytes(len(other)), headers=ticket.headers)
+            uploaded = await client.put(ticket.url, content=other, headers=ticket.headers)
+        info = await storage.stat(keys[1])
+        presign_ok = tampered.status_code >= 400 and uploaded.status_code < 300 and info is not None and info.size == len(other)
+        print(
+            f"presigned: tampered={tampered.status_code} upload={uploaded.status_code} "
+            f"size={info and info.size} -> {'OK' if presign_ok else 'FAIL'}"
+        )
+        ok &= presign_ok
+    finally:
+        for key in keys:
+            await storage.delete(key)
+        await storage.aclose()
+    return ok
+
+
+if __name__ == '__main__':
+    if not asyncio.run(main()):
+        sys.exit(1)
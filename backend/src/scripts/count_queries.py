@@ -0,0 +1,121 @@
+"""
+Statement budgets for hot routes.
+
+Calls each route in-process with every cache in front of Postgres dropped
+first, counts the statements sent to the primary and replica engines with a
+`before_cursor_execute` listener, and fails when a route goes over its
+budget. The budgets are what the loader profiles allow; a relationship that
+slips out of them shows up here as an extra statement (or as a raiseload
+error) rather than as a slow page in production.
+
+Needs a user id whose tokens can be minted locally. The cart route creates an
+empty cart for that user when there is none, and the catalog generation is
+bumped before the catalog and feed routes.
+
+    python -m scripts.count_queries <user_id>
+"""
+import asyncio
+import argparse
+import sys
+
+from typing import Annotated, Awaitable, Callable
+from uuid import UUID
+from fastapi import FastAPI, Depends
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+
+from core.config import Settings
+from core.security import auth_principal
+from database.redis import get_redis, CacheRepo
+from database.relational_db.session import engine, replica_engine
+from domain.auth import Principal
+from service.auth.principals import PrincipalCache
+from service.auth.tokens import get_token_service
+from service.carts import CartCache
+from service.products import CatalogCache
+from main import app
+
+config = Settings() # pyright: ignore[reportCallIssue]
+
+# auth_principal alone, mounted on its own app
+probe = FastAPI()
+
+@probe.get('/')
+async def whoami(principal: Annotated[Principal, Depends(auth_principal)]):
+    return {'id': str(principal.id)}
+
+
+class StatementCounter:
+    def __init__(self):
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def attach(self) -> None:
+        for target in {engine.sync_engine, replica_engine.sync_engine}:
+            event.listen(target, 'before_cursor_execute', self)
+
+
+async def main(user_id: UUID) -> bool:
+    redis = get_redis()
+    principals = PrincipalCache(CacheRepo(redis))
+    catalog = CatalogCache(redis)
+    carts = CartCache(redis)
+
+    access, _, _ = await (await get_token_service(redis)).issue_tokens(user_id)
+    headers = {'Authorization': f'Bearer {access}'}
+
+    async def cold_principal() -> None:
+        await principals.invalidate(user_id)
+
+    async def cold_catalog() -> None:
+        await catalog.bump()
+
+    async def cold_cart() -> None:
+        await principals.invalidate(user_id)
+        if config.CART_CACHE_ENABLED:
+            await carts.written(user_id)
+
+    # (name, app, path, budget, reset): budgets of authenticated routes include auth_principal's one
+    cases: list[tuple[str, FastAPI, str, int, Callable[[], Awaitable[None]]]] = [
+        ('auth_principal', probe, '/', 1, cold_principal),
+        ('GET /products/catalog', app, '/api/v1/products/catalog?limit=20', 2, cold_catalog),
+        ('GET /products/feed', app, '/api/v1/products/feed?limit=20', 2, cold_catalog),
+        ('GET /products/catalog/cards', app, '/api/v1/products/catalog/cards?limit=20', 1, cold_catalog),
+        ('GET /products/feed/cards', app, '/api/v1/products/feed/cards?limit=20', 1, cold_catalog),
+        ('GET /cart/', app, '/api/v1/cart/', 6, cold_cart),
+        ('GET /users/me/garage/vehicles', app, '/api/v1/users/me/garage/vehicles?limit=20', 2, cold_principal),
+    ]
+
+    counter = StatementCounter()
+    counter.attach()
+    ok = True
+    try:
+        for name, target, path, budget, reset in cases:
+            await reset()
+            async with AsyncClient(transport=ASGITransport(app=target), base_url='http://test') as client:
+                counter.statements.clear()
+                response = await client.get(path, headers=headers)
+
+            count = len(counter.statements)
+            passed = response.status_code == 200 and count <= budget
+            ok &= passed
+            print(f"{name}: {response.status_code}, {count} statements (budget {budget}) -> {'OK' if passed else 'FAIL'}")
+            if not passed:
+                for statement in counter.statements:
+                    print(f"    {' '.join(statement.split())[:160]}")
+    finally:
+        await engine.dispose()
+        await replica_engine.dispose()
+        await redis.aclose()
+    return ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check per-route SQL statement budgets')
+    parser.add_argument('user_id', type=UUID, help='User to authenticate as')
+    args = parser.parse_args()
+
+    if not asyncio.run(main(args.user_id)):
+        sys.exit(1)
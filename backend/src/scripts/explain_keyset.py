@@ -0,0 +1,76 @@
+"""
+Checks that every keyset listing is served by a single index range scan.
+
+For each listing a second-page query (with a cursor) is EXPLAINed with
+sequential and bitmap scans disabled. It passes when the row-value seek
+predicate appears as an `Index Cond` and the plan has no Sort node, i.e. a
+composite index matches both the predicate and the ORDER BY.
+
+    python -m scripts.explain_keyset
+"""
+import asyncio
+import sys
+
+from datetime import datetime, UTC
+from decimal import Decimal
+from uuid import uuid4
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from database.relational_db import (
+    Product,
+    User,
+    GarageVehicle,
+    Keyset,
+    ProductsInterface,
+    UserInterface,
+    GarageVehiclesInterface,
+)
+from database.relational_db.session import engine
+from domain.products import ProductStatus, ProductSort
+
+NOW = datetime.now(UTC)
+
+
+def cases() -> list[tuple[str, Keyset, object, tuple]]:
+    published = select(Product.id).where(Product.status == ProductStatus.PUBLISHED)
+    return [
+        ('products: newest', ProductsInterface.keysets[ProductSort.NEW], published, (NOW, uuid4())),
+        ('products: price asc', ProductsInterface.keysets[ProductSort.PRICE_ASC], published, (Decimal('10.00'), uuid4())),
+        ('products: price desc', ProductsInterface.keysets[ProductSort.PRICE_DESC], published, (Decimal('10.00'), uuid4())),
+        ('users: newest', UserInterface.newest, select(User.id), (NOW, uuid4())),
+        (
+            'garage: newest',
+            GarageVehiclesInterface.newest,
+            select(GarageVehicle.id).where(GarageVehicle.user_id == uuid4()),
+            (NOW, uuid4()),
+        ),
+    ]
+
+
+async def main() -> int:
+    failed = 0
+    async with engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        await conn.execute(text("SET enable_bitmapscan = off"))
+        
+        for name, keyset, base, after in cases():
+            stmt = keyset.paginate(base, keyset.encode(*after), 20)
+            sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True})
+            plan = '\n'.join(row[0] for row in await conn.execute(text(f"EXPLAIN {sql}")))
+            
+            seek = any('Index Cond' in line and 'ROW(' in line for line in plan.splitlines())
+            sorted_ = any(line.strip().lstrip('-> ').startswith(('Sort', 'Incremental Sort')) for line in plan.splitlines())
+            ok = seek and not sorted_
+            failed += not ok
+            print(f"{'PASS' if ok else 'FAIL'}  {name}")
+            if not ok:
+                print(plan)
+        
+        await conn.rollback()
+    await engine.dispose()
+    return failed
+
+
+if __name__ == '__main__':
+    sys.exit(1 if asyncio.run(main()) else 0)
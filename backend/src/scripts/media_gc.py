@@ -0,0 +1,58 @@
+"""
+Full media garbage collection pass, start to end of the store.
+
+Reports what no product photo or profile picture references. With
+`--dry-run` nothing is deleted, which is the way to check a deployment
+before turning on MEDIA_GC_ENABLED. Does not touch the background job's
+cursor.
+
+    python -m scripts.media_gc [--dry-run] [--batch N] [--grace SECONDS]
+"""
+import asyncio
+import argparse
+import time
+
+from datetime import timedelta
+
+from core.config import Settings
+from core.storage import get_media_storage
+from service.media import GCReport, collect_batch, sweep_staging, unkeyed_media
+
+config = Settings() # pyright: ignore[reportCallIssue]
+
+
+async def main(dry_run: bool, batch: int, grace: timedelta) -> GCReport:
+    storage = get_media_storage()
+    total = GCReport()
+    started = time.perf_counter()
+    try:
+        if unkeyed := await unkeyed_media(storage):
+            print(f"refusing to run: {unkeyed} product media rows have no storage_key, run the migrations first")
+            return total
+        if not dry_run:
+            files, reclaimed = await sweep_staging(grace)
+            print(f"staging: removed {files} abandoned files, {reclaimed / 1024 / 1024:.1f} MiB")
+        while True:
+            total.add(await collect_batch(storage, total.cursor, batch, grace, dry_run))
+            print(f"  ... {total.scanned} scanned, {total.orphans} orphans", end="\r")
+            if total.cursor is None:
+                break
+    finally:
+        await storage.aclose()
+
+    verb = "would reclaim" if dry_run else "reclaimed"
+    print(
+        f"scanned {total.scanned} blobs in {time.perf_counter() - started:.1f}s: "
+        f"{total.orphans} orphans, deleted {total.deleted}, {verb} {total.reclaimed_bytes / 1024 / 1024:.1f} MiB"
+    )
+    return total
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Delete media blobs nothing references')
+    parser.add_argument('--dry-run', action='store_true', help='Only report orphans')
+    parser.add_argument('--batch', type=int, default=config.MEDIA_GC_BATCH)
+    parser.add_argument('--grace', type=int, default=config.MEDIA_GC_GRACE, help='Minimum blob age in seconds')
+    args = parser.parse_args()
+
+    asyncio.run(main(args.dry_run, args.batch, timedelta(seconds=args.grace)))
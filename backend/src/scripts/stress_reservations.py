@@ -0,0 +1,95 @@
+"""
+Concurrency harness for cart stock reservations.
+
+Points at one published product, gives it `--stock` free units, then fires
+`--attempts` coroutines that each try to hold `--quantity` units in their own
+transaction, all released at once. Passes when the successful holds add up to
+exactly the stock on hand: no oversell, no lost update. Then releases half of
+them concurrently and checks the counter again. The product's stock columns
+are restored at the end.
+
+Concurrency is bounded by the engine pool (`DB_POOL_SIZE + DB_MAX_OVERFLOW`);
+the rest queue on it, which still interleaves hundreds of transactions on the
+same row.
+
+    python -m scripts.stress_reservations <product_id> [--stock N] [--attempts N] [--quantity N]
+"""
+import asyncio
+import argparse
+import sys
+
+from uuid import UUID
+from sqlalchemy import select, update
+
+from database.relational_db import get_uow, Product, ProductsInterface
+
+
+async def _reserve(start: asyncio.Event, product_id: UUID, quantity: int) -> bool:
+    await start.wait()
+    async for uow in get_uow():
+        return await ProductsInterface(uow.session).reserve_stock(product_id, quantity)
+    return False
+
+
+async def _release(start: asyncio.Event, product_id: UUID, quantity: int) -> None:
+    await start.wait()
+    async for uow in get_uow():
+        await ProductsInterface(uow.session).release_stock({product_id: quantity})
+
+
+async def _stock(product_id: UUID) -> tuple[int, int]:
+    async for uow in get_uow():
+        row = (await uow.session.execute(
+            select(Product.quantity_on_hand, Product.quantity_reserved).where(Product.id == product_id)
+        )).one()
+        return row[0], row[1]
+    raise RuntimeError('unreachable')
+
+
+async def _set_stock(product_id: UUID, on_hand: int, reserved: int) -> None:
+    async for uow in get_uow():
+        await uow.session.execute(
+            update(Product)
+            .where(Product.id == product_id)
+            .values(quantity_on_hand=on_hand, quantity_reserved=reserved)
+        )
+
+
+async def main(product_id: UUID, stock: int, attempts: int, quantity: int) -> bool:
+    original = await _stock(product_id)
+    await _set_stock(product_id, stock, 0)
+    try:
+        start = asyncio.Event()
+        tasks = [asyncio.create_task(_reserve(start, product_id, quantity)) for _ in range(attempts)]
+        start.set()
+        held = sum(await asyncio.gather(*tasks))
+        
+        on_hand, reserved = await _stock(product_id)
+        expected = min(attempts, stock // quantity)
+        ok = held == expected and reserved == held * quantity and reserved <= on_hand
+        print(f"reserve: {held}/{attempts} holds succeeded, reserved={reserved}, on_hand={on_hand} -> {'OK' if ok else 'FAIL'}")
+        
+        start = asyncio.Event()
+        releases = held // 2
+        tasks = [asyncio.create_task(_release(start, product_id, quantity)) for _ in range(releases)]
+        start.set()
+        await asyncio.gather(*tasks)
+        
+        _, reserved_after = await _stock(product_id)
+        released_ok = reserved_after == (held - releases) * quantity
+        print(f"release: {releases} concurrent releases, reserved={reserved_after} -> {'OK' if released_ok else 'FAIL'}")
+        return ok and released_ok
+    finally:
+        await _set_stock(product_id, *original)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Hammer one SKU with concurrent cart holds')
+    parser.add_argument('product_id', type=UUID, help='A published product; its stock is restored afterwards')
+    parser.add_argument('--stock', type=int, default=50)
+    parser.add_argument('--attempts', type=int, default=500)
+    parser.add_argument('--quantity', type=int, default=1)
+    args = parser.parse_args()
+    
+    if not asyncio.run(main(args.product_id, args.stock, args.attempts, args.quantity)):
+        sys.exit(1)
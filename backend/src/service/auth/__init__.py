@@ -1,2 +1,3 @@
 from .credentials_auth import CredentialsService, get_credentials_service
-from .tokens import TokenService, get_token_service
+from .tokens import TokenService, get_token_service, run_blocklist_listener
+from .principals import PrincipalCache, get_principal_cache
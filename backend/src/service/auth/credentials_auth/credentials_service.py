@@ -9,7 +9,7 @@ from database.relational_db import (
 )
 from domain.auth import UserRegister, UserLogin
 from core.config import Settings
-from core.crypto import hash_password, verify_password, needs_rehash
+from core.crypto import hash_password, verify_and_update
 from .exceptions import AlreadyExists, WrongCredentials
 from ..tokens import TokenService
 
@@ -27,15 +27,16 @@ class CredentialsService:
         self.token_service = token_service
         
     @staticmethod
-    async def _check_password(password: str, password_hash: str) -> bool:
+    async def _check_password(password: str, password_hash: str) -> str | None:
+        """Returns a fresh hash when the stored one uses outdated parameters"""
         try:
-            valid = await verify_password(password, password_hash)
+            valid, new_hash = await verify_and_update(password, password_hash)
             if not valid:
                 raise WrongCredentials()
         except ValueError:
             raise WrongCredentials()
         
-        return valid
+        return new_hash
         
     @staticmethod
     async def _hash_password(password: str) -> str:
@@ -76,10 +77,9 @@ class CredentialsService:
         if user is None:
             raise WrongCredentials()
         
-        await self._check_password(payload.password, user.password_hash)
-        
-        if await needs_rehash(user.password_hash):
-            user.password_hash = await self._hash_password(payload.password)
+        new_hash = await self._check_password(payload.password, user.password_hash)
+        if new_hash is not None:
+            user.password_hash = new_hash
         
         access, refresh, csrf = await self.token_service.issue_tokens(user.id, src)
         return access, refresh, csrf
@@ -0,0 +1,11 @@
+from fastapi import Depends
+from redis.asyncio import Redis
+
+from database.redis import CacheRepo, get_redis
+from .principal_cache import PrincipalCache
+
+
+async def get_principal_cache(
+    redis: Redis = Depends(get_redis)
+) -> PrincipalCache:
+    return PrincipalCache(CacheRepo(redis))
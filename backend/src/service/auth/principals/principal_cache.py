@@ -0,0 +1,77 @@
+import time
+import logging
+
+from uuid import UUID
+from collections import OrderedDict
+
+from core.config import Settings
+from database.redis import CacheRepo
+from domain.auth import Principal
+
+config = Settings() # pyright: ignore[reportCallIssue]
+logger = logging.getLogger(__name__)
+
+REDIS_TTL = min(config.PRINCIPAL_CACHE_TTL, config.ACCESS_TTL)
+
+# Per-process LRU: user id -> (expires_at, principal)
+_local: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+
+
+class PrincipalCache:
+    """
+    Two-level cache of authenticated principals keyed by the token `sub`.
+    
+    The local LRU absorbs repeated requests from the same client, Redis shares
+    principals between workers. Entries are dropped explicitly whenever the
+    user, its ban flag or its organizations change.
+    """
+    def __init__(self, repo: CacheRepo):
+        self.repo = repo
+    
+    @staticmethod
+    def _key(user_id: UUID | str) -> str:
+        return f"principal:{user_id}"
+    
+    @staticmethod
+    def _remember(principal: Principal) -> None:
+        user_id = str(principal.id)
+        _local[user_id] = (time.monotonic() + config.PRINCIPAL_LOCAL_TTL, principal)
+        _local.move_to_end(user_id)
+        while len(_local) > config.PRINCIPAL_LOCAL_SIZE:
+            _local.popitem(last=False)
+    
+    async def get(self, user_id: UUID | str) -> Principal | None:
+        user_id = str(user_id)
+        
+        entry = _local.get(user_id)
+        if entry is not None:
+            expires_at, principal = entry
+            if expires_at > time.monotonic():
+                _local.move_to_end(user_id)
+                return principal
+            _local.pop(user_id, None)
+        
+        raw = await self.repo.get(self._key(user_id))
+        if raw is None:
+            return
+        
+        try:
+            principal = Principal.model_validate_json(raw)
+        except ValueError:
+            logger.info('Dropping malformed cached principal')
+            await self.repo.delete(self._key(user_id))
+            return
+        
+        self._remember(principal)
+        return principal
+    
+    async def set(self, principal: Principal) -> None:
+        await self.repo.set(self._key(principal.id), principal.model_dump_json(), REDIS_TTL)
+        self._remember(principal)
+    
+    async def invalidate(self, *user_ids: UUID | str) -> None:
+        if not user_ids:
+            return
+        for user_id in user_ids:
+            _local.pop(str(user_id), None)
+        await self.repo.delete(*(self._key(user_id) for user_id in user_ids))
@@ -1,12 +1,14 @@
 from fastapi import Depends
 from redis.asyncio import Redis
 
-from database.redis import CacheRepo, get_redis
+from database.redis import get_redis
 from .token_service import TokenService
+from .blocklist import TokenBlocklist, run_blocklist_listener
+from .keyset import KeySet, get_keyset
 
 
 async def get_token_service(
     redis: Redis = Depends(get_redis)
 ) -> TokenService:
-    cache_repo = CacheRepo(redis)
-    return TokenService(cache_repo)
+    blocklist = TokenBlocklist(redis)
+    return TokenService(blocklist, get_keyset())
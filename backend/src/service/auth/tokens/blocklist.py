@@ -0,0 +1,110 @@
+import time
+import asyncio
+import logging
+
+from collections import OrderedDict
+from redis.asyncio import Redis
+
+from core.config import Settings
+
+config = Settings() # pyright: ignore[reportCallIssue]
+logger = logging.getLogger(__name__)
+
+CHANNEL = "token-blocklist"
+
+# Per-process state: jti -> monotonic deadline
+_revoked: dict[str, float] = {}
+_clean: OrderedDict[str, float] = OrderedDict()
+
+
+def _remember_revoked(jti: str, ttl: int) -> None:
+    now = time.monotonic()
+    if len(_revoked) >= config.BLOCKLIST_LOCAL_SIZE:
+        for key in [k for k, deadline in _revoked.items() if deadline <= now]:
+            del _revoked[key]
+    _revoked[jti] = now + max(ttl, 0)
+    _clean.pop(jti, None)
+
+
+def _remember_clean(jti: str) -> None:
+    _clean[jti] = time.monotonic() + config.BLOCKLIST_NEGATIVE_TTL
+    _clean.move_to_end(jti)
+    while len(_clean) > config.BLOCKLIST_LOCAL_SIZE:
+        _clean.popitem(last=False)
+
+
+class TokenBlocklist:
+    """
+    Revoked JTIs, stored in Redis and mirrored locally.
+    
+    Revocations are published on `CHANNEL` so every worker learns about them
+    immediately; JTIs recently confirmed as not revoked are remembered for
+    `BLOCKLIST_NEGATIVE_TTL` seconds, which bounds the damage of a missed message.
+    """
+    def __init__(self, redis: Redis):
+        self.redis = redis
+    
+    @staticmethod
+    def _key(jti: str) -> str:
+        return f"block:{jti}"
+    
+    async def is_blocked(self, jti: str, ttl: int) -> bool:
+        now = time.monotonic()
+        
+        deadline = _revoked.get(jti)
+        if deadline is not None:
+            if deadline > now:
+                return True
+            _revoked.pop(jti, None)
+        
+        deadline = _clean.get(jti)
+        if deadline is not None:
+            if deadline > now:
+                return False
+            _clean.pop(jti, None)
+        
+        if await self.redis.exists(self._key(jti)):
+            _remember_revoked(jti, ttl)
+            return True
+        
+        _remember_clean(jti)
+        return False
+    
+    async def block(self, jti: str, ttl: int) -> bool:
+        """
+        Block `jti` for `ttl` seconds and notify other workers in one round trip.
+        Returns False if it was already blocked, so a token can only be spent once.
+        """
+        if ttl <= 0:
+            return False
+        
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(jti), "1", ex=ttl, nx=True)
+            pipe.publish(CHANNEL, f"{jti}:{ttl}")
+            was_set, _ = await pipe.execute()
+        
+        _remember_revoked(jti, ttl)
+        return bool(was_set)
+
+
+async def run_blocklist_listener(redis: Redis) -> None:
+    """Mirror revocations published by other workers into the local cache."""
+    while True:
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(CHANNEL)
+            # Anything confirmed clean while we were disconnected may be stale
+            _clean.clear()
+            
+            async for message in pubsub.listen():
+                jti, _, ttl = message['data'].rpartition(':')
+                if jti and ttl.isdigit():
+                    _remember_revoked(jti, int(ttl))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Disconnects, timeouts or a bad message: resubscribe rather than stop listening for good
+            logger.warning(f'Blocklist listener failed: {e!s}')
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
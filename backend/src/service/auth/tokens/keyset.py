@@ -0,0 +1,104 @@
+import jwt
+
+from functools import cache
+from dataclasses import dataclass
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+from cryptography.hazmat.primitives.asymmetric import rsa, ec, ed25519
+
+from core.config import Settings
+
+
+def _algorithm_for(key) -> str:
+    """JWS algorithm implied by a key object"""
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return 'RS256'
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)):
+        if not isinstance(key.curve, ec.SECP256R1):
+            raise ValueError(f"Unsupported EC curve for JWT: {key.curve.name}")
+        return 'ES256'
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return 'EdDSA'
+    raise ValueError(f"Unsupported JWT key type: {type(key).__name__}")
+
+
+@dataclass(frozen=True, slots=True)
+class VerificationKey:
+    kid: str
+    algorithm: str
+    key: object
+
+
+class KeySet:
+    """
+    JWT signing key plus every public key accepted for verification, indexed by `kid`.
+    
+    PEMs are parsed once into cryptography key objects, so PyJWT doesn't
+    re-parse them on every call. Rotation: sign with a new `JWT_KID` and move
+    the old public key to `JWT_PREVIOUS_PUBLIC_KEYS` until its tokens expire.
+    """
+    def __init__(
+        self,
+        kid: str,
+        private_key,
+        algorithm: str,
+        public_keys: dict[str, VerificationKey],
+    ):
+        if _algorithm_for(private_key) != algorithm:
+            raise ValueError(f"JWT_ALGO={algorithm} doesn't match the signing key type")
+        
+        self.kid = kid
+        self.algorithm = algorithm
+        self._private_key = private_key
+        self._public_keys = public_keys
+    
+    @classmethod
+    def from_pem(
+        cls,
+        kid: str,
+        private_pem: str,
+        public_pem: str,
+        algorithm: str,
+        previous: dict[str, str] | None = None,
+    ) -> 'KeySet':
+        public_keys: dict[str, VerificationKey] = {}
+        for key_id, pem in {**(previous or {}), kid: public_pem}.items():
+            key = load_pem_public_key(pem.encode())
+            public_keys[key_id] = VerificationKey(key_id, _algorithm_for(key), key)
+        
+        private_key = load_pem_private_key(private_pem.encode(), password=None)
+        return cls(kid, private_key, algorithm, public_keys)
+    
+    def sign(self, payload: dict) -> str:
+        return jwt.encode(
+            payload,
+            self._private_key, # pyright: ignore[reportArgumentType]
+            algorithm=self.algorithm,
+            headers={'kid': self.kid},
+        )
+    
+    def verify(self, token: str) -> dict:
+        """Decode and verify `token`, raises `jwt.PyJWTError` on any failure"""
+        # Tokens issued before kids were introduced carry none: they belong to the current key
+        kid = jwt.get_unverified_header(token).get('kid', self.kid)
+        
+        verification_key = self._public_keys.get(kid)
+        if verification_key is None:
+            raise jwt.InvalidKeyError(f"Unknown key id: {kid}")
+        
+        return jwt.decode(
+            token,
+            verification_key.key, # pyright: ignore[reportArgumentType]
+            algorithms=[verification_key.algorithm],
+        )
+
+
+@cache
+def get_keyset() -> KeySet:
+    config = Settings() # pyright: ignore[reportCallIssue]
+    return KeySet.from_pem(
+        config.JWT_KID,
+        config.JWT_PRIVATE_KEY,
+        config.JWT_PUBLIC_KEY,
+        config.JWT_ALGO,
+        config.JWT_PREVIOUS_PUBLIC_KEYS,
+    )
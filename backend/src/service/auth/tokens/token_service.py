@@ -7,31 +7,39 @@ from uuid import UUID, uuid4
 from datetime import datetime, timedelta, UTC
 
 from core.config import Settings
-from database.redis import CacheRepo
+from .blocklist import TokenBlocklist
+from .keyset import KeySet
 
 config = Settings() # pyright: ignore[reportCallIssue]
 logger = logging.getLogger(__name__)
-PRIVATE_KEY = config.JWT_PRIVATE_KEY.encode()
-PUBLIC_KEY = config.JWT_PUBLIC_KEY.encode()
 
 
 class TokenService:
-    def __init__(self, repo: CacheRepo):
-        self.repo = repo
+    def __init__(self, blocklist: TokenBlocklist, keyset: KeySet):
+        self.blocklist = blocklist
+        self.keyset = keyset
     
     @staticmethod 
     def _make_csrf(refresh_token: str) -> str:
         return hmac.new(config.CSRF_HMAC_KEY, refresh_token.encode(), "sha256").hexdigest()
     
-    async def _verify_token(self, token: str) -> dict[str, str] | None:
+    def _decode(self, token: str) -> dict | None:
         try: 
-            payload = jwt.decode(token, PUBLIC_KEY, algorithms=[config.JWT_ALGO])
+            return self.keyset.verify(token)
         except jwt.PyJWTError:
             logger.info('Failed to decode jwt')
             return
+    
+    @staticmethod
+    def _ttl(payload: dict) -> int:
+        return int(payload['exp']) - int(datetime.now(UTC).timestamp())
+    
+    async def _verify_token(self, token: str) -> dict | None:
+        payload = self._decode(token)
+        if payload is None:
+            return
         
-        jti = payload['jti']
-        if await self.repo.exists(f"block:{jti}"):
+        if await self.blocklist.is_blocked(payload['jti'], self._ttl(payload)):
             logger.info('Failed to verify JWT: this token is blocked')
             return
         
@@ -54,7 +62,7 @@ class TokenService:
             'iat': int(now.timestamp()),
             'exp': int((now + timedelta(seconds=config.ACCESS_TTL)).timestamp()),
         }
-        access = jwt.encode(access_payload, PRIVATE_KEY, algorithm=config.JWT_ALGO)
+        access = self.keyset.sign(access_payload)
 
         refresh_payload = {
             'sub': user_id,
@@ -64,7 +72,7 @@ class TokenService:
             'iat': int(now.timestamp()),
             'exp': int((now + timedelta(seconds=config.REFRESH_TTL)).timestamp()),
         }
-        refresh = jwt.encode(refresh_payload, PRIVATE_KEY, algorithm=config.JWT_ALGO)
+        refresh = self.keyset.sign(refresh_payload)
         
         csrf = self._make_csrf(refresh)
         
@@ -76,7 +84,7 @@ class TokenService:
         refresh_token: str, 
         csrf: str | None = None
     ) -> tuple[str, str, str] | None:
-        payload = await self._verify_token(refresh_token)
+        payload = self._decode(refresh_token)
         if payload is None or payload['typ'] != 'refresh':
             logger.info('Failed to verify JWT: no payload or type is not "refresh"')
             return
@@ -91,21 +99,22 @@ class TokenService:
             logger.info('Failed to verify JWT: invalid source')
             return
         
-        jti = payload['jti']
-        ttl = int(payload['exp']) - int(datetime.now(UTC).timestamp())
-        await self.repo.set(f"block:{jti}", "1", ttl)
+        # Blocking doubles as the blocklist check: SET NX fails for an already spent token
+        if not await self.blocklist.block(payload['jti'], self._ttl(payload)):
+            logger.info('Failed to verify JWT: this token is blocked')
+            return
             
         user_id = payload['sub']
         return await self.issue_tokens(user_id, src)
         
         
     async def revoke(self, refresh_token: str) -> dict | None:
-        payload = await self._verify_token(refresh_token)
+        payload = self._decode(refresh_token)
         if payload is None or payload['typ'] != 'refresh':
             return
         
-        ttl = int(payload['exp']) - int(datetime.now(UTC).timestamp())
-        await self.repo.set(f"block:{payload['jti']}", "1", ttl)
+        if not await self.blocklist.block(payload['jti'], self._ttl(payload)):
+            return
         
         return payload
 
@@ -1,21 +1,42 @@
 from fastapi import Depends
+from redis.asyncio import Redis
 
+from core.config import Settings
+from database.redis import get_redis
 from database.relational_db import (
     get_uow,
+    get_read_uow,
     UoW,
     CartInterface,
     CartItemInterface,
     ProductsInterface,
 )
 from .cart_service import CartService
+from .cart_cache import CartCache
+from .reservations import run_reservation_sweeper, sweep_expired_reservations
+
+
+config = Settings() # pyright: ignore[reportCallIssue]
 
 
 async def get_cart_service(
     uow: UoW = Depends(get_uow),
+    redis: Redis = Depends(get_redis),
 ) -> CartService:
     """Dependency to get cart service with all required repositories"""
     cart_repo = CartInterface(uow.session)
     cart_item_repo = CartItemInterface(uow.session)
     product_repo = ProductsInterface(uow.session)
     
-    return CartService(uow, cart_repo, cart_item_repo, product_repo)
+    cache = CartCache(redis) if config.CART_CACHE_ENABLED else None
+    
+    return CartService(uow, cart_repo, cart_item_repo, product_repo, cache)
+
+
+
+async def get_cart_read_service(
+    uow: UoW = Depends(get_read_uow),
+    redis: Redis = Depends(get_redis),
+) -> CartService:
+    """Read-only CartService on the primary"""
+    return await get_cart_service(uow, redis)
@@ -0,0 +1,62 @@
+from uuid import UUID
+from typing import Literal
+from redis.asyncio import Redis
+
+from core.config import Settings
+
+config = Settings() # pyright: ignore[reportCallIssue]
+
+CartView = Literal['full', 'summary']
+
+
+class CartCache:
+    """
+    Serialized carts of active users in Redis, so `/carts/` and the badge
+    polling `/carts/summary` don't touch Postgres.
+    
+    Postgres stays the store: cart writes must commit together with their stock
+    holds. Each cart has a generation counter bumped after every committed
+    mutation, and entries are tagged with the generation they were built
+    from. A tag that doesn't match is a miss, so a reader that loaded the cart
+    just before a write can never park a stale copy, and nothing needs
+    recovering after a restart or a lost key: misses rebuild from Postgres.
+    
+    The full view embeds live product briefs, which are only refreshed by the
+    owner's next cart change or `CART_CACHE_TTL`.
+    """
+    def __init__(self, redis: Redis):
+        self.redis = redis
+    
+    @staticmethod
+    def _generation_key(user_id: UUID) -> str:
+        return f"cart:{user_id}:gen"
+    
+    @staticmethod
+    def _key(user_id: UUID, view: CartView) -> str:
+        return f"cart:{user_id}:{view}"
+    
+    async def get(self, user_id: UUID, view: CartView) -> tuple[str, str | None]:
+        """`(generation, body)`; body is None on a miss. Pass the generation back to `put`"""
+        generation, entry = await self.redis.mget(self._generation_key(user_id), self._key(user_id, view))
+        generation = generation or '0'
+        if entry is not None:
+            tag, _, body = entry.partition('|')
+            if tag == generation:
+                return generation, body
+        return generation, None
+    
+    async def put(self, user_id: UUID, view: CartView, generation: str, body: str) -> None:
+        await self.redis.set(self._key(user_id, view), f"{generation}|{body}", ex=config.CART_CACHE_TTL)
+    
+    async def written(self, user_id: UUID, summary: str | None = None) -> None:
+        """
+        Call after a cart mutation commits: every cached view goes stale. The
+        mutation already knows the new totals, so the summary is stored right away.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.incr(self._generation_key(user_id))
+            # Must outlive any entry tagged with an older generation
+            pipe.expire(self._generation_key(user_id), 2 * config.CART_CACHE_TTL)
+            generation, _ = await pipe.execute()
+        if summary is not None:
+            await self.put(user_id, 'summary', str(generation), summary)
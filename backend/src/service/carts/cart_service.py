@@ -1,17 +1,29 @@
+import orjson
+
 from uuid import UUID
+from datetime import datetime, timedelta, UTC
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 
-from domain.carts import CartItemCreate, CartItemUpdate
+from core.config import Settings
+from core.responses import adapter_json, dumps
+from domain.auth import Principal
+from domain.carts import CartModel, CartItemCreate, CartItemUpdate
 from domain.products import ProductStatus, StockType
 from database.relational_db import (
     UoW,
-    User,
     Cart,
-    CartItem,
     CartInterface,
     CartItemInterface,
     ProductsInterface,
 )
+from .cart_cache import CartCache
+
+config = Settings() # pyright: ignore[reportCallIssue]
+
+MAX_LINE_QUANTITY = 99
+
+_cart = TypeAdapter(CartModel)
 
 
 class CartService:
@@ -21,25 +33,93 @@ class CartService:
         cart_repo: CartInterface,
         cart_item_repo: CartItemInterface,
         product_repo: ProductsInterface,
+        cache: CartCache | None = None,
     ):
         self.uow = uow
         self.cart_repo = cart_repo
         self.cart_item_repo = cart_item_repo
         self.product_repo = product_repo
+        self.cache = cache
         
-    async def get_cart_summary(self, user: User) -> Cart | dict:
-        cart = await self.cart_repo.get_cart_only(user.id)
-        if cart is None:
-            return {'total_items': 0, 'total_amount': 0}
-        return cart
+    async def get_cart_summary(self, user: Principal) -> dict:
+        if self.cache:
+            generation, body = await self.cache.get(user.id, 'summary')
+            if body is not None:
+                return orjson.loads(body)
+        
+        totals = await self.cart_repo.get_totals(user.id)
+        if totals is None:
+            summary = {'total_items': 0, 'total_amount': 0}
+        else:
+            summary = {'total_items': totals.total_items, 'total_amount': totals.total_amount}
+        
+        if self.cache:
+            await self.cache.put(user.id, 'summary', generation, dumps(summary).decode())
+        return summary
 
-    async def get_user_cart(self, user: User) -> Cart:
+    async def get_user_cart(self, user: Principal) -> Cart:
         return await self.cart_repo.get_cart(user.id)
+    
+    async def get_cart_json(self, user: Principal) -> str:
+        """The user's `CartModel`, serialized; from Redis when the cart cache is on"""
+        if self.cache:
+            generation, body = await self.cache.get(user.id, 'full')
+            if body is not None:
+                return body
+        
+        body = adapter_json(_cart, await self.get_user_cart(user)).decode()
+        if self.cache:
+            await self.cache.put(user.id, 'full', generation, body)
+        return body
+    
+    async def _committed(self, user: Principal, delta: dict) -> dict:
+        """Commit a mutation, then refresh the cached views from its totals"""
+        await self.uow.commit()
+        if self.cache:
+            summary = {'total_items': delta['total_items'], 'total_amount': delta['total_amount']}
+            await self.cache.written(user.id, dumps(summary).decode())
+        return delta
+    
+    @staticmethod
+    def _held(item) -> int:
+        """Units currently reserved for a line; a swept line holds nothing"""
+        return item.quantity if item is not None and item.reserved_until is not None else 0
+    
+    async def _hold(self, product_id: UUID, held: int, quantity: int) -> datetime:
+        """
+        Move the stock held for a cart line from `held` to `quantity` units and
+        return the new hold deadline. Only the difference is reserved or released.
+        """
+        delta = quantity - held
+        if delta > 0:
+            if not await self.product_repo.reserve_stock(product_id, delta):
+                raise HTTPException(409, detail="Not enough stock available")
+        elif delta < 0:
+            await self.product_repo.release_stock({product_id: -delta})
+        return datetime.now(UTC) + timedelta(seconds=config.CART_RESERVATION_TTL)
+    
+    @staticmethod
+    def _delta(row, removed: bool = False) -> dict:
+        """`CartDelta` from a changed-item-with-totals row"""
+        item = None if removed else {
+            'id': row.id,
+            'product_id': row.product_id,
+            'quantity': row.quantity,
+            'unit_price': row.unit_price,
+            'total_price': row.quantity * row.unit_price,
+        }
+        return {
+            'item': item,
+            'removed': [row.id] if removed else [],
+            'unique_items': row.unique_items,
+            'total_items': row.total_items,
+            'total_amount': row.total_amount,
+        }
         
-    async def add_item_to_cart(self, user: User, payload: CartItemCreate) -> Cart:
-        cart = await self.cart_repo.get_cart(user.id)
+    async def add_item_to_cart(self, user: Principal, payload: CartItemCreate) -> dict:
+        cart_id = await self.cart_repo.get_cart_id(user.id)
         
-        product = await self.product_repo.get_by_id(payload.product_id)
+        product = await self.product_repo.get_by_id(payload.product_id, profile='bare')
         if product is None:
             raise HTTPException(404, detail="Product not found")
         
@@ -47,58 +127,67 @@ class CartService:
             raise HTTPException(400, detail="Product is not available for purchase")
         if not product.allow_cart or product.stock_type == StockType.UNIQUE:
             raise HTTPException(409, detail="Cart is disabled for this product")
-        # Check if the product is a stock item and if there is insufficient quantity available.
-        # if product.stock_type == StockType.STOCK and product.quantity_on_hand < payload.quantity: # I don't know if we really need stock type check 
-        if product.quantity_on_hand < payload.quantity:
-            raise HTTPException(409, detail="Not enough stock available")
 
-        existing_item = await self.cart_item_repo.get_cart_item(cart.id, payload.product_id)
-        
-        if existing_item:
-            new_quantity = existing_item.quantity + payload.quantity
-            if new_quantity > 99:
-                raise HTTPException(400, detail="Maximum quantity per item is 99")
-            if product.quantity_on_hand < new_quantity:
-                raise HTTPException(409, detail="Not enough stock available")
-            
-            existing_item.quantity = new_quantity
-        else:
-            cart_item = CartItem(
-                product_id=payload.product_id,
-                seller_org_id=product.org_id,
-                quantity=payload.quantity,
-                unit_price=float(product.price),
-                title=product.title,
-                description=product.description,
-                part_number=product.part_number,
-            )
-            cart.items.append(cart_item)
-            await self.uow.session.flush()
-        
-        return await self.get_user_cart(user)
+        existing_item = await self.cart_item_repo.get_cart_item(cart_id, payload.product_id, for_update=True)
+        new_quantity = payload.quantity + (existing_item.quantity if existing_item else 0)
+        if new_quantity > MAX_LINE_QUANTITY:
+            raise HTTPException(400, detail=f"Maximum quantity per item is {MAX_LINE_QUANTITY}")
         
+        reserved_until = await self._hold(product.id, self._held(existing_item), new_quantity)
+        row = await self.cart_item_repo.add(
+            cart_id,
+            payload.quantity,
+            reserved_until,
+            MAX_LINE_QUANTITY,
+            product_id=product.id,
+            seller_org_id=product.org_id,
+            unit_price=product.price,
+            title=product.title,
+            description=product.description,
+            part_number=product.part_number,
+        )
+        if row is None:
+            # A concurrent add created the line after our read; the hold above is rolled back with us
+            raise HTTPException(400, detail=f"Maximum quantity per item is {MAX_LINE_QUANTITY}")
+        return await self._committed(user, self._delta(row))
 
-    async def update_cart_item_quantity(self, user: User, item_id: UUID, payload: CartItemUpdate) -> Cart:
-        cart_item = await self.cart_item_repo.update_quantity(item_id, payload.quantity)
+    async def update_cart_item_quantity(self, user: Principal, item_id: UUID, payload: CartItemUpdate) -> dict:
+        cart_item = await self.cart_item_repo.lock(item_id)
         if cart_item is None:
             raise HTTPException(404, detail="Cart item not found")
-        if cart_item.cart.user_id != user.id:
+        if cart_item.owner_id != user.id:
             raise HTTPException(403, detail="You are not allowed to update this item")
-        if cart_item.product.stock_type == StockType.STOCK and cart_item.product.quantity_on_hand < payload.quantity:
-            raise HTTPException(409, detail="Not enough stock available")
-
-        return await self.get_user_cart(user)
+        
+        reserved_until = await self._hold(cart_item.product_id, self._held(cart_item), payload.quantity)
+        row = await self.cart_item_repo.set_quantity(item_id, cart_item.quantity, payload.quantity, reserved_until)
+        return await self._committed(user, self._delta(row))
 
-    async def remove_item_from_cart(self, user: User, item_id: UUID) -> Cart:
-        removed = await self.cart_item_repo.remove_item(item_id)
-        if removed is None:
+    async def remove_item_from_cart(self, user: Principal, item_id: UUID) -> dict:
+        cart_item = await self.cart_item_repo.lock(item_id)
+        if cart_item is None:
             raise HTTPException(404, detail="Item not found in cart")
-        if removed.cart.user_id != user.id:
+        if cart_item.owner_id != user.id:
             raise HTTPException(403, detail="You are not allowed to remove this item")
         
-        return await self.get_user_cart(user)
+        row = await self.cart_item_repo.remove_item(item_id)
+        if held := self._held(cart_item):
+            await self.product_repo.release_stock({cart_item.product_id: held})
+        return await self._committed(user, self._delta(row, removed=True))
 
-    async def clear_cart(self, user: User) -> Cart:
-        await self.cart_repo.clear_cart(user.id)
+    async def clear_cart(self, user: Principal) -> dict:
+        removed = await self.cart_repo.clear_cart(user.id)
+        holds: dict[UUID, int] = {}
+        for item in removed:
+            if held := self._held(item):
+                holds[item.product_id] = held
+        await self.product_repo.release_stock(holds)
         
-        return await self.get_user_cart(user)
+        # Lines added concurrently survive the clear, so the totals come from the statement itself
+        totals = removed[0] if removed else await self.cart_repo.get_totals(user.id)
+        return await self._committed(user, {
+            'item': None,
+            'removed': [item.id for item in removed],
+            'unique_items': totals.unique_items if totals else 0,
+            'total_items': totals.total_items if totals else 0,
+            'total_amount': totals.total_amount if totals else 0,
+        })
@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+from datetime import datetime, UTC
+
+from core.config import Settings
+from database.relational_db import get_uow, CartItemInterface, ProductsInterface
+
+config = Settings() # pyright: ignore[reportCallIssue]
+logger = logging.getLogger(__name__)
+
+
+async def sweep_expired_reservations() -> int:
+    """Release one batch of lapsed cart holds. Returns the number of units freed"""
+    async for uow in get_uow():
+        holds = await CartItemInterface(uow.session).expire_holds(datetime.now(UTC), config.RESERVATION_SWEEP_BATCH)
+        await ProductsInterface(uow.session).release_stock(holds)
+    return sum(holds.values())
+
+
+async def run_reservation_sweeper() -> None:
+    """
+    Give back stock held by carts that were left alone past `CART_RESERVATION_TTL`.
+    
+    Every worker runs one; they split the work through `SKIP LOCKED`. The item
+    stays in the cart, unheld, and reserves again on its next change.
+    """
+    while True:
+        try:
+            released = await sweep_expired_reservations()
+            if released:
+                logger.info(f'Released {released} units from expired cart holds')
+                # Keep draining until a sweep comes back empty
+                continue
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f'Reservation sweep failed: {e!s}')
+        await asyncio.sleep(config.RESERVATION_SWEEP_INTERVAL)
@@ -1,6 +1,6 @@
 from fastapi import Depends
 
-from database.relational_db import (UoW, get_uow, GarageVehiclesInterface)
+from database.relational_db import (UoW, get_uow, get_read_uow, GarageVehiclesInterface)
 from .garage_service import GarageService
 
 
@@ -9,3 +9,9 @@ async def get_garage_service(
 ) -> GarageService:
     garage_repo = GarageVehiclesInterface(uow.session)
     return GarageService(uow, garage_repo)
+
+
+async def get_garage_read_service(
+    uow: UoW = Depends(get_read_uow),
+) -> GarageService:
+    return await get_garage_service(uow)
@@ -1,14 +1,14 @@
 from uuid import UUID
-from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 
 from database.relational_db import (
     UoW, 
-    User,
     GarageVehicle,
-    GarageVehiclesInterface
+    GarageVehiclesInterface,
+    InvalidCursor,
 )
+from domain.auth import Principal
 from domain.garage import VehicleCreate, VehiclePatch
 
 class GarageService:
@@ -20,7 +20,7 @@ class GarageService:
         self.uow = uow
         self.gv_repo = gv_repo
 
-    async def add_vehicle(self, vehicle: VehicleCreate, user: User) -> GarageVehicle:
+    async def add_vehicle(self, vehicle: VehicleCreate, user: Principal) -> GarageVehicle:
         new_vehicle = GarageVehicle(**vehicle.model_dump(), user_id=user.id)
         try:
             await self.gv_repo.add(new_vehicle)
@@ -30,7 +30,7 @@ class GarageService:
         except IntegrityError as e:
             raise HTTPException(400, detail=str(e))
 
-    async def get_vehicle(self, vehicle_id: UUID | str, user: User) -> GarageVehicle:
+    async def get_vehicle(self, vehicle_id: UUID | str, user: Principal) -> GarageVehicle:
         vehicle = await self.gv_repo.get_by_id(vehicle_id)
         if vehicle is None:
             raise HTTPException(404, detail='Vehicle with this id not found')
@@ -42,7 +42,7 @@ class GarageService:
         self, 
         payload: VehiclePatch, 
         vehicle_id: UUID | str, 
-        user: User
+        user: Principal
     ) -> GarageVehicle:
         vehicle = await self.gv_repo.patch(vehicle_id, payload.model_dump(exclude_unset=True))
         if vehicle is None:
@@ -65,37 +65,19 @@ class GarageService:
         model_id: int | None = None,
         cursor: str | None = None,
     ) -> tuple[list[GarageVehicle], str | None]:
-        cursor_created_at = None
-        cursor_id = None
-        if cursor:
-            try:
-                ts_str, id_str = cursor.split("_", 1)
-                cursor_created_at = datetime.fromisoformat(ts_str)
-                cursor_id = UUID(id_str)
-            except Exception:
-                raise HTTPException(400, detail='Invalid cursor')
-
-        vehicles = await self.gv_repo.search(
-            user_id=user_id,
-            limit=limit,
-            search=search,
-            make_id=make_id,
-            model_id=model_id,
-            cursor_created_at=cursor_created_at,
-            cursor_id=cursor_id,
-        )
-
-        next_cursor = None
-        if len(vehicles) == limit:
-            last = vehicles[-1]
-            if last.created_at is None:
-                next_cursor = None
-            else:
-                next_cursor = f"{last.created_at.isoformat()}_{last.id}"
-
-        return vehicles, next_cursor
+        try:
+            return await self.gv_repo.search(
+                user_id=user_id,
+                limit=limit,
+                search=search,
+                make_id=make_id,
+                model_id=model_id,
+                cursor=cursor,
+            )
+        except InvalidCursor:
+            raise HTTPException(400, detail='Invalid cursor')
 
-    async def delete_vehicle(self, vehicle_id: UUID | str, user: User) -> None:
+    async def delete_vehicle(self, vehicle_id: UUID | str, user: Principal) -> None:
         vehicle = await self.gv_repo.delete(vehicle_id)
         if vehicle is None:
             raise HTTPException(404, detail='Vehicle with this id not found')
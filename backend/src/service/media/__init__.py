@@ -0,0 +1,8 @@
+from .garbage_collector import (
+    GCReport,
+    collect_batch,
+    collect_media_garbage,
+    run_media_gc,
+    sweep_staging,
+    unkeyed_media,
+)
@@ -0,0 +1,188 @@
+import os
+import time
+import asyncio
+import logging
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import Settings
+from core.storage import MediaStorage, get_media_storage
+from core.storage.staging import staging_dir
+from database.relational_db import read_uow, ProductMediaInterface, UserInterface
+
+config = Settings() # pyright: ignore[reportCallIssue]
+logger = logging.getLogger(__name__)
+
+CURSOR_KEY = "media:gc-cursor"
+STATS_KEY = "media:gc-stats"
+LOCK_KEY = "media:gc-lock"
+
+
+@dataclass(slots=True)
+class GCReport:
+    scanned: int = 0
+    orphans: int = 0
+    deleted: int = 0
+    reclaimed_bytes: int = 0
+    # Last key covered; None once the scan has reached the end of the store
+    cursor: str | None = None
+
+    def add(self, other: 'GCReport') -> None:
+        self.scanned += other.scanned
+        self.orphans += other.orphans
+        self.deleted += other.deleted
+        self.reclaimed_bytes += other.reclaimed_bytes
+        self.cursor = other.cursor
+
+
+async def _referenced(session: AsyncSession, storage: MediaStorage, keys: list[str]) -> set[str]:
+    """Which of `keys` a product photo or profile picture points at"""
+    urls = {storage.url(key): key for key in keys}
+    referenced = await ProductMediaInterface(session).referenced_keys(keys)
+    pictures = await UserInterface(session).referenced_pictures(list(urls))
+    return referenced | {urls[url] for url in pictures}
+
+
+async def collect_batch(
+    storage: MediaStorage,
+    after: str | None,
+    limit: int,
+    grace: timedelta,
+    dry_run: bool = False,
+) -> GCReport:
+    """
+    Delete the unreferenced blobs among the next `limit` keys after `after`.
+
+    Blobs younger than `grace` are never touched: they may belong to an
+    upload whose row is not committed yet. Right before deleting an orphan it
+    is stat'ed again (reusing a blob refreshes its modification time) and
+    then its references are looked up again, which catches rows committed
+    since the batch was read, including ones that never touched the blob.
+
+    One race remains: a `store()` that reuses the blob and whose `touch()`
+    lands between that last stat and the delete loses its file, and the
+    photo it then commits is broken. Both sides must hit the same blob within
+    milliseconds after it sat unreferenced for the whole grace period.
+    """
+    blobs = await storage.list_blobs(after, limit)
+    report = GCReport(scanned=len(blobs), cursor=blobs[-1].key if len(blobs) == limit else None)
+
+    cutoff = datetime.now(UTC) - grace
+    candidates = [blob for blob in blobs if blob.modified is not None and blob.modified < cutoff]
+    if not candidates:
+        return report
+
+    # Primary, not the replica: a row committed a moment ago must count
+    async with read_uow(replica=False) as uow:
+        referenced = await _referenced(uow.session, storage, [blob.key for blob in candidates])
+        orphans = [blob for blob in candidates if blob.key not in referenced]
+        report.orphans = len(orphans)
+        for blob in orphans:
+            if dry_run:
+                report.reclaimed_bytes += blob.size
+                continue
+            current = await storage.stat(blob.key)
+            if current is None or current.modified is None or current.modified >= cutoff:
+                continue
+            if await _referenced(uow.session, storage, [blob.key]):
+                continue
+            await storage.delete(blob.key)
+            report.deleted += 1
+            report.reclaimed_bytes += blob.size
+    return report
+
+
+async def unkeyed_media(storage: MediaStorage) -> int:
+    """
+    Product photos in this storage that are only known by URL. The collector
+    matches photos by `storage_key`, so it must not run while there are any:
+    their blobs would look orphaned.
+    """
+    async with read_uow(replica=False) as uow:
+        return await ProductMediaInterface(uow.session).count_unkeyed(f"{storage.public_url}/")
+
+
+def _sweep_staging(cutoff: float) -> tuple[int, int]:
+    removed = reclaimed = 0
+    with os.scandir(staging_dir()) as it:
+        for entry in it:
+            try:
+                info = entry.stat(follow_symlinks=False)
+                if entry.is_file(follow_symlinks=False) and info.st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+                    reclaimed += info.st_size
+            except FileNotFoundError:
+                continue
+    return removed, reclaimed
+
+
+async def sweep_staging(grace: timedelta) -> tuple[int, int]:
+    """Remove staged uploads left behind by crashed requests. Returns (files, bytes)"""
+    return await asyncio.to_thread(_sweep_staging, time.time() - grace.total_seconds())
+
+
+async def collect_media_garbage(redis: Redis, dry_run: bool = False) -> GCReport:
+    """
+    One incremental run: up to `MEDIA_GC_BATCHES` batches from the cursor kept
+    in Redis, so a full pass over millions of blobs spreads over many runs and
+    survives restarts.
+    """
+    storage = get_media_storage()
+    grace = timedelta(seconds=config.MEDIA_GC_GRACE)
+    cursor = await redis.get(CURSOR_KEY)
+
+    total = GCReport(cursor=cursor)
+    if unkeyed := await unkeyed_media(storage):
+        logger.warning(f'Media GC skipped: {unkeyed} product media rows have no storage_key, run the migrations first')
+        return total
+
+    if cursor is None and not dry_run:
+        files, reclaimed = await sweep_staging(grace)
+        total.deleted += files
+        total.reclaimed_bytes += reclaimed
+
+    for _ in range(config.MEDIA_GC_BATCHES):
+        total.add(await collect_batch(storage, total.cursor, config.MEDIA_GC_BATCH, grace, dry_run))
+        if total.cursor is None:
+            break
+
+    if not dry_run:
+        async with redis.pipeline(transaction=True) as pipe:
+            if total.cursor is None:
+                pipe.delete(CURSOR_KEY)
+                pipe.hset(STATS_KEY, "last_pass_at", datetime.now(UTC).isoformat())
+            else:
+                pipe.set(CURSOR_KEY, total.cursor)
+            pipe.hincrby(STATS_KEY, "scanned", total.scanned)
+            pipe.hincrby(STATS_KEY, "deleted", total.deleted)
+            pipe.hincrby(STATS_KEY, "reclaimed_bytes", total.reclaimed_bytes)
+            await pipe.execute()
+
+    if total.deleted or total.orphans:
+        logger.info(
+            f'Media GC: scanned {total.scanned}, {total.orphans} orphans, deleted {total.deleted}, '
+            f'reclaimed {total.reclaimed_bytes / 1024 / 1024:.1f} MiB'
+        )
+    return total
+
+
+async def run_media_gc(redis: Redis) -> None:
+    """
+    Reclaim media that no product photo or profile picture references.
+
+    Every worker runs one; the Redis lock lets a single worker do each run,
+    once per `MEDIA_GC_INTERVAL`.
+    """
+    while True:
+        try:
+            if await redis.set(LOCK_KEY, "1", nx=True, ex=config.MEDIA_GC_INTERVAL):
+                await collect_media_garbage(redis)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f'Media GC run failed: {e!s}')
+        await asyncio.sleep(config.MEDIA_GC_INTERVAL)
@@ -1,12 +1,22 @@
 from fastapi import Depends
 
-from database.relational_db import UoW, get_uow
+from database.relational_db import UoW, get_uow, get_read_uow
 from database.relational_db.tables.organizations.organizations_interface import OrganizationsInterface
+from service.auth import PrincipalCache, get_principal_cache
 from .organization_service import OrganizationService
 
 
 async def get_organization_service(
     uow: UoW = Depends(get_uow),
+    principals: PrincipalCache = Depends(get_principal_cache),
 ) -> OrganizationService:
     org_repo = OrganizationsInterface(uow.session)
-    return OrganizationService(uow, org_repo)
+    return OrganizationService(uow, org_repo, principals)
+
+
+
+async def get_organization_read_service(
+    uow: UoW = Depends(get_read_uow),
+    principals: PrincipalCache = Depends(get_principal_cache),
+) -> OrganizationService:
+    return await get_organization_service(uow, principals)
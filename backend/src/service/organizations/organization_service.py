@@ -1,16 +1,19 @@
 from uuid import UUID
 
-from database.relational_db import UoW, User, Organization, OrganizationsInterface
+from database.relational_db import UoW, Organization, OrganizationsInterface
+from domain.auth import Principal
 from domain.organizations import OrganizationCreate
 from domain.organizations.enums import KycStatus
+from service.auth import PrincipalCache
 
 
 class OrganizationService:
-    def __init__(self, uow: UoW, org_repo: OrganizationsInterface):
+    def __init__(self, uow: UoW, org_repo: OrganizationsInterface, principals: PrincipalCache):
         self.uow = uow
         self.org_repo = org_repo
+        self.principals = principals
 
-    async def create_organization(self, owner: User, country_code: str, name: str) -> Organization:
+    async def create_organization(self, owner: Principal, country_code: str, name: str) -> Organization:
         organization = Organization(
             name=name,
             country=country_code,
@@ -21,6 +24,8 @@ class OrganizationService:
 
         await self.org_repo.add(organization)
         await self.uow.commit()
+        # Cached principal carries the owned organization ids
+        await self.principals.invalidate(owner.id)
         await self.uow.session.refresh(organization)
         return organization
 
@@ -30,5 +35,5 @@ class OrganizationService:
     async def get_by_stripe_account_id(self, stripe_account_id: str) -> Organization | None:
         return await self.org_repo.get_by_stripe_account_id(stripe_account_id)
 
-    async def list_my(self, owner: User) -> list[Organization]:
+    async def list_my(self, owner: Principal) -> list[Organization]:
         return await self.org_repo.list_by_owner(owner.id)
@@ -1,15 +1,25 @@
+from typing import AsyncGenerator
 from fastapi import Depends
 from redis.asyncio import Redis
 
-from database.redis import get_redis
+from core.storage import get_media_storage
+from database.redis import get_redis, CacheRepo
 from database.relational_db import (
     UoW,
     get_uow,
+    get_read_uow,
+    read_uow,
     ProductsInterface,
     ProductMediaInterface,
     CartItemInterface,
 )
 from .product_service import ProductService
+from .product_counts import ProductCounts
+from .catalog_cache import CatalogCache
+
+
+def get_catalog_cache(redis: Redis = Depends(get_redis)) -> CatalogCache:
+    return CatalogCache(redis)
 
 
 async def get_product_service(
@@ -20,4 +30,29 @@ async def get_product_service(
     products_repo = ProductsInterface(uow.session)
     media_repo = ProductMediaInterface(uow.session)
     carts_repo = CartItemInterface(uow.session)
-    return ProductService(uow, products_repo, media_repo, carts_repo, redis=redis)
+    counts = ProductCounts(products_repo, CacheRepo(redis))
+    return ProductService(uow, products_repo, media_repo, carts_repo, counts, CatalogCache(redis), get_media_storage(), redis=redis)
+
+
+async def get_product_read_service(
+    uow: UoW = Depends(get_read_uow),
+    redis: Redis = Depends(get_redis),
+) -> ProductService:
+    """Read-only ProductService on the primary"""
+    return await get_product_service(uow, redis)
+
+
+async def get_catalog_uow(
+    cache: CatalogCache = Depends(get_catalog_cache),
+) -> AsyncGenerator[UoW, None]:
+    """Replica UoW, or the primary right after a listing write while the replica may lag"""
+    async with read_uow(replica=await cache.use_replica()) as uow:
+        yield uow
+
+
+async def get_public_product_service(
+    uow: UoW = Depends(get_catalog_uow),
+    redis: Redis = Depends(get_redis),
+) -> ProductService:
+    """Read-only ProductService for public catalog routes, on the replica unless a listing was just written"""
+    return await get_product_service(uow, redis)
@@ -0,0 +1,132 @@
+import json
+import time
+import asyncio
+import hashlib
+import logging
+
+from enum import Enum
+from typing import Awaitable, Callable
+from fastapi import Request, Response
+from redis.asyncio import Redis
+
+from core.config import Settings
+from core.http_cache import strong_etag, cached_response
+
+config = Settings() # pyright: ignore[reportCallIssue]
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = 'catalog:generation'
+PRIMARY_KEY = 'catalog:primary'
+CACHE_CONTROL = 'public, no-cache'
+
+
+class CatalogCache:
+    """
+    Response cache for the anonymous feed and catalog pages.
+    
+    Entries hold the serialized JSON body and its ETag under a key made of the
+    catalog generation, the route and its normalized query params. Publishing,
+    editing or removing a listing bumps the generation, so every page is
+    recomputed on next access and the old entries just expire.
+    
+    An entry is fresh for `CATALOG_CACHE_FRESH` seconds and may be served stale
+    for `CATALOG_CACHE_STALE` more while a single request (holding a Redis lock)
+    recomputes it. On a cold miss concurrent requests wait for that one instead
+    of all hitting Postgres.
+    
+    Pages are normally computed on the replica, which may lag behind the write
+    that bumped the generation. For `CATALOG_PRIMARY_WINDOW` seconds after a
+    bump `use_replica` says no, and a page whose replica session was picked
+    under an older generation is served but not stored.
+    """
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self._replica_generation: str | None = None
+    
+    async def bump(self) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.incr(GENERATION_KEY)
+            pipe.set(PRIMARY_KEY, '1', px=int(config.CATALOG_PRIMARY_WINDOW * 1000))
+            await pipe.execute()
+    
+    async def use_replica(self) -> bool:
+        """Whether pages may be computed on the replica right now"""
+        generation, pinned = await self.redis.mget(GENERATION_KEY, PRIMARY_KEY)
+        if pinned is not None:
+            return False
+        self._replica_generation = generation or '0'
+        return True
+    
+    @staticmethod
+    def _digest(params: dict) -> str:
+        normalized = {
+            k: v.value if isinstance(v, Enum) else v
+            for k, v in sorted(params.items()) if v is not None
+        }
+        raw = json.dumps(normalized, separators=(',', ':'), default=str)
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    
+    async def respond(
+        self,
+        request: Request,
+        scope: str,
+        params: dict,
+        compute: Callable[[], Awaitable[str]],
+    ) -> Response:
+        generation = await self.redis.get(GENERATION_KEY) or '0'
+        key = f"catalog:{generation}:{scope}:{self._digest(params)}"
+        
+        # Bumped since this request picked the replica, which may not have the write yet
+        replica_behind = self._replica_generation not in (None, generation)
+        
+        entry = await self.redis.get(key)
+        if entry is not None:
+            fresh_until, etag, body = entry.split('|', 2)
+            if float(fresh_until) > time.time() or replica_behind or not await self._lock(key):
+                return cached_response(request, body, etag, CACHE_CONTROL)
+            # Stale and we won the lock: this request refreshes, others keep getting the stale copy
+            return await self._fill(request, key, compute)
+        
+        if replica_behind:
+            # Serve the replica's view but don't cache it under the new generation
+            body = await compute()
+            return cached_response(request, body, strong_etag(body), CACHE_CONTROL)
+        
+        if await self._lock(key):
+            return await self._fill(request, key, compute)
+        
+        # Somebody else is computing this page right now
+        deadline = time.monotonic() + config.CATALOG_CACHE_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            entry = await self.redis.get(key)
+            if entry is not None:
+                _, etag, body = entry.split('|', 2)
+                return cached_response(request, body, etag, CACHE_CONTROL)
+        
+        logger.info('Gave up waiting for %s, computing it here', key)
+        return await self._fill(request, key, compute, locked=False)
+    
+    async def _lock(self, key: str) -> bool:
+        return bool(await self.redis.set(f"{key}:lock", '1', nx=True, ex=config.CATALOG_CACHE_LOCK_TTL))
+    
+    async def _fill(
+        self,
+        request: Request,
+        key: str,
+        compute: Callable[[], Awaitable[str]],
+        locked: bool = True,
+    ) -> Response:
+        try:
+            body = await compute()
+            etag = strong_etag(body)
+            await self.redis.set(
+                key,
+                f"{time.time() + config.CATALOG_CACHE_FRESH}|{etag}|{body}",
+                ex=config.CATALOG_CACHE_FRESH + config.CATALOG_CACHE_STALE,
+            )
+        finally:
+            if locked:
+                await self.redis.delete(f"{key}:lock")
+        
+        return cached_response(request, body, etag, CACHE_CONTROL)
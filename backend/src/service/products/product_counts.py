@@ -0,0 +1,59 @@
+from uuid import UUID
+
+from core.config import Settings
+from database.redis import CacheRepo
+from database.relational_db import ProductsInterface
+from domain.common import CountMode
+from domain.products import ProductStatus
+
+config = Settings() # pyright: ignore[reportCallIssue]
+
+
+class ProductCounts:
+    """
+    Totals for paginated organization listings.
+    
+    Exact counts without a text filter are cached per (org, status) and dropped
+    by `invalidate` after every product write of that org. Searches are not
+    cached: they are counted on demand or estimated by the planner.
+    """
+    def __init__(self, repo: ProductsInterface, cache: CacheRepo | None):
+        self.repo = repo
+        self.cache = cache
+    
+    @staticmethod
+    def _key(org_id: UUID | str, status: ProductStatus | None) -> str:
+        return f"product-count:{org_id}:{status.value if status else 'all'}"
+    
+    async def org_products(
+        self,
+        org_id: UUID | str,
+        *,
+        status: ProductStatus | None,
+        search: str | None,
+        mode: CountMode,
+    ) -> int | None:
+        if mode == CountMode.NONE:
+            return None
+        if mode == CountMode.ESTIMATE:
+            return await self.repo.count_by_org(org_id, status=status, search=search, estimate=True)
+        
+        if search or self.cache is None:
+            return await self.repo.count_by_org(org_id, status=status, search=search)
+        
+        key = self._key(org_id, status)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return int(cached)
+        
+        total = await self.repo.count_by_org(org_id, status=status)
+        await self.cache.set(key, str(total), config.PRODUCT_COUNT_TTL)
+        return total
+    
+    async def invalidate(self, org_id: UUID | str) -> None:
+        if self.cache is None:
+            return
+        await self.cache.delete(
+            self._key(org_id, None),
+            *(self._key(org_id, status) for status in ProductStatus),
+        )
@@ -1,12 +1,20 @@
-import aiofiles
-from uuid import UUID, uuid4
-from datetime import datetime
-from pathlib import Path
-from fastapi import UploadFile, status, HTTPException
+import asyncio
+import logging
+from uuid import UUID
+from fastapi import Request, status, HTTPException
 from redis.asyncio import Redis
 from sqlalchemy.exc import IntegrityError
 
 from core.config import Settings
+from core.storage import (
+    MediaStorage,
+    StorageError,
+    StagedBlob,
+    ReceivedFile,
+    content_key,
+    is_content_key,
+    receive_files,
+)
 from database.relational_db import (
     UoW,
     ProductsInterface,
@@ -15,18 +23,29 @@ from database.relational_db import (
     ProductMedia,
     Organization,
     CartItemInterface,
+    InvalidCursor,
+    normalize_part_number,
 )
+from domain.common import CountMode
 from domain.products import (
     ProductCreate,
     ProductPatch,
     MediaCreate,
+    PhotoUploadResult,
+    PhotoUploadRequest,
+    PhotoUploadTicket,
     ProductStatus,
     ProductCondition,
     ProductOriginality,
+    ProductSort,
     StockType,
 )
 
+from .product_counts import ProductCounts
+from .catalog_cache import CatalogCache
+
 settings = Settings() # type: ignore
+logger = logging.getLogger(__name__)
 
 class ProductService:
     """Service for working with products"""
@@ -37,12 +56,18 @@ class ProductService:
         products_repo: ProductsInterface,
         media_repo: ProductMediaInterface,
         carts_repo: CartItemInterface,
+        counts: ProductCounts,
+        catalog: CatalogCache,
+        storage: MediaStorage,
         redis: Redis | None = None,
     ):
         self.uow = uow
         self.products_repo = products_repo
         self.media_repo = media_repo
         self.carts_repo = carts_repo
+        self.counts = counts
+        self.catalog = catalog
+        self.storage = storage
         self.redis = redis
         
         
@@ -60,6 +85,12 @@ class ProductService:
         if not product.allow_cart and not product.allow_chat:
             raise ValueError("Product must allow either cart or chat")
 
+    async def _changed(self, product: Product, was_public: bool = False) -> None:
+        """Drop derived data after a committed write: org counts and, if buyers could see it, catalog pages"""
+        await self.counts.invalidate(product.org_id)
+        if was_public or product.status == ProductStatus.PUBLISHED:
+            await self.catalog.bump()
+
     async def create_product(
         self,
         org: Organization,
@@ -74,6 +105,7 @@ class ProductService:
                 raise ValueError("Idempotency key already used")
 
         product = Product(
+            org_id=org.id,
             make_id=payload.make_id,
             title=payload.title,
             description=payload.description,
@@ -88,7 +120,7 @@ class ProductService:
             allow_cart=payload.allow_cart,
             allow_chat=payload.allow_chat,
         )
-        org.products.append(product)
+        await self.products_repo.add(product)
         try:
             self._validate_product_integrity(product)
             await self.uow.commit()
@@ -97,6 +129,7 @@ class ProductService:
         except IntegrityError as e:
             raise HTTPException(status_code=400, detail=f"Failed to add product to organization. Probably make_id is invalid")
         
+        await self._changed(product)
         await self.uow.session.refresh(product)
         return product
 
@@ -108,15 +141,22 @@ class ProductService:
         limit: int,
         status: ProductStatus | None,
         search: str | None,
-    ) -> tuple[list[Product], int]:
-        """Get organization products list with filters and pagination"""
-        return await self.products_repo.list_by_org(
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[list[Product], int | None, bool]:
+        """Organization products page, its total per `count` and whether the total is estimated"""
+        items = await self.products_repo.list_by_org(
             org_id, 
             offset=offset, 
             limit=limit, 
             status=status, 
             search=search
         )
+        # A short page is the last one: the total is known without counting
+        if count != CountMode.NONE and len(items) < limit and (items or offset == 0):
+            return items, offset + len(items), False
+        
+        total = await self.counts.org_products(org_id, status=status, search=search, mode=count)
+        return items, total, count == CountMode.ESTIMATE
 
     async def get_product(self, product_id: UUID | str) -> Product | None:
         """Get product by ID"""
@@ -124,6 +164,7 @@ class ProductService:
 
     async def patch_product(self, product: Product, payload: ProductPatch) -> Product:
         """Update product"""
+        was_public = product.status == ProductStatus.PUBLISHED
         data = payload.model_dump(exclude_unset=True)
         for field, value in data.items():
             setattr(product, field, value)
@@ -141,6 +182,7 @@ class ProductService:
         except IntegrityError as e:
             raise HTTPException(status_code=400, detail=f"Failed to update product: {str(e)}")
         
+        await self._changed(product, was_public)
         await self.uow.session.refresh(product)
         return product
 
@@ -148,6 +190,7 @@ class ProductService:
         """Delete product"""
         await self.products_repo.delete(product.id)
         await self.uow.commit()
+        await self._changed(product)
 
     async def publish(self, product: Product) -> Product:
         """Publish product"""
@@ -158,140 +201,188 @@ class ProductService:
             raise HTTPException(status_code=400, detail=str(e))
         
         await self.uow.commit()
+        await self._changed(product)
         await self.uow.session.refresh(product)
         return product
 
     async def unpublish(self, product: Product) -> Product:
         """Unpublish product"""
+        was_public = product.status == ProductStatus.PUBLISHED
         product.status = ProductStatus.ARCHIVED
         
-        # await self.uow.commit()
+        await self.uow.commit()
+        await self._changed(product, was_public)
         # await self.uow.session.refresh(product)
         return product
 
     async def add_media(self, product: Product, payload: MediaCreate) -> ProductMedia:
         """Add media file to product"""
-        media = ProductMedia(product_id=product.id, url=payload.url, alt=payload.alt)
+        media = ProductMedia(
+            product_id=product.id,
+            url=payload.url,
+            storage_key=self.storage.key_from_url(payload.url),
+            alt=payload.alt,
+        )
         await self.media_repo.add(media)
         await self.uow.commit()
+        if product.status == ProductStatus.PUBLISHED:
+            await self.catalog.bump()
         await self.uow.session.refresh(media)
         return media
 
-    async def delete_media(self, media: ProductMedia) -> None:
-        """Delete media file and remove from filesystem"""
-        # Delete physical file first
-        try:
-            if media.url and settings.MEDIA_DIR in media.url:
-                url_parts = media.url.split(f"/{settings.MEDIA_DIR}/")
-                if len(url_parts) > 1:
-                    relative_path = url_parts[1]
-                    file_path = Path(settings.MEDIA_DIR) / relative_path
-                    if file_path.exists():
-                        file_path.unlink()
-        except Exception:
-            pass
-        
+    async def delete_media(self, product: Product, media: ProductMedia) -> None:
+        """Delete media row, and its file when no other row can share it"""
+        key = media.storage_key
         await self.media_repo.delete(media.id)
+        await self.uow.commit()
+        if product.status == ProductStatus.PUBLISHED:
+            await self.catalog.bump()
 
-    async def add_product_photo(
-        self,
-        file: UploadFile,
-        product: Product
-    ) -> ProductMedia:
-        """Add photo to product (using same approach as user picture upload)"""
-        
-        # Validate file type
-        if file.content_type not in ("image/jpeg", "image/png"):
+        # Content-addressed blobs may back other listings; they are left for a
+        # later cleanup pass. Per-product files belong to this row alone.
+        if key is None or is_content_key(key):
+            return
+        try:
+            await self.storage.delete(key)
+        except StorageError as e:
+            logger.warning(f'Could not delete media blob {key}: {e!s}')
+
+    async def receive_product_photos(self, request: Request, product: Product) -> list[ProductMedia]:
+        """Add photos from a multipart body (`files` field), parsed as it streams in"""
+        received = await receive_files(
+            request, "files", settings.MAX_PHOTO_SIZE * 1024 * 1024, settings.MAX_PHOTOS_PER_UPLOAD
+        )
+        return await self._add_received(product, received)
+
+    async def _add_received(self, product: Product, received: list[ReceivedFile]) -> list[ProductMedia]:
+        """
+        Store staged photos and attach them to product.
+
+        Blobs are stored content-addressed, at most `PHOTO_UPLOAD_CONCURRENCY`
+        at once, and all rows go in with one INSERT and one commit. The batch is
+        all or nothing: if any file was rejected, nothing is stored and the
+        error detail lists the outcome for each file.
+        """
+        if not received:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="No files uploaded")
+
+        staged = [item.outcome for item in received if isinstance(item.outcome, StagedBlob)]
+        if len(staged) < len(received):
+            for blob in staged:
+                blob.path.unlink(missing_ok=True)
+
+            report = []
+            for item in received:
+                if isinstance(item.outcome, StagedBlob):
+                    # Read fine, but dropped with the rest of the batch
+                    report.append(PhotoUploadResult(filename=item.filename, ok=True, status_code=status.HTTP_200_OK))
+                else:
+                    report.append(PhotoUploadResult(
+                        filename=item.filename,
+                        ok=False,
+                        status_code=item.outcome.status_code,
+                        detail=str(item.outcome.detail),
+                    ))
+
+            first = next(result for result in report if not result.ok)
             raise HTTPException(
-                status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                detail="Only JPEG and PNG files are allowed"
+                first.status_code,
+                detail={
+                    "message": "No photos were saved",
+                    "files": [result.model_dump() for result in report],
+                },
             )
-        
-        # Create directory structure
-        product_media_dir = Path(settings.MEDIA_DIR) / "products" / str(product.id)
-        product_media_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Generate unique filename (same approach as user service)
-        ext = ".jpg" if file.content_type == "image/jpeg" else ".png"
-        unique_filename = f"{uuid4().hex}{ext}"
-        
-        # Save file with async approach (same as user service)
-        file_path = product_media_dir / unique_filename
-        limit_bytes = settings.MAX_PHOTO_SIZE * 1024 * 1024
-        written = 0
-        
+
+        semaphore = asyncio.Semaphore(settings.PHOTO_UPLOAD_CONCURRENCY)
+
+        async def store(blob: StagedBlob) -> str:
+            async with semaphore:
+                return await self.storage.store(blob.path, blob.content_type, blob.digest)
+
+        stored = await asyncio.gather(*(store(blob) for blob in staged), return_exceptions=True)
+        for blob in staged:
+            blob.path.unlink(missing_ok=True)
+        for outcome in stored:
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, StorageError):
+                    raise outcome
+                logger.error(f'Media storage failed: {outcome!s}')
+                raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail="Media storage unavailable")
+
+        return await self._attach_photos(product, [key for key in stored if isinstance(key, str)])
+
+    async def presign_photo_upload(self, payload: PhotoUploadRequest) -> PhotoUploadTicket:
+        """Upload URL for a photo the client sends straight to media storage"""
+        if payload.size > settings.MAX_PHOTO_SIZE * 1024 * 1024:
+            raise HTTPException(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Max {settings.MAX_PHOTO_SIZE} MB"
+            )
+
+        key = content_key(payload.sha256, payload.content_type)
+        try:
+            if await self.storage.touch(key):
+                return PhotoUploadTicket(key=key, exists=True)
+            upload = await self.storage.presign_put(
+                key, payload.content_type, payload.size, payload.sha256, settings.MEDIA_UPLOAD_URL_TTL
+            )
+        except StorageError as e:
+            raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Direct uploads unavailable: {e!s}")
+
+        return PhotoUploadTicket(
+            key=key,
+            exists=False,
+            url=upload.url,
+            method=upload.method,
+            headers=upload.headers,
+            expires_at=upload.expires_at,
+        )
+
+    async def confirm_photo_uploads(self, product: Product, keys: list[str]) -> list[ProductMedia]:
+        """Attach photos uploaded with `presign_photo_upload` tickets"""
+        if len(keys) > settings.MAX_PHOTOS_PER_UPLOAD:
+            raise HTTPException(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Too many files. Max {settings.MAX_PHOTOS_PER_UPLOAD} per request"
+            )
+        if not all(is_content_key(key) for key in keys):
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Invalid media key")
+
         try:
-            async with aiofiles.open(file_path, "wb") as out:
-                while chunk := await file.read(1024 * 1024):
-                    if written + len(chunk) > limit_bytes:
-                        try:
-                            await out.flush()
-                            await out.close()
-                        except Exception:
-                            pass
-                        try:
-                            file_path.unlink(missing_ok=True)
-                        except Exception:
-                            pass
-                        raise HTTPException(
-                            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                            detail=f"File too large. Max {settings.MAX_PHOTO_SIZE} MB"
-                        )
-                    await out.write(chunk)
-                    written += len(chunk)
-        except HTTPException:
-            raise
-        except Exception as e:
-            try:
-                file_path.unlink(missing_ok=True)
-            except Exception:
-                pass
+            blobs = await asyncio.gather(*(self.storage.stat(key) for key in keys))
+        except StorageError as e:
+            logger.error(f'Media storage failed: {e!s}')
+            raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail="Media storage unavailable")
+
+        missing = [key for key, blob in zip(keys, blobs) if blob is None]
+        if missing:
             raise HTTPException(
-                status.HTTP_500_INTERNAL_SERVER_ERROR, 
-                detail=f"Could not save file: {str(e)}"
+                status.HTTP_409_CONFLICT,
+                detail={"message": "Uploads not found", "keys": missing},
             )
-        
-        # Create media record
-        media_url = f"{settings.SITE_URL}/{settings.MEDIA_DIR}/products/{product.id}/{unique_filename}"
-        media = ProductMedia(
-            product_id=product.id,
-            url=media_url,
-            alt=f"{product.make.name} {product.part_number} photo"
+        if any(blob is not None and blob.size > settings.MAX_PHOTO_SIZE * 1024 * 1024 for blob in blobs):
+            raise HTTPException(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Max {settings.MAX_PHOTO_SIZE} MB"
+            )
+
+        return await self._attach_photos(product, keys)
+
+    async def _attach_photos(self, product: Product, keys: list[str]) -> list[ProductMedia]:
+        """One INSERT for all media rows, one commit"""
+        alt = f"{product.make.make_name} {product.part_number} photo"
+        # Blobs whose rows fail to commit stay unreferenced; they may be shared,
+        # so they are not removed here
+        media = await self.media_repo.add_many(
+            product.id, [(self.storage.url(key), key, alt) for key in keys]
         )
-        
-        await self.media_repo.add(media)
         await self.uow.commit()
-        await self.uow.session.refresh(product)
-        
-        return media
 
-    async def add_product_photos(
-        self,
-        files: list[UploadFile],
-        product: Product
-    ) -> list[ProductMedia]:
-        """Add multiple photos to product"""
-        media_files = []
-        
-        # Validate all files first before processing any
-        for file in files:
-            if file.content_type not in ("image/jpeg", "image/png"):
-                raise HTTPException(
-                    status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                    detail=f"File {file.filename}: Only JPEG and PNG files are allowed"
-                )
-        
-        # Process each file
-        for file in files:
-            try:
-                media = await self.add_product_photo(file, product)
-                media_files.append(media)
-            except Exception as e:
-                # If any file fails, we still want to return the successful ones
-                # But we should log or handle the error appropriately
-                raise e  # For now, fail fast
-        
-        return media_files
+        if product.status == ProductStatus.PUBLISHED:
+            await self.catalog.bump()
+        await self.uow.session.refresh(product, ["media"])
+
+        return media
 
     async def get_feed_products(
         self,
@@ -310,79 +401,62 @@ class ProductService:
         *,
         limit: int = 20,
         search: str | None = None,
+        sort: ProductSort | None = None,
         make_id: int | None = None,
         condition: ProductCondition | None = None,
         originality: ProductOriginality | None = None,
         price_min: float | None = None,
         price_max: float | None = None,
         cursor: str | None = None,
-    ) -> tuple[list[Product], str | None]:
-        """Search published products with cursor pagination (same pattern as admin users)"""
-        cursor_created_at = None
-        cursor_id = None
-        if cursor:
-            try:
-                ts_str, id_str = cursor.split("_", 1)
-                cursor_created_at = datetime.fromisoformat(ts_str)
-                cursor_id = UUID(id_str)
-            except Exception:
-                raise HTTPException(400, detail='Invalid cursor')
-
-        products = await self.products_repo.search_published_products_cursor(
-            limit=limit,
-            search=search,
-            make_id=make_id,
-            condition=condition,
-            originality=originality,
-            price_min=price_min,
-            price_max=price_max,
-            cursor_created_at=cursor_created_at,
-            cursor_id=cursor_id,
-        )
-
-        next_cursor = None
-        if len(products) == limit:
-            last = products[-1]
-            if last.created_at is None:
-                next_cursor = None
-            else:
-                next_cursor = f"{last.created_at.isoformat()}_{last.id}"
-
-        return products, next_cursor
+        cards: bool = False,
+    ) -> tuple[list, str | None]:
+        """Search published products with cursor pagination, ranked by relevance when searching"""
+        try:
+            return await self.products_repo.search_published_products_cursor(
+                limit=limit,
+                search=search.strip() if search else None,
+                sort=sort,
+                cursor=cursor,
+                make_id=make_id,
+                condition=condition,
+                originality=originality,
+                price_min=price_min,
+                price_max=price_max,
+                cards=cards,
+            )
+        except InvalidCursor:
+            raise HTTPException(400, detail='Invalid cursor')
 
     async def get_feed_products_cursor(
         self,
         *,
         limit: int = 20,
         cursor: str | None = None,
-    ) -> tuple[list[Product], str | None]:
-        """Get products for feed using cursor pagination (same pattern as admin users)"""
-        cursor_created_at = None
-        cursor_id = None
-        if cursor:
-            try:
-                ts_str, id_str = cursor.split("_", 1)
-                cursor_created_at = datetime.fromisoformat(ts_str)
-                cursor_id = UUID(id_str)
-            except Exception:
-                raise HTTPException(400, detail='Invalid cursor')
-
-        products = await self.products_repo.get_feed_products_cursor(
+        cards: bool = False,
+    ) -> tuple[list, str | None]:
+        """Get products for feed using cursor pagination"""
+        try:
+            return await self.products_repo.get_feed_products_cursor(limit=limit, cursor=cursor, cards=cards)
+        except InvalidCursor:
+            raise HTTPException(400, detail='Invalid cursor')
+
+    async def list_by_part_number(
+        self,
+        part_number: str,
+        *,
+        limit: int = 50,
+        include_equivalents: bool = True,
+    ) -> list[Product]:
+        """Published listings for a part number typed in any format, optionally with interchangeable ones"""
+        key = normalize_part_number(part_number)
+        if not key:
+            raise HTTPException(400, detail='Part number must contain letters or digits')
+        return await self.products_repo.list_by_part_number(
+            key,
             limit=limit,
-            cursor_created_at=cursor_created_at,
-            cursor_id=cursor_id,
+            include_equivalents=include_equivalents,
         )
 
-        next_cursor = None
-        if len(products) == limit:
-            last = products[-1]
-            if last.created_at is None:
-                next_cursor = None
-            else:
-                next_cursor = f"{last.created_at.isoformat()}_{last.id}"
-
-        return products, next_cursor
-
     async def get_published_product(self, product_id: UUID | str) -> Product | None:
         """Get published product by ID for public viewing"""
         product = await self.products_repo.get_by_id(product_id)
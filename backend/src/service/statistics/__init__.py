@@ -1,7 +1,7 @@
 from fastapi import Depends
 
 from database.relational_db import (
-    get_uow,
+    get_replica_uow,
     UoW,
     UserInterface,
 )
@@ -9,7 +9,7 @@ from .statistics_service import StatService
 
 
 async def get_stats_service(
-    uow: UoW = Depends(get_uow),
+    uow: UoW = Depends(get_replica_uow),
 ) -> StatService:
     user_repo = UserInterface(uow.session)
     
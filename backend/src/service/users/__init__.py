@@ -3,15 +3,27 @@ from fastapi import Depends
 from database.relational_db import (
     UserInterface,
     get_uow,
+    get_read_uow,
     UoW,
     LanguagesInterface,
 )
+from core.storage import get_media_storage
+from service.auth import PrincipalCache, get_principal_cache
 from .user_service import UserService
 
 
 async def get_user_service(
     uow: UoW = Depends(get_uow),
+    principals: PrincipalCache = Depends(get_principal_cache),
 ) -> UserService:
     user_repo = UserInterface(uow.session)
     lang_repo = LanguagesInterface(uow.session)
-    return UserService(uow, user_repo, lang_repo)
+    return UserService(uow, user_repo, lang_repo, principals, get_media_storage())
+
+
+
+async def get_user_read_service(
+    uow: UoW = Depends(get_read_uow),
+    principals: PrincipalCache = Depends(get_principal_cache),
+) -> UserService:
+    return await get_user_service(uow, principals)
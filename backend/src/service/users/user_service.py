@@ -1,19 +1,26 @@
-import aiofiles
-import shutil
-from datetime import date, datetime
+from datetime import date
 
-from uuid import UUID, uuid4
-from pathlib import Path
-from fastapi import UploadFile, status, HTTPException
+from uuid import UUID
+from fastapi import Request, status, HTTPException
 
 from core.config import Settings
+from core.storage import (
+    MediaStorage,
+    StorageError,
+    StagedBlob,
+    receive_files,
+)
 from domain.users import UserPatch
+from domain.auth import Principal
 from database.relational_db import (
     UoW,
     UserInterface, 
     User,
     LanguagesInterface,
+    UserProfile,
+    InvalidCursor,
 )
+from service.auth import PrincipalCache
 
 settings = Settings() # type: ignore
 
@@ -23,13 +30,35 @@ class UserService:
         uow: UoW,
         user_repo: UserInterface,
         lang_repo: LanguagesInterface,
+        principals: PrincipalCache,
+        storage: MediaStorage,
     ):
         self.uow = uow
         self.user_repo = user_repo
         self.lang_repo = lang_repo
+        self.principals = principals
+        self.storage = storage
+        
+    async def get_user(self, user_id: UUID | str, profile: UserProfile = 'auth') -> User | None:
+        return await self.user_repo.get_by_id(user_id, profile)
+    
+    async def get_principal(self, user_id: UUID | str) -> Principal | None:
+        principal = await self.principals.get(user_id)
+        if principal is not None:
+            return principal
         
-    async def get_user(self, user_id: UUID | str) -> User | None:
-        return await self.user_repo.get_by_id(user_id)
+        row = await self.user_repo.get_principal(user_id)
+        if row is None:
+            return
+        
+        principal = Principal(
+            id=row['id'],
+            is_admin=row['is_admin'],
+            banned=row['banned'],
+            org_ids=row['org_ids'] or [],
+        )
+        await self.principals.set(principal)
+        return principal
         
     async def patch_user(self, payload: UserPatch, user: User):
         data = payload.model_dump(exclude_none=True)
@@ -38,53 +67,30 @@ class UserService:
             setattr(user, field, value)
             
         await self.uow.commit()
+        await self.principals.invalidate(user.id)
             
         await self.uow.session.refresh(user)
 
-    async def add_picture(
-        self,
-        file: UploadFile,
-        user: User
-    ) -> None:
-        folder = Path(settings.MEDIA_DIR, "users", str(user.id))
-        if folder.exists():
-            shutil.rmtree(folder)
-        folder.mkdir(parents=True, exist_ok=True)
-
-        if file.content_type not in ("image/jpeg", "image/png"):
-            raise HTTPException(
-                status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                detail="Only jpg / png allowed"
-            )
-
-        ext  = ".jpg" if file.content_type == "image/jpeg" else ".png"
-        name = f"{uuid4().hex}{ext}"
-
-        file_path = folder / name
-        limit_bytes = settings.MAX_PHOTO_SIZE * 1024 * 1024
-        written = 0
-        async with aiofiles.open(file_path, "wb") as out:
-            while chunk := await file.read(1024 * 1024):
-                if written + len(chunk) > limit_bytes:
-                    try:
-                        await out.flush()
-                        await out.close()
-                    except Exception:
-                        pass
-                    try:
-                        file_path.unlink(missing_ok=True)
-                    except Exception:
-                        pass
-                    raise HTTPException(
-                        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        detail=f"File too large. Max {settings.MAX_PHOTO_SIZE} MB"
-                    )
-                await out.write(chunk)
-                written += len(chunk)
-
-        url = f"{settings.SITE_URL}/{settings.MEDIA_DIR}/users/{user.id}/{name}"
-
-        user.profile_pic_url = url
+    async def receive_picture(self, request: Request, user: User) -> None:
+        """Set the picture from a multipart body (`file` field), parsed as it streams in"""
+        received = await receive_files(request, "file", settings.MAX_PHOTO_SIZE * 1024 * 1024, max_files=1)
+        if not received:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="No file uploaded")
+        outcome = received[0].outcome
+        if isinstance(outcome, HTTPException):
+            raise outcome
+        await self._set_picture(outcome, user)
+
+    async def _set_picture(self, blob: StagedBlob, user: User) -> None:
+        try:
+            key = await self.storage.store(blob.path, blob.content_type, blob.digest)
+        except StorageError:
+            raise HTTPException(status.HTTP_502_BAD_GATEWAY, detail="Media storage unavailable")
+        finally:
+            blob.path.unlink(missing_ok=True)
+
+        # The previous picture may be the same blob as someone else's, so it is kept
+        user.profile_pic_url = self.storage.url(key)
 
     async def admin_list_users(
         self,
@@ -94,37 +100,20 @@ class UserService:
         limit: int = 50,
         cursor: str | None = None,
     ) -> tuple[list[User], str | None]:
-        cursor_created_at = None
-        cursor_id = None
-        if cursor:
-            try:
-                ts_str, id_str = cursor.split("_", 1)
-                cursor_created_at = datetime.fromisoformat(ts_str)
-                cursor_id = UUID(id_str)
-            except Exception:
-                raise HTTPException(400, detail='Invalid cursor')
-
-        users = await self.user_repo.admin_list_users(
-            banned=banned,
-            search=search,
-            limit=limit,
-            cursor_created_at=cursor_created_at,
-            cursor_id=cursor_id,
-        )
-
-        next_cursor = None
-        if len(users) == limit:
-            last = users[-1]
-            if last.created_at is None:
-                next_cursor = None
-            else:
-                next_cursor = f"{last.created_at.isoformat()}_{last.id}"
-
-        return users, next_cursor
+        try:
+            return await self.user_repo.admin_list_users(
+                banned=banned,
+                search=search,
+                limit=limit,
+                cursor=cursor,
+            )
+        except InvalidCursor:
+            raise HTTPException(400, detail='Invalid cursor')
 
     async def admin_set_ban(self, target: User, banned: bool) -> User:
         target.banned = banned
         await self.uow.commit()
+        await self.principals.invalidate(target.id)
         await self.uow.session.refresh(target)
         return target
 
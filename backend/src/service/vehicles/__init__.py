@@ -1,19 +1,12 @@
-from fastapi import Depends
-
-from database.relational_db import (
-    get_uow,
-    UoW,
-    MakesInterface,
-    ModelsInterface,
-    YearsInterface,
-)
 from .vehicles_service import VehicleService
+from .reference import (
+    VehicleReference,
+    get_reference,
+    load_reference,
+    bump_reference_version,
+    run_reference_listener,
+)
 
 
-async def get_vehicle_service(
-    uow: UoW = Depends(get_uow),
-) -> VehicleService:
-    make_repo = MakesInterface(uow.session)
-    model_repo = ModelsInterface(uow.session)
-    year_repo = YearsInterface(uow.session)
-    return VehicleService(uow, make_repo, model_repo, year_repo)
+async def get_vehicle_service() -> VehicleService:
+    return VehicleService(get_reference())
@@ -0,0 +1,247 @@
+import time
+import asyncio
+import hashlib
+import logging
+
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+from redis.asyncio import Redis
+
+from database.relational_db import read_uow, MakesInterface, ModelsInterface, YearsInterface
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "vehicles:reference-version"
+CHANNEL = "vehicles-reference"
+
+
+@dataclass(frozen=True, slots=True)
+class MakeRef:
+    make_id: int
+    make_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class ModelRef:
+    model_id: int
+    make_id: int
+    model_name: str
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TextIndex:
+    """
+    Case-insensitive substring search over a fixed list of names.
+
+    Entries are stored in the order the old `ILIKE` queries returned them
+    (shortest name, then name, then id), so any ascending run of positions is
+    already ranked and a search can stop at `limit` hits. Queries of three or
+    more characters only scan the shortest trigram posting list; shorter ones
+    scan everything, which ends quickly because short needles match early.
+    """
+    def __init__(self, ids: Sequence[int], names: Sequence[str]):
+        order = sorted(range(len(ids)), key=lambda i: (len(names[i]), names[i], ids[i]))
+        self.ids = array('q', (ids[i] for i in order))
+        self.names = tuple(names[i] for i in order)
+        self._folded = tuple(name.lower() for name in self.names)
+
+        alphabetical = sorted(range(len(order)), key=lambda pos: (self.names[pos], self.ids[pos]))
+        self.alphabetical = array('I', alphabetical)
+        self._alpha_rank = array('I', [0]) * len(order)
+        for rank, pos in enumerate(alphabetical):
+            self._alpha_rank[pos] = rank
+
+        postings: dict[str, list[int]] = {}
+        for pos, name in enumerate(self._folded):
+            for gram in _trigrams(name):
+                postings.setdefault(gram, []).append(pos)
+        self._postings = {gram: array('I', positions) for gram, positions in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query: str, limit: int, within: Sequence[int] | None = None) -> list[int]:
+        """Positions of entries containing `query`, best first. `within` must be ascending"""
+        needle = query.lower()
+        candidates: Iterable[int]
+        if len(needle) >= 3:
+            posting = min((self._postings.get(gram, ()) for gram in _trigrams(needle)), key=len)
+            candidates = posting if within is None or len(posting) < len(within) else within
+        else:
+            candidates = range(len(self.ids)) if within is None else within
+
+        allowed = set(within) if within is not None and candidates is not within else None
+        hits = []
+        for pos in candidates:
+            if needle in self._folded[pos] and (allowed is None or pos in allowed):
+                hits.append(pos)
+                if len(hits) == limit:
+                    break
+        return hits
+
+    def first(self, limit: int, within: Sequence[int] | None = None) -> list[int]:
+        """Positions in alphabetical order"""
+        if within is None:
+            return list(self.alphabetical[:limit])
+        return sorted(within, key=self._alpha_rank.__getitem__)[:limit]
+
+
+class VehicleReference:
+    """Immutable snapshot of the vPIC makes, models and model years"""
+    def __init__(
+        self,
+        version: int,
+        makes: Sequence[tuple[int, str]],
+        models: Sequence[tuple[int, int, str]],
+        years: dict[int, tuple[int, ...]],
+    ):
+        self.version = version
+        self.makes = TextIndex([m[0] for m in makes], [m[1] for m in makes])
+        self._make_pos = {make_id: pos for pos, make_id in enumerate(self.makes.ids)}
+
+        self.models = TextIndex([m[0] for m in models], [m[2] for m in models])
+        make_of = {model_id: make_id for model_id, make_id, _ in models}
+        self._model_make = array('q', (make_of[model_id] for model_id in self.models.ids))
+        by_make: dict[int, list[int]] = {}
+        for pos, make_id in enumerate(self._model_make):
+            by_make.setdefault(make_id, []).append(pos)
+        self._models_by_make = {make_id: array('I', positions) for make_id, positions in by_make.items()}
+
+        self._years = years
+
+    @classmethod
+    def empty(cls) -> 'VehicleReference':
+        return cls(0, [], [], {})
+
+    def _make(self, pos: int) -> MakeRef:
+        return MakeRef(self.makes.ids[pos], self.makes.names[pos])
+
+    def _model(self, pos: int) -> ModelRef:
+        return ModelRef(self.models.ids[pos], self._model_make[pos], self.models.names[pos])
+
+    def get_make(self, make_id: int) -> MakeRef | None:
+        pos = self._make_pos.get(make_id)
+        return None if pos is None else self._make(pos)
+
+    def search_makes(self, limit: int, search: str | None) -> list[MakeRef]:
+        positions = self.makes.search(search, limit) if search else self.makes.first(limit)
+        return [self._make(pos) for pos in positions]
+
+    def search_models(self, limit: int, make_id: int | None, search: str | None) -> list[ModelRef]:
+        within = None
+        if make_id:
+            within = self._models_by_make.get(make_id)
+            if within is None:
+                return []
+        positions = self.models.search(search, limit, within) if search else self.models.first(limit, within)
+        return [self._model(pos) for pos in positions]
+
+    def list_years(self, model_id: int) -> list[int]:
+        return list(self._years.get(model_id, ()))
+
+
+_current = VehicleReference.empty()
+
+
+def get_reference() -> VehicleReference:
+    """Snapshot currently served by this worker"""
+    return _current
+
+
+def _content_version(
+    makes: Sequence[tuple[int, str]],
+    models: Sequence[tuple[int, int, str]],
+    years: dict[int, tuple[int, ...]],
+) -> int:
+    """
+    Version derived from the data itself, so a number always stands for the
+    same snapshot no matter what happens to Redis. 48 bits keep it exact as a
+    JSON number in browsers.
+    """
+    digest = hashlib.blake2b(digest_size=6)
+    for section in (sorted(makes), sorted(models), sorted(years.items())):
+        for row in section:
+            digest.update(repr(row).encode())
+            digest.update(b'\n')
+        digest.update(b'\x00')
+    return int.from_bytes(digest.digest(), 'big')
+
+
+async def _read_tables() -> tuple[list[tuple[int, str]], list[tuple[int, int, str]], dict[int, tuple[int, ...]]]:
+    # From the primary: a replica may not have the reseed we were told about yet
+    async with read_uow(replica=False) as uow:
+        makes = await MakesInterface(uow.session).all_names()
+        models = await ModelsInterface(uow.session).all_names()
+        years = await YearsInterface(uow.session).all_years()
+    return makes, models, years
+
+
+def _build(
+    makes: Sequence[tuple[int, str]],
+    models: Sequence[tuple[int, int, str]],
+    years: dict[int, tuple[int, ...]],
+) -> VehicleReference:
+    return VehicleReference(_content_version(makes, models, years), makes, models, years)
+
+
+async def _announced_version(redis: Redis) -> int | None:
+    version = await redis.get(VERSION_KEY)
+    return None if version is None else int(version)
+
+
+async def load_reference() -> VehicleReference:
+    """Read the vPIC tables into a new snapshot and swap it in"""
+    global _current
+
+    started = time.perf_counter()
+    makes, models, years = await _read_tables()
+
+    # Hashing and building the indexes is CPU-bound; keep the event loop serving meanwhile
+    _current = await asyncio.to_thread(_build, makes, models, years)
+    logger.info(
+        f'Vehicle reference v{_current.version} loaded: {len(makes)} makes, {len(models)} models '
+        f'in {time.perf_counter() - started:.2f}s'
+    )
+    return _current
+
+
+async def bump_reference_version(redis: Redis) -> int:
+    """
+    Called after reseeding: announces the new content version so every worker
+    reloads its snapshot. The Redis key is only a hint, losing it just makes
+    workers reload and arrive at the same version.
+    """
+    makes, models, years = await _read_tables()
+    version = await asyncio.to_thread(_content_version, makes, models, years)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.set(VERSION_KEY, version)
+        pipe.publish(CHANNEL, "reload")
+        await pipe.execute()
+    return version
+
+
+async def run_reference_listener(redis: Redis) -> None:
+    """Reload the snapshot whenever the announced version differs from ours (or is gone)."""
+    while True:
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(CHANNEL)
+            # A reseed may have happened while we were disconnected
+            if await _announced_version(redis) != _current.version:
+                await load_reference()
+
+            async for _ in pubsub.listen():
+                if await _announced_version(redis) != _current.version:
+                    await load_reference()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Disconnects, timeouts or a bad message: resubscribe rather than stop listening for good
+            logger.warning(f'Vehicle reference listener failed: {e!s}')
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
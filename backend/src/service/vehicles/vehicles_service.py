@@ -1,54 +1,77 @@
-from uuid import UUID
-
-from fastapi import HTTPException
+from typing import Any, Awaitable, Callable
+from fastapi import Request, Response
 
 from core.config import Settings
-from database.relational_db import (
-    UoW,
-    MakesInterface,
-    Make,
-    ModelsInterface,
-    Model,
-    YearsInterface,
-    ModelYear,
-)
-
-settings = Settings() # type: ignore
+from core.http_cache import strong_etag, etag_matches, cached_response
+from .reference import VehicleReference, MakeRef, ModelRef
+
+config = Settings() # pyright: ignore[reportCallIssue]
+
+VERSION_HEADER = 'X-Reference-Version'
+
 
 class VehicleService:
+    """vPIC lookups, answered from the in-memory reference snapshot"""
     def __init__(
         self,
-        uow: UoW,
-        make_repo: MakesInterface,
-        model_repo: ModelsInterface,
-        year_repo: YearsInterface,
+        reference: VehicleReference,
     ):
-        self.uow = uow
-        self.make_repo = make_repo
-        self.model_repo = model_repo
-        self.year_repo = year_repo
+        self.reference = reference
+    
+    @property
+    def version(self) -> int:
+        return self.reference.version
         
-    async def get_make(self, make_id: int) -> Make | None:
-        return await self.make_repo.get_by_id(make_id)
+    async def get_make(self, make_id: int) -> MakeRef | None:
+        return self.reference.get_make(make_id)
     
     async def search_makes(
         self,
         limit: int,
         search: str | None,
-    ) -> list[Make]:
-        return await self.make_repo.list(limit, search)
+    ) -> list[MakeRef]:
+        return self.reference.search_makes(limit, search)
 
     async def search_models(
         self,
         limit: int,
         make_id: int | None,
         search: str | None,
-    ) -> list[Model]:
-        return await self.model_repo.list(limit, make_id, search)
+    ) -> list[ModelRef]:
+        return self.reference.search_models(limit, make_id, search)
 
 
     async def list_years(
         self,
         model_id: int,
     ) -> list[int]:
-        return await self.year_repo.list(model_id)
+        return self.reference.list_years(model_id)
+    
+    async def respond(
+        self,
+        request: Request,
+        scope: str,
+        params: dict[str, Any],
+        pinned: int | None,
+        compute: Callable[[], Awaitable[bytes]],
+    ) -> Response:
+        """
+        Cacheable response for a reference lookup.
+        
+        The body only depends on the snapshot version and the params, so the
+        ETag is derived from them and a matching `If-None-Match` gets a 304
+        without computing anything. A URL pinned to the current version
+        (`?v=`) never changes and is cached for a year; plain URLs, and
+        URLs pinned to an old version, get `VEHICLE_CACHE_MAX_AGE`.
+        """
+        version = self.reference.version
+        key = '&'.join(f'{name}={value}' for name, value in sorted(params.items()))
+        etag = strong_etag(f'{scope}:{version}:{key}')
+        
+        if pinned == version:
+            cache_control = f'public, max-age={config.VEHICLE_CACHE_PINNED_MAX_AGE}, immutable'
+        else:
+            cache_control = f'public, max-age={config.VEHICLE_CACHE_MAX_AGE}'
+        
+        body = b'' if etag_matches(request, etag) else await compute()
+        return cached_response(request, body, etag, cache_control, headers={VERSION_HEADER: str(version)})